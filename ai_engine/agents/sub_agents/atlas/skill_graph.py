@@ -13,7 +13,8 @@ Hard rules:
   - All scoring is bounded to [0.0, 1.0]. NaNs ⇒ 0.0.
   - Identical strings (after normalization) always score 1.0.
   - Caches the (a,b) similarity via ``functools.lru_cache(4096)`` so
-    repeated probes during fusion are free.
+    repeated probes during fusion are free, and each skill's vector so
+    a skill is encoded once across all its pairs.
 """
 from __future__ import annotations
 
@@ -21,6 +22,7 @@ import logging
 import math
 import re
 import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from functools import lru_cache
 from typing import Any, Dict, Iterable, List, Optional, Tuple
@@ -30,9 +32,13 @@ logger = logging.getLogger(__name__)
 # ─── Public types ──────────────────────────────────────────────────
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SkillMatch:
-    """One candidate↔target pairing with the score that justified it."""
+    """One candidate↔target pairing with the score that justified it.
+
+    Immutable and slotted: matches are built per target on every fusion
+    pass and are never edited after scoring.
+    """
 
     candidate_skill: str
     target_skill: str
@@ -62,8 +68,8 @@ def _normalize(skill: str) -> str:
 
 # ─── Static transferability fallback (~50 curated pairs) ───────────
 #
-# Ordered (a, b) → score where a / b are normalized. We probe both
-# directions so callers don't need to remember canonical ordering.
+# Ordered (a, b) → score where a / b are normalized. _STATIC_INDEX holds
+# both directions so callers don't need to remember canonical ordering.
 # Scores are deliberately conservative; tune up as we see real signal.
 
 _STATIC_PAIRS: Dict[Tuple[str, str], float] = {
@@ -137,11 +143,17 @@ _STATIC_PAIRS: Dict[Tuple[str, str], float] = {
 }
 
 
+# Both orientations of every curated pair, so a probe is one dict lookup.
+_STATIC_INDEX: Dict[Tuple[str, str], float] = {
+    **{(b, a): score for (a, b), score in _STATIC_PAIRS.items()},
+    **_STATIC_PAIRS,
+}
+
+
 def _static_score(a: str, b: str) -> Optional[float]:
     if a == b:
         return 1.0
-    pair = _STATIC_PAIRS.get((a, b)) or _STATIC_PAIRS.get((b, a))
-    return pair
+    return _STATIC_INDEX.get((a, b))
 
 
 def _substring_score(a: str, b: str) -> float:
@@ -181,18 +193,50 @@ def _get_model() -> Optional[Any]:
         return _model_state["model"]
 
 
+# Normalized skill → embedding row (LRU). Each skill is encoded once however
+# many pairs it takes part in; compute_skill_match fills this in one batch.
+_VECTOR_CACHE_MAX = 4096
+_vector_lock = threading.Lock()
+_vectors: "OrderedDict[str, Any]" = OrderedDict()
+
+
+def _encode_many(model: Any, texts: Iterable[str]) -> Dict[str, Any]:
+    """Vectors for *texts*, encoding only the uncached ones in a single call."""
+    wanted = list(dict.fromkeys(texts))
+    out: Dict[str, Any] = {}
+    with _vector_lock:
+        for t in wanted:
+            v = _vectors.get(t)
+            if v is not None:
+                _vectors.move_to_end(t)  # LRU: skills probed again stay resident
+                out[t] = v
+    missing = [t for t in wanted if t not in out]
+    if missing:
+        vecs = model.encode(missing, show_progress_bar=False, normalize_embeddings=True)
+        with _vector_lock:
+            for t, v in zip(missing, vecs):
+                out[t] = _vectors[t] = v
+            while len(_vectors) > _VECTOR_CACHE_MAX:
+                _vectors.popitem(last=False)
+    return out
+
+
 def _embed_pair(model: Any, a: str, b: str) -> Optional[float]:
     """Return cosine similarity in [0,1] or ``None`` if encoding fails."""
     try:
-        # encode returns a 2-D array of shape (2, dim) here.
-        vecs = model.encode([a, b], show_progress_bar=False, normalize_embeddings=True)
-        # Accept numpy arrays, list-of-list, or any 2-row 2-D iterable.
+        vecs = _encode_many(model, (a, b))
+        # Rows may be numpy arrays, lists, or any 1-D iterable.
         try:
-            v0, v1 = vecs[0], vecs[1]
+            v0, v1 = vecs[a], vecs[b]
         except (IndexError, KeyError, TypeError):
             return None
-        # With normalize_embeddings=True, dot product == cosine.
-        dot = float(sum(float(x) * float(y) for x, y in zip(v0, v1)))
+        # With normalize_embeddings=True, dot product == cosine — no norms
+        # or sqrt needed. numpy rows take one vectorized dot; plain lists
+        # fall back to the Python sum.
+        try:
+            dot = float(v0 @ v1)
+        except TypeError:
+            dot = float(sum(float(x) * float(y) for x, y in zip(v0, v1)))
     except Exception as exc:  # noqa: BLE001
         logger.info("atlas.skill_graph embedding encode failed: %s", exc)
         return None
@@ -238,6 +282,30 @@ def skill_similarity(a: str, b: str) -> Tuple[float, str]:
 # ─── Public top-level API ──────────────────────────────────────────
 
 
+def _prime_embeddings(cand: List[str], tgt: List[str]) -> None:
+    """Encode every skill the pairwise loop will need in one model call.
+
+    Only pairs that exact/static matching can't settle reach the model, so
+    the model isn't loaded at all when every pair resolves statically.
+    """
+    norm_c = [_normalize(c) for c in cand]
+    norm_t = [_normalize(t) for t in tgt]
+    needed: Dict[str, None] = {}
+    for a in norm_c:
+        for b in norm_t:
+            if a and b and a != b and _static_score(a, b) is None:
+                needed[a] = needed[b] = None
+    if not needed:
+        return
+    model = _get_model()
+    if model is None:
+        return
+    try:
+        _encode_many(model, needed)
+    except Exception as exc:  # noqa: BLE001
+        logger.info("atlas.skill_graph batch encode failed: %s", exc)
+
+
 def compute_skill_match(
     candidate_skills: Iterable[str],
     target_skills: Iterable[str],
@@ -255,28 +323,34 @@ def compute_skill_match(
     if not cand or not tgt:
         return []
 
+    _prime_embeddings(cand, tgt)
+
     matches: List[SkillMatch] = []
     for t in tgt:
-        best: Optional[SkillMatch] = None
+        # Track the winner as a plain tuple; build one SkillMatch per target.
+        best: Optional[Tuple[float, str, str]] = None
         for c in cand:
             score, source = skill_similarity(c, t)
             if score < threshold:
                 continue
-            if best is None or score > best.score:
-                best = SkillMatch(
-                    candidate_skill=c,
-                    target_skill=t,
-                    score=score,
-                    source=source,
-                )
+            if best is None or score > best[0]:
+                best = (score, c, source)
         if best is not None:
-            matches.append(best)
+            score, c, source = best
+            matches.append(SkillMatch(
+                candidate_skill=c,
+                target_skill=t,
+                score=score,
+                source=source,
+            ))
     return matches
 
 
 def reset_model_cache() -> None:
-    """Test-only: clear the lazy singleton + lru_cache."""
+    """Test-only: clear the lazy singleton, vector cache + lru_cache."""
     with _model_lock:
         _model_state["loaded"] = False
         _model_state["model"] = None
+    with _vector_lock:
+        _vectors.clear()
     _similarity_cached.cache_clear()
@@ -4,9 +4,11 @@ The runtime currently uses Gemini as the sole provider. Retry behavior is still
 provider-agnostic so transient transport and quota-related failures are handled
 consistently in one place.
 """
+import importlib.util
 import json
 import logging
 import os
+import threading
 import time
 from contextvars import ContextVar, Token
 from typing import Optional, Dict, Any, List, Callable, Awaitable, Union
@@ -209,6 +211,72 @@ def _retry_event_before_sleep(retry_state) -> None:
         logger.debug("retry_emit_failed: %s", str(emit_err)[:200])
 
 
+# ═══════════════════════════════════════════════════════════════════════
+#  Shared google.genai client (connection reuse)
+# ═══════════════════════════════════════════════════════════════════════
+# Every AIClient() owns a _GeminiProvider, and the pipeline builds a fresh
+# AIClient per request.  Giving each provider its own genai.Client meant a
+# new httpx pool — and a fresh TLS handshake — per request.  Providers now
+# share one process-wide client per credential set so keep-alive
+# connections (HTTP/2-multiplexed when the ``h2`` package is installed)
+# are reused across requests.  _get_client() runs on worker threads via
+# asyncio.to_thread, hence the threading lock.
+
+_GENAI_HTTP_LIMITS = {"max_keepalive_connections": 64, "max_connections": 128}
+_genai_clients: Dict[tuple, Any] = {}
+_genai_clients_lock = threading.Lock()
+
+
+def _genai_http_options(types_mod: Any) -> Any:
+    """Pooled httpx settings for genai.Client, or None on SDKs without client_args."""
+    http_options_cls = getattr(types_mod, "HttpOptions", None)
+    if http_options_cls is None or "client_args" not in getattr(http_options_cls, "model_fields", {}):
+        return None
+    try:
+        import httpx
+    except ImportError:
+        return None
+    client_args: Dict[str, Any] = {"limits": httpx.Limits(**_GENAI_HTTP_LIMITS)}
+    if importlib.util.find_spec("h2") is not None:
+        client_args["http2"] = True
+    return http_options_cls(client_args=client_args)
+
+
+def _shared_genai_client(**client_kwargs: Any) -> Any:
+    """Return the process-wide genai.Client for these credentials, creating it once."""
+    key = tuple(sorted(client_kwargs.items()))
+    client = _genai_clients.get(key)
+    if client is not None:
+        return client
+    with _genai_clients_lock:
+        client = _genai_clients.get(key)
+        if client is None:
+            from google import genai
+            from google.genai import types
+
+            http_options = _genai_http_options(types)
+            if http_options is not None:
+                client_kwargs["http_options"] = http_options
+            client = genai.Client(**client_kwargs)
+            _genai_clients[key] = client
+    return client
+
+
+def close_shared_clients() -> None:
+    """Close pooled genai clients; called from the FastAPI lifespan shutdown."""
+    with _genai_clients_lock:
+        clients = list(_genai_clients.values())
+        _genai_clients.clear()
+    for client in clients:
+        close = getattr(client, "close", None)
+        if close is None:
+            continue
+        try:
+            close()
+        except Exception as exc:  # noqa: BLE001
+            logger.debug("genai_client_close_failed: %s", str(exc)[:200])
+
+
 # ═══════════════════════════════════════════════════════════════════════
 #  Gemini Provider (sole supported backend)
 # ═══════════════════════════════════════════════════════════════════════
@@ -228,7 +296,6 @@ class _GeminiProvider:
 
     def _get_client(self):
         if self._client is None:
-            from google import genai
             if settings.gemini_use_vertexai:
                 project = (settings.gemini_vertex_project or "").strip()
                 location = (settings.gemini_vertex_location or "").strip()
@@ -237,7 +304,7 @@ class _GeminiProvider:
                         "Gemini Vertex AI is enabled but missing configuration. "
                         "Set GEMINI_VERTEX_PROJECT and GEMINI_VERTEX_LOCATION in backend/.env."
                     )
-                self._client = genai.Client(
+                self._client = _shared_genai_client(
                     vertexai=True,
                     project=project,
                     location=location,
@@ -249,7 +316,7 @@ class _GeminiProvider:
                         "Gemini API key is not configured. "
                         "Set GEMINI_API_KEY in your backend/.env file."
                     )
-                self._client = genai.Client(api_key=api_key, vertexai=False)
+                self._client = _shared_genai_client(api_key=api_key, vertexai=False)
         return self._client
 
     async def _generate_content_throttled(
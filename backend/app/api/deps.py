@@ -58,17 +58,12 @@ async def get_current_user(
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
-        uid = decoded_token.get("sub")
-        email = decoded_token.get("email")
-        meta = decoded_token.get("user_metadata", {})
-        name = meta.get("full_name")
-        picture = meta.get("avatar_url")
-
+        meta = decoded_token.user_metadata
         user = await db.get_or_create_user(
-            uid=uid,
-            email=email,
-            full_name=name,
-            avatar_url=picture,
+            uid=decoded_token.sub,
+            email=decoded_token.email,
+            full_name=meta.get("full_name"),
+            avatar_url=meta.get("avatar_url"),
         )
 
         if not user.get("is_active", True):
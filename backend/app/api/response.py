@@ -1,9 +1,12 @@
 """Standardized API response format for all endpoints."""
-from typing import Any, Optional
+import functools
+import json
+from typing import Any, List, Optional
 
-from fastapi import HTTPException
-from fastapi.responses import JSONResponse
+from fastapi import HTTPException, Response
+from fastapi.responses import JSONResponse, ORJSONResponse
 
+from app.core.pagination import encode_cursor
 from app.core.tracing import request_id_var
 
 
@@ -77,3 +80,46 @@ def error_http_exception(
     return HTTPException(status_code=status_code, detail=body, headers=headers)
 
 
+@functools.lru_cache(maxsize=64)
+def _detail_body(detail: str) -> bytes:
+    return json.dumps({"detail": detail}, separators=(",", ":")).encode()
+
+
+def detail_response(detail: str, *, status_code: int = 404) -> Response:
+    """Return FastAPI's default ``{"detail": ...}`` error body without raising.
+
+    Same wire shape as ``raise HTTPException(status_code, detail)`` but skips
+    the exception unwind and handler dispatch, which matters for hot
+    get-by-id handlers where misses are routine. The body bytes are
+    encoded once per distinct message.
+    """
+    return Response(content=_detail_body(detail), status_code=status_code, media_type="application/json")
+
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def set_next_cursor(response: Response, rows: List[dict], limit: int, field: str = "created_at") -> None:
+    """Advertise the keyset cursor for the next page of a newest-first list.
+
+    List bodies stay plain JSON arrays (web and mobile clients decode them
+    as such), so the cursor travels in a header. A short page means there
+    is nothing further to fetch and the header is omitted.
+    """
+    if len(rows) >= limit and rows:
+        cursor = encode_cursor(rows[-1], field)
+        if cursor:
+            response.headers[NEXT_CURSOR_HEADER] = cursor
+
+
+def list_response(rows: List[dict], limit: int, field: str = "created_at") -> Response:
+    """Encode a page of database rows directly, with the next-page cursor header.
+
+    A returned dict/list goes through FastAPI's ``jsonable_encoder``, which
+    walks every row and field in Python before orjson sees it. PostgREST
+    rows are already JSON-native, so the whole page is handed to orjson in
+    one call instead.
+    """
+    response = ORJSONResponse(rows)
+    set_next_cursor(response, rows, limit, field)
+    return response
@@ -1,7 +1,7 @@
 """AIM \u2014 assignment CRUD."""
 from __future__ import annotations
 
-from typing import Any, Optional
+from typing import Any, Optional, Literal
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel, Field
@@ -16,10 +16,8 @@ router = APIRouter()
 class AssignmentCreate(BaseModel):
     title: str = Field(..., min_length=1, max_length=500)
     course: Optional[str] = Field(None, max_length=255)
-    academic_level: Optional[str] = Field(None, pattern="^(ug|pg|mba|phd|other)$")
-    referencing_style: Optional[str] = Field(
-        None, pattern="^(harvard|apa|mla|chicago|ieee|other)$"
-    )
+    academic_level: Optional[Literal["ug", "pg", "mba", "phd", "other"]] = None
+    referencing_style: Optional[Literal["harvard", "apa", "mla", "chicago", "ieee", "other"]] = None
     deadline: Optional[str] = None  # ISO 8601
     word_count: Optional[int] = Field(None, ge=0, le=100_000)
 
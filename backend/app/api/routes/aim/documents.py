@@ -7,6 +7,7 @@ from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, s
 from pydantic import BaseModel, Field
 
 from app.api.deps import get_current_user
+from app.api.uploads import read_upload_bounded
 from app.services.aim.assignment_service import AIMAssignmentService
 from app.services.aim.document_parser import AIMDocumentParser
 
@@ -49,10 +50,8 @@ async def upload_document(
     svc = AIMAssignmentService()
     if not await svc.get(current_user["id"], assignment_id):
         raise HTTPException(status.HTTP_404_NOT_FOUND, detail="assignment not found")
-    raw = await file.read()
-    if len(raw) > MAX_DOC_BYTES:
-        raise HTTPException(status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                            detail=f"file exceeds {MAX_DOC_BYTES} bytes")
+    raw, _ = await read_upload_bounded(file, MAX_DOC_BYTES,
+                                       detail=f"file exceeds {MAX_DOC_BYTES} bytes")
     parser = AIMDocumentParser()
     ext = parser.ext_from_filename(file.filename)
     try:
@@ -105,13 +105,13 @@ async def get_daily_briefing(
         apps = await db.query(TABLES["applications"], filters=[("user_id", "==", current_user["id"])])
         avg_match = round(sum((a.get("scores") or {}).get("match", 0) for a in apps) / max(len(apps), 1))
 
-        evidence = await db.query(TABLES["evidence"], filters=[("user_id", "==", current_user["id"])])
+        evidence_count = await db.count(TABLES["evidence"], filters=[("user_id", "==", current_user["id"])])
 
         app_stats = {
             "app_count": len(apps),
             "avg_match": avg_match,
             "open_tasks": 0,
-            "evidence_count": len(evidence),
+            "evidence_count": evidence_count,
             "recent_activity": f"Last application: {apps[0].get('title', 'N/A')}" if apps else "No applications yet",
         }
 
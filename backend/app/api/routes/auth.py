@@ -43,12 +43,11 @@ async def verify_token_endpoint(
             detail="Invalid or expired token",
         )
 
-    meta = decoded_token.get("user_metadata", {})
     return {
         "valid": True,
-        "uid": decoded_token.get("sub"),
-        "email": decoded_token.get("email"),
-        "name": meta.get("full_name"),
+        "uid": decoded_token.sub,
+        "email": decoded_token.email,
+        "name": decoded_token.user_metadata.get("full_name"),
     }
 
 
@@ -1,7 +1,7 @@
 """
 Document Builder routes (Firestore)
 """
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Literal
 
 from app.core.security import limiter
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
@@ -17,7 +17,7 @@ router = APIRouter()
 
 
 class GenerateDocumentRequest(BaseModel):
-    document_type: str = Field("cv", pattern="^(cv|cover_letter|personal_statement|portfolio|roadmap)$")
+    document_type: Literal["cv", "cover_letter", "personal_statement", "portfolio", "roadmap"] = "cv"
     profile_id: Optional[str] = None
     job_id: Optional[str] = None
     benchmark_id: Optional[str] = None
@@ -2,7 +2,7 @@
 Career Analytics routes - Timeline, trends, portfolio, outcomes, telemetry, self-tuning,
 predictions, health monitoring, and evidence-graph exposure (Supabase)
 """
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Literal
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from pydantic import BaseModel, Field
@@ -63,7 +63,7 @@ async def get_portfolio_summary(
 
 class OutcomeSignalRequest(BaseModel):
     application_id: str = Field(..., min_length=1, max_length=100)
-    signal_type: str = Field(..., pattern=r"^(exported|applied|screened|interview|interview_done|offer|accepted|rejected)$")
+    signal_type: Literal["exported", "applied", "screened", "interview", "interview_done", "offer", "accepted", "rejected"]
     signal_data: Optional[Dict[str, Any]] = None
 
 
@@ -1,7 +1,7 @@
 """Document Library API — endpoints for managing Benchmark, Fixed, and Tailored documents."""
 import asyncio
 import structlog
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Literal
 
 from fastapi import APIRouter, Depends, HTTPException, Request, Query
 from pydantic import BaseModel, Field
@@ -17,7 +17,7 @@ router = APIRouter()
 
 class GenerateDocumentRequest(BaseModel):
     doc_type: str = Field(..., min_length=1, max_length=100)
-    doc_category: str = Field("tailored", pattern=r"^(benchmark|fixed|tailored)$")
+    doc_category: Literal["benchmark", "fixed", "tailored"] = "tailored"
     label: Optional[str] = None
     application_id: Optional[str] = None
 
@@ -34,7 +34,7 @@ class UpdateDocumentRequest(BaseModel):
 async def get_document_library(
     request: Request,
     application_id: Optional[str] = Query(None),
-    category: Optional[str] = Query(None, pattern=r"^(benchmark|fixed|tailored)$"),
+    category: Optional[Literal["benchmark", "fixed", "tailored"]] = Query(None),
     current_user: Dict[str, Any] = Depends(get_current_user),
 ):
     """Get the user's document library, optionally filtered by application and category."""
@@ -84,7 +84,7 @@ async def get_library_summary(
 @limiter.limit("30/minute")
 async def get_all_documents(
     request: Request,
-    category: Optional[str] = Query(None, pattern=r"^(benchmark|fixed|tailored)$"),
+    category: Optional[Literal["benchmark", "fixed", "tailored"]] = Query(None),
     limit: int = Query(100, ge=1, le=500),
     current_user: Dict[str, Any] = Depends(get_current_user),
 ):
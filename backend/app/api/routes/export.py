@@ -8,9 +8,9 @@ from urllib.parse import quote
 from app.core.security import limiter
 from fastapi import APIRouter, Depends, HTTPException, status, Request, Query
 from fastapi.responses import StreamingResponse, Response
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 
-from app.services.export import ExportService
+from app.services.export import ExportFormat, ExportService
 from app.api.deps import get_current_user, validate_uuid
 import structlog
 
@@ -21,7 +21,7 @@ router = APIRouter()
 
 class CreateExportRequest(BaseModel):
     document_ids: List[str] = []
-    format: str = Field("pdf", pattern="^(pdf|docx|markdown)$")
+    format: ExportFormat = ExportFormat.PDF
     filename: Optional[str] = None
     options: Optional[Dict[str, Any]] = None
 
@@ -1,20 +1,22 @@
 """
 Gap Analysis routes (Firestore)
 """
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
+from app.core.pagination import CURSOR_PATTERN
 from app.core.security import limiter
-from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import ORJSONResponse
 
-from app.services.gap import GapService
+from app.services.gap import get_gap_service
 from app.api.deps import get_current_user, check_billing_limit
-from app.api.response import success_response
+from app.api.response import detail_response, list_response, success_response
 from pydantic import BaseModel, Field
 import structlog
 
 logger = structlog.get_logger()
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 class GapAnalysisRequest(BaseModel):
@@ -31,7 +33,7 @@ async def analyze_gaps(
 ):
     """Perform gap analysis comparing profile to benchmark."""
     await check_billing_limit("ai_calls", current_user)
-    service = GapService()
+    service = get_gap_service()
     try:
         report = await service.analyze_gaps(user_id=current_user["id"], profile_id=body.profile_id, benchmark_id=body.benchmark_id)
         return success_response(report)
@@ -46,11 +48,18 @@ async def analyze_gaps(
 @limiter.limit("30/minute")
 async def list_gap_reports(
     request: Request,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(None, max_length=128, pattern=CURSOR_PATTERN),
     current_user: Dict[str, Any] = Depends(get_current_user),
 ):
-    """List all user's gap reports."""
-    service = GapService()
-    return await service.get_user_reports(current_user["id"])
+    """List the user's gap reports, newest first (summary columns only).
+
+    Pass the ``X-Next-Cursor`` response header back as ``cursor`` for the
+    next page; the header is absent on the last page.
+    """
+    service = get_gap_service()
+    reports = await service.get_user_reports(current_user["id"], limit=limit, cursor=cursor)
+    return list_response(reports, limit)
 
 
 @router.get("/{report_id}")
@@ -61,10 +70,10 @@ async def get_gap_report(
     current_user: Dict[str, Any] = Depends(get_current_user),
 ):
     """Get a specific gap report."""
-    service = GapService()
+    service = get_gap_service()
     report = await service.get_report(report_id, current_user["id"])
     if not report:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Gap report not found")
+        return detail_response("Gap report not found")
     return report
 
 
@@ -76,10 +85,10 @@ async def get_gap_summary(
     current_user: Dict[str, Any] = Depends(get_current_user),
 ):
     """Get a summary of a gap report."""
-    service = GapService()
+    service = get_gap_service()
     summary = await service.get_summary(report_id, current_user["id"])
     if not summary:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Gap report not found")
+        return detail_response("Gap report not found")
     return summary
 
 
@@ -91,10 +100,10 @@ async def refresh_gap_analysis(
     current_user: Dict[str, Any] = Depends(get_current_user),
 ):
     """Refresh a gap analysis with latest data."""
-    service = GapService()
+    service = get_gap_service()
     report = await service.refresh_analysis(report_id, current_user["id"])
     if not report:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Gap report not found")
+        return detail_response("Gap report not found")
     return report
 
 
@@ -106,7 +115,7 @@ async def delete_gap_report(
     current_user: Dict[str, Any] = Depends(get_current_user),
 ):
     """Delete a gap report."""
-    service = GapService()
+    service = get_gap_service()
     deleted = await service.delete_report(report_id, current_user["id"])
     if not deleted:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Gap report not found")
+        return detail_response("Gap report not found")
@@ -4,6 +4,7 @@ Unified AI Generation Pipeline
 Package split from the original monolith for maintainability.
 """
 from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
 
 from .sync_pipeline import router as sync_router
 from .planned import router as planned_router
@@ -13,7 +14,9 @@ from .document import router as document_router
 from .cv_variants import router as cv_variants_router
 from .agentic_stream import router as agentic_stream_router
 
-router = APIRouter()
+# The pipeline payloads are large nested dicts with embedded HTML blobs —
+# orjson encodes them several times faster than the stdlib json encoder.
+router = APIRouter(default_response_class=ORJSONResponse)
 router.include_router(sync_router)
 router.include_router(planned_router)
 router.include_router(stream_router)
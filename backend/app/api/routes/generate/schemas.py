@@ -1,7 +1,9 @@
 """Pydantic request schemas for the generation API."""
-from typing import List
+from typing import Any, Dict, List
 
-from pydantic import BaseModel, field_validator
+from fastapi import Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ValidationError, field_validator
 
 from app.api.deps import validate_uuid
 
@@ -23,6 +25,33 @@ class PipelineRequest(BaseModel):
     resume_text: str = ""
 
 
+async def pipeline_request_body(request: Request) -> PipelineRequest:
+    """Decode a PipelineRequest straight from the raw body bytes.
+
+    FastAPI's default body handling runs ``json.loads`` into Python objects
+    and then validates them; ``model_validate_json`` parses and validates
+    in one pass inside pydantic-core. Errors are re-raised as
+    RequestValidationError with ``body``-prefixed locations so clients
+    still get the usual 422 shape.
+    """
+    try:
+        return PipelineRequest.model_validate_json(await request.body())
+    except ValidationError as exc:
+        raise RequestValidationError(
+            [{**err, "loc": ("body", *err["loc"])} for err in exc.errors(include_url=False)]
+        ) from None
+
+
+# Routes taking the body via pipeline_request_body pass this as openapi_extra
+# so the generated docs still describe the request schema.
+PIPELINE_REQUEST_OPENAPI: Dict[str, Any] = {
+    "requestBody": {
+        "required": True,
+        "content": {"application/json": {"schema": PipelineRequest.model_json_schema()}},
+    },
+}
+
+
 class PlannedPipelineRequest(BaseModel):
     """Request body for the planner-driven pipeline endpoint."""
     user_request: str
@@ -3,7 +3,7 @@ import asyncio
 import os
 import traceback
 import time
-from typing import Dict, Any, AsyncGenerator
+from typing import Any, AsyncGenerator, Awaitable, Dict
 
 from fastapi import APIRouter, Depends, Request
 from fastapi.responses import StreamingResponse
@@ -11,7 +11,7 @@ from fastapi.responses import StreamingResponse
 from app.api.deps import get_current_user, check_billing_limit
 from app.core.security import limiter
 
-from .schemas import PipelineRequest
+from .schemas import PIPELINE_REQUEST_OPENAPI, PipelineRequest, pipeline_request_body
 from .helpers import (
     PIPELINE_TIMEOUT,
     _RUNTIME_AVAILABLE,
@@ -27,7 +27,7 @@ from .helpers import (
     _quality_score_from_scores,
     _validation_issue_count,
     _build_evidence_summary,
-    _format_response,
+    _format_response_offloaded,
     logger,
     CircuitBreakerOpen,
 )
@@ -600,7 +600,7 @@ async def _stream_agent_pipeline(req: "PipelineRequest", user_id: str) -> AsyncG
             }
         }
 
-        response = _format_response(
+        response = await _format_response_offloaded(
             benchmark_data=benchmark_data,
             gap_analysis=gap_analysis,
             roadmap=roadmap if isinstance(roadmap, dict) else {},
@@ -688,9 +688,14 @@ async def _stream_agent_pipeline(req: "PipelineRequest", user_id: str) -> AsyncG
             })
 
 
-@router.post("/pipeline/stream")
+@router.post("/pipeline/stream", openapi_extra=PIPELINE_REQUEST_OPENAPI)
 @limiter.limit("3/minute")
-async def generate_pipeline_stream(request: Request, req: PipelineRequest, current_user: Dict[str, Any] = Depends(get_current_user)):
+async def generate_pipeline_stream(
+    request: Request,
+    current_user: Dict[str, Any] = Depends(get_current_user),
+    # Declared after current_user so unauthenticated calls get 401, not 422.
+    req: PipelineRequest = Depends(pipeline_request_body),
+):
     """
     SSE streaming version of the pipeline.
     Uses the agent pipeline (Researcher → Drafter → Critic → Optimizer →
@@ -873,95 +878,104 @@ async def generate_pipeline_stream(request: Request, req: PipelineRequest, curre
                 "message": "Gap analysis complete ✓",
             })
 
-            # ── Phase 3: Generate CV, Cover Letter, Roadmap ───────────
+            # ── Phase 3: Generate all documents + roadmap ─────────────
+            # All five chains only depend on the profile and gap analysis.
+            # They run concurrently and each one is announced the moment it
+            # lands, rather than after the slowest chain in its batch.
             yield _sse("progress", {
                 "phase": "documents",
                 "step": 3,
                 "totalSteps": 6,
                 "progress": 50,
-                "message": "Generating CV, cover letter & learning plan…",
+                "message": "Generating CV, cover letter, learning plan, personal statement & portfolio…",
             })
 
             doc_chain = DocumentGeneratorChain(ai)
             consultant = CareerConsultantChain(ai)
 
-            cv_html, cl_html, roadmap = await asyncio.gather(
-                doc_chain.generate_tailored_cv(
+            async def _tagged(key: str, coro: Awaitable[Any]) -> tuple[str, Any]:
+                try:
+                    return key, await coro
+                except Exception as exc:  # noqa: BLE001 — surfaced per document below
+                    return key, exc
+
+            doc_labels = {
+                "cv": "CV",
+                "cover_letter": "Cover letter",
+                "roadmap": "Learning plan",
+                "personal_statement": "Personal statement",
+                "portfolio": "Portfolio",
+            }
+            doc_coros = [
+                _tagged("cv", doc_chain.generate_tailored_cv(
                     user_profile=user_profile, job_title=req.job_title,
                     company=company, jd_text=req.jd_text,
                     gap_analysis=gap_analysis, resume_text=req.resume_text,
                     company_intel=company_intel_summary,
-                ),
-                doc_chain.generate_tailored_cover_letter(
+                )),
+                _tagged("cover_letter", doc_chain.generate_tailored_cover_letter(
                     user_profile=user_profile, job_title=req.job_title,
                     company=company, jd_text=req.jd_text,
                     gap_analysis=gap_analysis,
                     company_intel=company_intel_summary,
-                ),
-                consultant.generate_roadmap(gap_analysis, user_profile, req.job_title, company),
-                return_exceptions=True,
-            )
-
-            if isinstance(cv_html, Exception):
-                logger.error("pipeline_stream.cv_failed", error=str(cv_html))
-                cv_html = ""
-            if isinstance(cl_html, Exception):
-                logger.error("pipeline_stream.cl_failed", error=str(cl_html))
-                cl_html = ""
-            if isinstance(roadmap, Exception):
-                logger.error("pipeline_stream.roadmap_failed", error=str(roadmap))
-                roadmap = {}
-
-            yield _sse("progress", {
-                "phase": "documents_done",
-                "step": 3,
-                "totalSteps": 6,
-                "progress": 70,
-                "message": "CV, cover letter & learning plan ready ✓",
-            })
-
-            # ── Phase 4: Personal statement + Portfolio ───────────────
-            yield _sse("progress", {
-                "phase": "portfolio",
-                "step": 4,
-                "totalSteps": 6,
-                "progress": 75,
-                "message": "Building personal statement & portfolio…",
-            })
-
-            ps_html = ""
-            portfolio_html = ""
-            try:
-                ps_result, portfolio_result = await asyncio.gather(
-                    doc_chain.generate_tailored_personal_statement(
-                        user_profile=user_profile, job_title=req.job_title,
-                        company=company, jd_text=req.jd_text,
-                        gap_analysis=gap_analysis, resume_text=req.resume_text,
-                    ),
-                    doc_chain.generate_tailored_portfolio(
-                        user_profile=user_profile, job_title=req.job_title,
-                        company=company, jd_text=req.jd_text,
-                        gap_analysis=gap_analysis, resume_text=req.resume_text,
-                    ),
-                    return_exceptions=True,
-                )
-                if isinstance(ps_result, Exception):
-                    logger.error("pipeline_stream.ps_failed", error=str(ps_result))
-                else:
-                    ps_html = ps_result if isinstance(ps_result, str) else ""
-                if isinstance(portfolio_result, Exception):
-                    logger.error("pipeline_stream.portfolio_failed", error=str(portfolio_result))
-                else:
-                    portfolio_html = portfolio_result if isinstance(portfolio_result, str) else ""
-            except Exception as phase4_err:
-                logger.error("pipeline_stream.phase4_error", error=str(phase4_err))
+                )),
+                _tagged("roadmap", consultant.generate_roadmap(
+                    gap_analysis, user_profile, req.job_title, company,
+                )),
+                _tagged("personal_statement", doc_chain.generate_tailored_personal_statement(
+                    user_profile=user_profile, job_title=req.job_title,
+                    company=company, jd_text=req.jd_text,
+                    gap_analysis=gap_analysis, resume_text=req.resume_text,
+                )),
+                _tagged("portfolio", doc_chain.generate_tailored_portfolio(
+                    user_profile=user_profile, job_title=req.job_title,
+                    company=company, jd_text=req.jd_text,
+                    gap_analysis=gap_analysis, resume_text=req.resume_text,
+                )),
+            ]
+
+            # Per-document events reuse the phases the client already maps:
+            # CV, cover letter and plan belong to "documents" (step 3), the
+            # personal statement and portfolio to "portfolio" (step 4).
+            core_docs = ("cv", "cover_letter", "roadmap")
+            doc_results: Dict[str, Any] = {}
+            for done, next_doc in enumerate(asyncio.as_completed(doc_coros), start=1):
+                key, value = await next_doc
+                if isinstance(value, Exception):
+                    logger.error(f"pipeline_stream.{key}_failed", error=str(value))
+                    value = None
+                doc_results[key] = value
+                yield _sse("progress", {
+                    "phase": "documents" if key in core_docs else "portfolio",
+                    "stage": key,
+                    "step": 3 if key in core_docs else 4,
+                    "totalSteps": 6,
+                    "progress": 50 + round(38 * done / len(doc_coros)),
+                    "message": f"{doc_labels[key]} {'ready ✓' if value is not None else 'failed'}",
+                })
+                if key in core_docs and all(k in doc_results for k in core_docs):
+                    yield _sse("progress", {
+                        "phase": "documents_done",
+                        "step": 3,
+                        "totalSteps": 6,
+                        "progress": 50 + round(38 * done / len(doc_coros)),
+                        "message": "CV, cover letter & learning plan ready ✓",
+                    })
+
+            cv_html = doc_results.get("cv") or ""
+            cl_html = doc_results.get("cover_letter") or ""
+            roadmap = doc_results.get("roadmap") or {}
+            ps_result = doc_results.get("personal_statement")
+            ps_html = ps_result if isinstance(ps_result, str) else ""
+            portfolio_result = doc_results.get("portfolio")
+            portfolio_html = portfolio_result if isinstance(portfolio_result, str) else ""
 
             yield _sse("progress", {
                 "phase": "portfolio_done",
                 "step": 4,
                 "totalSteps": 6,
                 "progress": 88,
-                "message": "Personal statement & portfolio ready ✓",
+                "message": "All documents ready ✓",
             })
 
             # ── Phase 5: Validation ───────────────────────────────────
@@ -1006,7 +1020,7 @@ async def generate_pipeline_stream(request: Request, req: PipelineRequest, curre
                 "message": "Packaging your application…",
             })
 
-            response = _format_response(
+            response = await _format_response_offloaded(
                 benchmark_data=benchmark_data,
                 gap_analysis=gap_analysis,
                 roadmap=roadmap if isinstance(roadmap, dict) else {},
@@ -1,24 +1,50 @@
 """Synchronous pipeline endpoint (POST /pipeline)."""
 import asyncio
 import traceback
-from typing import Dict, Any, List
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import ORJSONResponse
 
 from app.api.deps import get_current_user, check_billing_limit
 from app.core.security import limiter
+from app.services import document_catalog as _document_catalog
+
+# Chain modules are imported once at module scope; classes are resolved
+# through the module attribute at call time so test patches of e.g.
+# ``ai_engine.chains.gap_analyzer.GapAnalyzerChain`` still take effect.
+from ai_engine import client as _ai_client_mod
+from ai_engine.chains import (
+    adaptive_document as _adaptive_document,
+    benchmark_builder as _benchmark_builder,
+    career_consultant as _career_consultant,
+    company_intel as _company_intel,
+    document_discovery as _document_discovery,
+    document_generator as _document_generator,
+    gap_analyzer as _gap_analyzer,
+    role_profiler as _role_profiler,
+    validator as _validator,
+)
 
-from .schemas import PipelineRequest
+from .schemas import PIPELINE_REQUEST_OPENAPI, PipelineRequest, pipeline_request_body
 from .helpers import (
+    BENCHMARK_CACHE_TTL,
+    GAP_CACHE_TTL,
+    PIPELINE_CACHE_TTL,
     PIPELINE_TIMEOUT,
+    VALIDATION_CACHE_TTL,
     _RUNTIME_AVAILABLE,
     _classify_ai_error,
     _build_company_intel_summary,
     _build_atlas_diagnostics,
+    _cache_or_call,
     _extract_keywords_from_jd,
-    _format_response,
+    _format_response_offloaded,
+    _pipeline_cache_key,
     _sanitize_output_html,
+    _stable_hash,
     _validate_pipeline_input,
+    _validation_cache_key,
     logger,
 )
 
@@ -31,16 +57,63 @@ from .helpers import CircuitBreakerOpen
 
 router = APIRouter()
 
-@router.post("/pipeline")
+# In-flight /pipeline runs keyed by _pipeline_cache_key. A duplicate request
+# (double-submit, retrying client) joins the running task instead of
+# starting a second full set of LLM chains.
+_INFLIGHT_PIPELINES: Dict[str, "asyncio.Task[Any]"] = {}
+
+
+async def _single_flight(key: str, coro_factory: Callable[[], Awaitable[Any]]) -> Any:
+    """Run ``coro_factory()`` once per ``key``; concurrent callers share the result.
+
+    The shared task is shielded so one caller disconnecting does not
+    cancel the run for the others.
+    """
+    task = _INFLIGHT_PIPELINES.get(key)
+    if task is None:
+        task = asyncio.create_task(coro_factory())
+        _INFLIGHT_PIPELINES[key] = task
+
+        def _done(t: "asyncio.Task[Any]") -> None:
+            _INFLIGHT_PIPELINES.pop(key, None)
+            # Mark the exception retrieved even if every waiter went away.
+            if not t.cancelled():
+                t.exception()
+
+        task.add_done_callback(_done)
+    else:
+        logger.info("pipeline.single_flight_join")
+    return await asyncio.shield(task)
+
+
+@router.post("/pipeline", openapi_extra=PIPELINE_REQUEST_OPENAPI)
 @limiter.limit("3/minute")
-async def generate_pipeline(request: Request, req: PipelineRequest, current_user: Dict[str, Any] = Depends(get_current_user)):
+async def generate_pipeline(
+    request: Request,
+    current_user: Dict[str, Any] = Depends(get_current_user),
+    # Declared after current_user so unauthenticated calls get 401, not 422.
+    req: PipelineRequest = Depends(pipeline_request_body),
+):
     """Run the complete AI generation pipeline and return all modules."""
     from app.api.deps import check_usage_guard
     await check_usage_guard(current_user)
     await check_billing_limit("ai_calls", current_user)
     _validate_pipeline_input(req)
     user_id = current_user.get("id") or current_user.get("uid") or current_user.get("sub") or "anonymous"
-    try:
+
+    # Identical re-submissions (common while tweaking inputs) replay the
+    # cached result instead of re-running every LLM chain.
+    from app.core.database import cache_get, cache_set
+    use_cache = not request.headers.get("x-no-cache")
+    cache_key = _pipeline_cache_key(req, user_id)
+    if use_cache:
+        cached = await cache_get(cache_key)
+        if cached is not None:
+            logger.info("pipeline.cache_hit")
+            # Already JSON-safe — skip the jsonable_encoder walk.
+            return ORJSONResponse(cached)
+
+    async def _execute() -> Any:
         if _RUNTIME_AVAILABLE:
             config = _RuntimeConfig(
                 mode=_ExecutionMode.SYNC,
@@ -57,11 +130,13 @@ async def generate_pipeline(request: Request, req: PipelineRequest, current_user
                 }),
                 timeout=PIPELINE_TIMEOUT,
             )
-        else:
-            return await asyncio.wait_for(
-                _run_sync_pipeline(req, current_user),
-                timeout=PIPELINE_TIMEOUT,
-            )
+        return await asyncio.wait_for(
+            _run_sync_pipeline(req, current_user),
+            timeout=PIPELINE_TIMEOUT,
+        )
+
+    try:
+        result = await _single_flight(cache_key, _execute)
     except asyncio.TimeoutError:
         logger.error("pipeline.timeout", timeout_seconds=PIPELINE_TIMEOUT)
         raise HTTPException(
@@ -97,20 +172,34 @@ async def generate_pipeline(request: Request, req: PipelineRequest, current_user
             detail="AI generation failed due to an unexpected error. Please try again in a moment.",
         )
 
+    # Partial results are not cached — a retry should get a chance to fill
+    # in the modules that failed.
+    if use_cache and isinstance(result, dict) and not result.get("failedModules"):
+        await cache_set(cache_key, result, ttl=PIPELINE_CACHE_TTL)
+    return result
+
+
+def _str_or_empty(result: Any, module: str, failed_modules: List[Dict[str, str]]) -> str:
+    """Normalise a gathered document result, recording failures."""
+    if isinstance(result, BaseException):
+        logger.error(f"pipeline.{module}_failed", error=str(result))
+        failed_modules.append({"module": module, "error": str(result)[:200]})
+        return ""
+    return result if isinstance(result, str) else ""
+
+
+def _dict_or_empty(result: Any, module: str, failed_modules: List[Dict[str, str]]) -> Dict[str, Any]:
+    """Normalise a gathered structured result, recording failures."""
+    if isinstance(result, BaseException):
+        logger.error(f"pipeline.{module}_failed", error=str(result))
+        failed_modules.append({"module": module, "error": str(result)[:200]})
+        return {}
+    return result if isinstance(result, dict) else {}
+
 
 async def _run_sync_pipeline(req: PipelineRequest, current_user: Dict[str, Any]) -> dict:
     """Inner pipeline logic extracted for timeout wrapping."""
-    from ai_engine.client import AIClient
-    from ai_engine.chains.role_profiler import RoleProfilerChain
-    from ai_engine.chains.benchmark_builder import BenchmarkBuilderChain
-    from ai_engine.chains.gap_analyzer import GapAnalyzerChain
-    from ai_engine.chains.document_generator import DocumentGeneratorChain
-    from ai_engine.chains.career_consultant import CareerConsultantChain
-    from ai_engine.chains.validator import ValidatorChain
-    from ai_engine.chains.document_discovery import DocumentDiscoveryChain
-    from ai_engine.chains.adaptive_document import AdaptiveDocumentChain
-
-    ai = AIClient()
+    ai = _ai_client_mod.AIClient()
     company = req.company or "the company"
     failed_modules: List[Dict[str, str]] = []  # P1-06: track partial failures
 
@@ -123,7 +212,7 @@ async def _run_sync_pipeline(req: PipelineRequest, current_user: Dict[str, Any])
     )
 
     # ── Phase 0: Document Discovery ───────────────────────────────
-    discovery_chain = DocumentDiscoveryChain(ai)
+    discovery_chain = _document_discovery.DocumentDiscoveryChain(ai)
     try:
         discovery = await discovery_chain.discover(req.jd_text, req.job_title, company)
         required_docs = discovery.get("required_documents", [])
@@ -143,11 +232,9 @@ async def _run_sync_pipeline(req: PipelineRequest, current_user: Dict[str, Any])
         optional_docs = [{"key": "learning_plan", "label": "Learning Plan", "priority": "medium"}]
 
     # ── Phase 0.5: Company Intelligence Gathering ────────────────
-    from ai_engine.chains.company_intel import CompanyIntelChain
-
     company_intel = {}
     try:
-        intel_chain = CompanyIntelChain(ai)
+        intel_chain = _company_intel.CompanyIntelChain(ai)
         company_intel = await asyncio.wait_for(
             intel_chain.gather_intel(
                 company=company,
@@ -171,13 +258,12 @@ async def _run_sync_pipeline(req: PipelineRequest, current_user: Dict[str, Any])
     company_intel_summary = _build_company_intel_summary(company_intel)
 
     # ── Phase 0.7: Catalog-driven document pack planning ─────────
-    from app.services.document_catalog import discover_and_observe
     from app.core.database import get_supabase, TABLES
 
     user_id = current_user.get("id") or current_user.get("uid") or current_user.get("sub") or "anonymous"
     sb = get_supabase()
 
-    doc_pack_plan = await discover_and_observe(
+    doc_pack_plan = await _document_catalog.discover_and_observe(
         db=sb, tables=TABLES, ai_client=ai,
         jd_text=req.jd_text, job_title=req.job_title,
         company=company, user_profile=None,  # profile not parsed yet; planner uses JD + intel
@@ -199,21 +285,24 @@ async def _run_sync_pipeline(req: PipelineRequest, current_user: Dict[str, Any])
         )
 
     # ── Phase 1: Parse resume + Build benchmark (parallel) ────────
-    profiler = RoleProfilerChain(ai)
-    benchmark_chain = BenchmarkBuilderChain(ai)
-
+    profiler = _role_profiler.RoleProfilerChain(ai)
+    benchmark_chain = _benchmark_builder.BenchmarkBuilderChain(ai)
+
+    # The benchmark depends only on the posting, so a resume-only change
+    # re-uses it instead of paying for another LLM call.
+    benchmark_coro = _cache_or_call(
+        "bench:" + _stable_hash(req.job_title, company, req.jd_text),
+        BENCHMARK_CACHE_TTL,
+        lambda: benchmark_chain.create_ideal_profile(req.job_title, company, req.jd_text),
+    )
     if req.resume_text.strip():
         user_profile, benchmark_data = await asyncio.gather(
             profiler.parse_resume(req.resume_text),
-            benchmark_chain.create_ideal_profile(
-                req.job_title, company, req.jd_text
-            ),
+            benchmark_coro,
         )
     else:
         user_profile = {}
-        benchmark_data = await benchmark_chain.create_ideal_profile(
-            req.job_title, company, req.jd_text
-        )
+        benchmark_data = await benchmark_coro
 
     logger.info("pipeline.phase1_done", has_profile=bool(user_profile))
 
@@ -259,9 +348,11 @@ async def _run_sync_pipeline(req: PipelineRequest, current_user: Dict[str, Any])
         keywords = _extract_keywords_from_jd(req.jd_text)
 
     # ── Phase 2: Gap Analysis ─────────────────────────────────────
-    gap_chain = GapAnalyzerChain(ai)
-    gap_analysis = await gap_chain.analyze_gaps(
-        user_profile, benchmark_data, req.job_title, company
+    gap_chain = _gap_analyzer.GapAnalyzerChain(ai)
+    gap_analysis = await _cache_or_call(
+        "gap:" + _stable_hash(user_profile, benchmark_data, req.job_title, company),
+        GAP_CACHE_TTL,
+        lambda: gap_chain.analyze_gaps(user_profile, benchmark_data, req.job_title, company),
     )
 
     logger.info(
@@ -270,8 +361,8 @@ async def _run_sync_pipeline(req: PipelineRequest, current_user: Dict[str, Any])
     )
 
     # ── Phase 3: Generate FIXED standard documents (parallel) ─────
-    doc_chain = DocumentGeneratorChain(ai)
-    consultant = CareerConsultantChain(ai)
+    doc_chain = _document_generator.DocumentGeneratorChain(ai)
+    consultant = _career_consultant.CareerConsultantChain(ai)
 
     skill_gaps = gap_analysis.get("skill_gaps", [])
     strengths = gap_analysis.get("strengths", [])
@@ -282,64 +373,71 @@ async def _run_sync_pipeline(req: PipelineRequest, current_user: Dict[str, Any])
         s.get("area", "") for s in strengths[:8] if isinstance(s, dict)
     ) or "None identified"
 
-    # Generate the 4 standard documents (always, for every job)
-    cv_html, cl_html, roadmap = await asyncio.gather(
-        doc_chain.generate_tailored_cv(
+    async def _cv_and_validate() -> tuple[Any, Optional[asyncio.Task]]:
+        # Kick off CV validation the moment the CV exists so it overlaps
+        # with the remaining document chains instead of trailing them.
+        cv = await doc_chain.generate_tailored_cv(
             user_profile=user_profile, job_title=req.job_title,
             company=company, jd_text=req.jd_text,
             gap_analysis=gap_analysis, resume_text=req.resume_text,
             company_intel=company_intel_summary,
-        ),
+        )
+        val_task = None
+        if isinstance(cv, str) and cv:
+            try:
+                validator = _validator.ValidatorChain(ai)
+                content = cv[:3000]
+                # An unchanged CV (e.g. a regenerate that produced identical
+                # HTML) re-uses the previous verdict instead of another LLM call.
+                val_task = asyncio.create_task(
+                    _cache_or_call(
+                        _validation_cache_key("Tailored CV", content, user_profile),
+                        VALIDATION_CACHE_TTL,
+                        lambda: validator.validate_document(
+                            document_type="Tailored CV",
+                            content=content,
+                            profile_data=user_profile,
+                        ),
+                    )
+                )
+            except Exception as val_err:
+                logger.warning("pipeline.validation_skipped", error=str(val_err))
+                failed_modules.append({"module": "validation", "error": str(val_err)[:200]})
+        return cv, val_task
+
+    # Generate the 4 standard documents + roadmap (always, for every job).
+    # All five only depend on the profile and gap analysis, so they run
+    # in a single fan-out.
+    cv_pair, cl_html, roadmap, ps_html, portfolio_html = await asyncio.gather(
+        _cv_and_validate(),
         doc_chain.generate_tailored_cover_letter(
             user_profile=user_profile, job_title=req.job_title,
             company=company, jd_text=req.jd_text, gap_analysis=gap_analysis,
             company_intel=company_intel_summary,
         ),
         consultant.generate_roadmap(gap_analysis, user_profile, req.job_title, company),
+        doc_chain.generate_tailored_personal_statement(
+            user_profile=user_profile, job_title=req.job_title,
+            company=company, jd_text=req.jd_text,
+            gap_analysis=gap_analysis, resume_text=req.resume_text,
+        ),
+        doc_chain.generate_tailored_portfolio(
+            user_profile=user_profile, job_title=req.job_title,
+            company=company, jd_text=req.jd_text,
+            gap_analysis=gap_analysis, resume_text=req.resume_text,
+        ),
         return_exceptions=True,
     )
-    if isinstance(cv_html, Exception):
-        logger.error("pipeline.cv_failed", error=str(cv_html))
-        failed_modules.append({"module": "cv", "error": str(cv_html)[:200]})
-        cv_html = ""
-    if isinstance(cl_html, Exception):
-        logger.error("pipeline.cl_failed", error=str(cl_html))
-        failed_modules.append({"module": "cover_letter", "error": str(cl_html)[:200]})
-        cl_html = ""
-    if isinstance(roadmap, Exception):
-        logger.error("pipeline.roadmap_failed", error=str(roadmap))
-        failed_modules.append({"module": "roadmap", "error": str(roadmap)[:200]})
-        roadmap = {}
-
-    # Personal Statement + Portfolio (always generated)
-    ps_html, portfolio_html = "", ""
-    try:
-        ps_result, portfolio_result = await asyncio.gather(
-            doc_chain.generate_tailored_personal_statement(
-                user_profile=user_profile, job_title=req.job_title,
-                company=company, jd_text=req.jd_text,
-                gap_analysis=gap_analysis, resume_text=req.resume_text,
-            ),
-            doc_chain.generate_tailored_portfolio(
-                user_profile=user_profile, job_title=req.job_title,
-                company=company, jd_text=req.jd_text,
-                gap_analysis=gap_analysis, resume_text=req.resume_text,
-            ),
-            return_exceptions=True,
-        )
-        if isinstance(ps_result, Exception):
-            failed_modules.append({"module": "personal_statement", "error": str(ps_result)[:200]})
-            ps_html = ""
-        else:
-            ps_html = ps_result if isinstance(ps_result, str) else ""
-        if isinstance(portfolio_result, Exception):
-            failed_modules.append({"module": "portfolio", "error": str(portfolio_result)[:200]})
-            portfolio_html = ""
-        else:
-            portfolio_html = portfolio_result if isinstance(portfolio_result, str) else ""
-    except Exception as p4_err:
-        logger.error("pipeline.phase4_error", error=str(p4_err))
-        failed_modules.append({"module": "phase4_docs", "error": str(p4_err)[:200]})
+    cv_val_task: Optional[asyncio.Task] = None
+    if isinstance(cv_pair, BaseException):
+        cv_html = _str_or_empty(cv_pair, "cv", failed_modules)
+    else:
+        cv_html, cv_val_task = cv_pair
+        cv_html = _str_or_empty(cv_html, "cv", failed_modules)
+    cl_html = _str_or_empty(cl_html, "cover_letter", failed_modules)
+    roadmap = _dict_or_empty(roadmap, "roadmap", failed_modules)
+    ps_html = _str_or_empty(ps_html, "personal_statement", failed_modules)
+    portfolio_html = _str_or_empty(portfolio_html, "portfolio", failed_modules)
 
     logger.info("pipeline.standard_docs_done", cv=len(str(cv_html)), cl=len(str(cl_html)))
 
@@ -353,7 +451,7 @@ async def _run_sync_pipeline(req: PipelineRequest, current_user: Dict[str, Any])
 
     generated_docs: Dict[str, str] = {}
     if extra_docs_to_generate:
-        adaptive_chain = AdaptiveDocumentChain(ai)
+        adaptive_chain = _adaptive_document.AdaptiveDocumentChain(ai)
         doc_context = {
             "profile": user_profile,
             "jd_text": req.jd_text,
@@ -390,15 +488,11 @@ async def _run_sync_pipeline(req: PipelineRequest, current_user: Dict[str, Any])
         logger.info("pipeline.extra_docs_done", count=len(generated_docs), keys=list(generated_docs.keys()))
 
     # ── Phase 4: Validate key documents (non-blocking) ───────────
+    # The CV validator was started alongside Phase 3; collect it here.
     validation = {}
     try:
-        validator = ValidatorChain(ai)
-        if cv_html:
-            cv_valid, cv_validation = await validator.validate_document(
-                document_type="Tailored CV",
-                content=cv_html[:3000],
-                profile_data=user_profile,
-            )
+        if cv_val_task is not None:
+            cv_valid, cv_validation = await cv_val_task
             validation["cv"] = {
                 "valid": cv_valid,
                 "qualityScore": cv_validation.get("quality_score", 0),
@@ -409,7 +503,7 @@ async def _run_sync_pipeline(req: PipelineRequest, current_user: Dict[str, Any])
         failed_modules.append({"module": "validation", "error": str(val_err)[:200]})
 
     # ── Format response for frontend ──────────────────────────────
-    response = _format_response(
+    response = await _format_response_offloaded(
         benchmark_data=benchmark_data,
         gap_analysis=gap_analysis,
         roadmap=roadmap if isinstance(roadmap, dict) else {},
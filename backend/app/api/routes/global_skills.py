@@ -1,7 +1,7 @@
 """
 Global Skills & Development API routes — profile-wide skills, gaps, and learning goals.
 """
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Literal
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from pydantic import BaseModel, Field
@@ -20,21 +20,21 @@ router = APIRouter()
 
 class UpsertSkillRequest(BaseModel):
     skill_name: str = Field(..., min_length=1, max_length=200)
-    category: Optional[str] = Field(None, pattern="^(technical|soft_skill|tool|language|framework|methodology|certification|domain|other)$")
-    proficiency: Optional[str] = Field(None, pattern="^(beginner|intermediate|advanced|expert)$")
+    category: Optional[Literal["technical", "soft_skill", "tool", "language", "framework", "methodology", "certification", "domain", "other"]] = None
+    proficiency: Optional[Literal["beginner", "intermediate", "advanced", "expert"]] = None
     years_experience: Optional[float] = Field(None, ge=0, le=50)
-    source: str = Field("manual", pattern="^(manual|resume_parse|gap_analysis|learning|evidence)$")
+    source: Literal["manual", "resume_parse", "gap_analysis", "learning", "evidence"] = "manual"
 
 
 class UpdateGapStatusRequest(BaseModel):
-    status: str = Field(..., pattern="^(open|in_progress|closed|dismissed)$")
+    status: Literal["open", "in_progress", "closed", "dismissed"]
 
 
 class CreateGoalRequest(BaseModel):
     title: str = Field(..., min_length=1, max_length=500)
     description: Optional[str] = Field(None, max_length=2000)
     target_skills: List[str] = Field(default_factory=list)
-    goal_type: str = Field("general", pattern="^(skill_acquisition|certification|career_transition|promotion_readiness|industry_knowledge|general)$")
+    goal_type: Literal["skill_acquisition", "certification", "career_transition", "promotion_readiness", "industry_knowledge", "general"] = "general"
     target_date: Optional[str] = None
 
 
@@ -43,7 +43,7 @@ class UpdateGoalRequest(BaseModel):
     description: Optional[str] = Field(None, max_length=2000)
     target_skills: Optional[List[str]] = None
     goal_type: Optional[str] = None
-    status: Optional[str] = Field(None, pattern="^(active|completed|paused|archived)$")
+    status: Optional[Literal["active", "completed", "paused", "archived"]] = None
     target_date: Optional[str] = None
     progress_pct: Optional[int] = Field(None, ge=0, le=100)
 
@@ -3,12 +3,15 @@ Job Description routes (Firestore)
 """
 from typing import Dict, Any, Optional
 
+from app.core.pagination import CURSOR_PATTERN
 from app.core.security import limiter
-from fastapi import APIRouter, Depends, HTTPException, status, Request, Query
+from fastapi import APIRouter, Depends, status, Request, Query
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 
-from app.services.job import JobService
+from app.services.job import get_job_service
 from app.api.deps import get_current_user, validate_uuid
+from app.api.response import detail_response, list_response
 
 
 class JobDataRequest(BaseModel):
@@ -22,7 +25,7 @@ class JobDataRequest(BaseModel):
     source_url: Optional[str] = Field(None, max_length=2000)
 
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 @router.post("", status_code=status.HTTP_201_CREATED)
@@ -33,7 +36,7 @@ async def create_job(
     current_user: Dict[str, Any] = Depends(get_current_user),
 ):
     """Create a new job description."""
-    service = JobService()
+    service = get_job_service()
     result = await service.create_job(current_user["id"], job_data.model_dump(exclude_none=True))
     from app.core.database import cache_invalidate_prefix
     await cache_invalidate_prefix(f"jobs:list:{current_user['id']}")
@@ -46,18 +49,22 @@ async def list_jobs(
     request: Request,
     limit: int = Query(50, ge=1, le=200),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, max_length=128, pattern=CURSOR_PATTERN),
     current_user: Dict[str, Any] = Depends(get_current_user),
 ):
-    """List all user's job descriptions."""
+    """List the user's job descriptions, newest first (list columns only).
+
+    ``cursor`` (from the ``X-Next-Cursor`` response header) takes precedence
+    over ``offset``.
+    """
     from app.core.database import cache_get, cache_set
-    cache_key = f"jobs:list:{current_user['id']}:{limit}:{offset}"
-    cached = await cache_get(cache_key)
-    if cached is not None:
-        return cached
-    service = JobService()
-    result = await service.get_user_jobs(current_user["id"], limit=limit, offset=offset)
-    await cache_set(cache_key, result, ttl=60)
-    return result
+    cache_key = f"jobs:list:{current_user['id']}:{limit}:{offset}:{cursor or ''}"
+    result = await cache_get(cache_key)
+    if result is None:
+        service = get_job_service()
+        result = await service.get_user_jobs(current_user["id"], limit=limit, offset=offset, cursor=cursor)
+        await cache_set(cache_key, result, ttl=60)
+    return list_response(result, limit)
 
 
 @router.get("/{job_id}")
@@ -69,10 +76,10 @@ async def get_job(
 ):
     """Get a specific job description."""
     validate_uuid(job_id, "job_id")
-    service = JobService()
+    service = get_job_service()
     job = await service.get_job(job_id, current_user["id"])
     if not job:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job description not found")
+        return detail_response("Job description not found")
     return job
 
 
@@ -86,10 +93,10 @@ async def update_job(
 ):
     """Update a job description."""
     validate_uuid(job_id, "job_id")
-    service = JobService()
+    service = get_job_service()
     job = await service.update_job(job_id, current_user["id"], job_data.model_dump(exclude_none=True))
     if not job:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job description not found")
+        return detail_response("Job description not found")
     from app.core.database import cache_invalidate_prefix
     await cache_invalidate_prefix(f"jobs:list:{current_user['id']}")
     return job
@@ -104,10 +111,10 @@ async def delete_job(
 ):
     """Delete a job description."""
     validate_uuid(job_id, "job_id")
-    service = JobService()
+    service = get_job_service()
     deleted = await service.delete_job(job_id, current_user["id"])
     if not deleted:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job description not found")
+        return detail_response("Job description not found")
     from app.core.database import cache_invalidate_prefix
     await cache_invalidate_prefix(f"jobs:list:{current_user['id']}")
 
@@ -121,8 +128,8 @@ async def parse_job(
 ):
     """Parse a job description with AI to extract requirements."""
     validate_uuid(job_id, "job_id")
-    service = JobService()
+    service = get_job_service()
     job = await service.parse_job(job_id, current_user["id"])
     if not job:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job description not found")
+        return detail_response("Job description not found")
     return job
@@ -1,7 +1,7 @@
 """
 Knowledge Library API routes — browse resources, track progress, get recommendations.
 """
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Literal
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from pydantic import BaseModel, Field
@@ -18,7 +18,7 @@ router = APIRouter()
 
 class SaveProgressRequest(BaseModel):
     resource_id: str = Field(..., min_length=1, max_length=100)
-    status: str = Field("saved", pattern="^(saved|in_progress|completed)$")
+    status: Literal["saved", "in_progress", "completed"] = "saved"
     progress_pct: int = Field(0, ge=0, le=100)
 
 
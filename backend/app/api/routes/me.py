@@ -22,7 +22,7 @@ import structlog
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 
 from app.api.deps import get_current_user
-from app.core.database import TABLES, get_supabase
+from app.core.database import TABLES, get_supabase, invalidate_user
 from app.core.security import limiter
 
 logger = structlog.get_logger("hirestack.me")
@@ -125,5 +125,6 @@ async def delete_my_account(
             detail="Failed to delete account. Please contact support.",
         )
 
+    invalidate_user(user_id)
     logger.info("me.delete.completed", user_id=user_id, rows_deleted=deleted)
     return None
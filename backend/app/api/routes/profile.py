@@ -1,14 +1,18 @@
 """
 Profile routes - Resume upload, parsing, career intelligence, and universal documents
 """
+import os
 from typing import Dict, Any, Optional
 
+from app.core.config import settings, upload_limits
 from app.core.security import limiter
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, Request
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 
 from app.services.profile import ProfileService
 from app.api.deps import get_current_user, validate_uuid
+from app.api.uploads import read_upload_bounded
 import structlog
 
 logger = structlog.get_logger()
@@ -29,7 +33,11 @@ class UpdateProfileRequest(BaseModel):
     social_links: Optional[Dict[str, Any]] = None
     is_primary: Optional[bool] = None
 
-router = APIRouter()
+# Profile payloads are large nested dicts (experience, skills, parsed
+# resume data); orjson encodes them several times faster than stdlib json.
+router = APIRouter(default_response_class=ORJSONResponse)
+
+_ALLOWED_EXTS_LABEL = ", ".join(settings.allowed_file_types)
 
 
 class SocialLinksUpdate(BaseModel):
@@ -52,20 +60,20 @@ async def upload_resume(
     current_user: Dict[str, Any] = Depends(get_current_user),
 ):
     """Upload and parse a resume file."""
-    allowed_types = [".pdf", ".docx", ".doc", ".txt"]
-    file_ext = "." + file.filename.split(".")[-1].lower() if file.filename and "." in file.filename else ""
-
-    if not file_ext or file_ext not in allowed_types:
+    file_ext = os.path.splitext(file.filename or "")[1].lower()
+    if file_ext not in upload_limits.allowed_exts:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"File type not allowed. Allowed types: {', '.join(allowed_types)}",
+            detail=f"File type not allowed. Allowed types: {_ALLOWED_EXTS_LABEL}",
         )
 
-    contents = await file.read()
-    if not contents or len(contents) == 0:
+    contents, content_hash = await read_upload_bounded(
+        file,
+        upload_limits.max_bytes,
+        detail=f"File too large. Maximum size is {upload_limits.max_mb}MB",
+    )
+    if not contents:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="File is empty.")
-    if len(contents) > 10 * 1024 * 1024:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="File too large. Maximum size is 10MB")
 
     service = ProfileService()
     try:
@@ -75,11 +83,8 @@ async def upload_resume(
             file_name=file.filename,
             file_type=file_ext,
             is_primary=is_primary,
+            content_hash=content_hash,
         )
-        from app.core.database import cache_invalidate_prefix
-        await cache_invalidate_prefix(f"profiles:{current_user['id']}")
-        await cache_invalidate_prefix(f"profiles:list:{current_user['id']}")
-        await cache_invalidate_prefix(f"profiles:primary:{current_user['id']}")
         return profile
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
@@ -126,16 +131,10 @@ async def get_primary_profile(
     request: Request,
     current_user: Dict[str, Any] = Depends(get_current_user)):
     """Get user's primary profile."""
-    from app.core.database import cache_get, cache_set
-    cache_key = f"profiles:primary:{current_user['id']}"
-    cached = await cache_get(cache_key)
-    if cached is not None:
-        return cached
     service = ProfileService()
     profile = await service.get_primary_profile(current_user["id"])
     if not profile:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No primary profile found. Please upload a resume.")
-    await cache_set(cache_key, profile, ttl=120)
     return profile
 
 
@@ -163,10 +162,6 @@ async def update_profile(
     profile = await service.update_profile(profile_id=profile_id, user_id=current_user["id"], update_data=profile_data.model_dump(exclude_none=True))
     if not profile:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found")
-    from app.core.database import cache_invalidate_prefix
-    await cache_invalidate_prefix(f"profiles:{current_user['id']}")
-    await cache_invalidate_prefix(f"profiles:list:{current_user['id']}")
-    await cache_invalidate_prefix(f"profiles:primary:{current_user['id']}")
     return profile
 
 
@@ -180,10 +175,6 @@ async def delete_profile(
     deleted = await service.delete_profile(profile_id, current_user["id"])
     if not deleted:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found")
-    from app.core.database import cache_invalidate_prefix
-    await cache_invalidate_prefix(f"profiles:{current_user['id']}")
-    await cache_invalidate_prefix(f"profiles:list:{current_user['id']}")
-    await cache_invalidate_prefix(f"profiles:primary:{current_user['id']}")
 
 
 @router.post("/{profile_id}/set-primary")
@@ -196,10 +187,6 @@ async def set_primary_profile(
     profile = await service.set_primary(profile_id, current_user["id"])
     if not profile:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found")
-    from app.core.database import cache_invalidate_prefix
-    await cache_invalidate_prefix(f"profiles:{current_user['id']}")
-    await cache_invalidate_prefix(f"profiles:list:{current_user['id']}")
-    await cache_invalidate_prefix(f"profiles:primary:{current_user['id']}")
     return profile
 
 
@@ -270,11 +257,6 @@ async def calibrate_writing_style_endpoint(
             status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found"
         )
 
-    from app.core.database import cache_invalidate_prefix
-    await cache_invalidate_prefix(f"profiles:{current_user['id']}")
-    await cache_invalidate_prefix(f"profiles:list:{current_user['id']}")
-    await cache_invalidate_prefix(f"profiles:primary:{current_user['id']}")
-
     return {"profile_id": profile_id, "writing_style": signals}
 
 
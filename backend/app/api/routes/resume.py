@@ -5,12 +5,14 @@ The frontend owns Supabase Auth; the backend verifies the token and
 provides server-side helpers (e.g. PDF parsing) for reliability.
 """
 
+import os
 from typing import Any, Dict
 
 from fastapi import APIRouter, Depends, File, HTTPException, Request, UploadFile, status
 
 from app.api.deps import get_current_user
-from app.core.config import settings
+from app.api.uploads import read_upload_bounded
+from app.core.config import upload_limits
 from app.core.security import limiter
 from app.services.file_parser import FileParser
 
@@ -19,9 +21,12 @@ router = APIRouter()
 
 _file_parser = FileParser()
 
-
-def _max_bytes() -> int:
-    return int(settings.max_upload_size_mb) * 1024 * 1024
+_CONTENT_TYPE_EXTS = {
+    "application/pdf": ".pdf",
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document": ".docx",
+    "application/msword": ".doc",
+    "text/plain": ".txt",
+}
 
 
 @router.post("/parse")
@@ -41,33 +46,26 @@ async def parse_resume(
     if not file.filename:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Missing filename")
 
-    raw = await file.read()
-    if len(raw) > _max_bytes():
-        raise HTTPException(
-            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-            detail=f"File too large (max {settings.max_upload_size_mb}MB).",
-        )
-
     name = file.filename
-    ext = (name.lower().split(".")[-1] if "." in name else "").strip()
+    ext = os.path.splitext(name)[1].lower()
     content_type = file.content_type or ""
 
     # Map content-type to extension if extension is missing/unclear
-    if not ext or ext not in ("pdf", "docx", "doc", "txt"):
-        ct_map = {
-            "application/pdf": "pdf",
-            "application/vnd.openxmlformats-officedocument.wordprocessingml.document": "docx",
-            "application/msword": "doc",
-            "text/plain": "txt",
-        }
-        ext = ct_map.get(content_type, ext)
-
-    if ext not in ("pdf", "docx", "doc", "txt"):
+    if ext not in upload_limits.allowed_exts:
+        ext = _CONTENT_TYPE_EXTS.get(content_type) or (".txt" if content_type.startswith("text/") else ext)
+
+    if ext not in upload_limits.allowed_exts:
         raise HTTPException(
             status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
             detail="Unsupported file type. Use PDF, DOCX, or TXT.",
         )
 
+    raw, _ = await read_upload_bounded(
+        file,
+        upload_limits.max_bytes,
+        detail=f"File too large (max {upload_limits.max_mb}MB).",
+    )
+
     try:
         text = await _file_parser.extract_text(raw, ext)
     except ValueError as e:
@@ -0,0 +1,41 @@
+"""Bounded reads for multipart file uploads."""
+import hashlib
+from typing import Optional, Tuple
+
+from fastapi import HTTPException, UploadFile, status
+
+UPLOAD_CHUNK_BYTES = 64 * 1024
+
+
+async def read_upload_bounded(
+    file: UploadFile,
+    max_bytes: int,
+    *,
+    detail: Optional[str] = None,
+) -> Tuple[bytes, str]:
+    """Read *file* in fixed-size chunks, rejecting it as soon as it exceeds *max_bytes*.
+
+    Returns ``(contents, sha256_hex)``; the hash is computed on the same
+    pass so callers that dedupe uploads don't rescan the buffer.
+    Raises 413 without reading anything when the multipart parser already
+    knows the part is oversized.
+    """
+    too_large = HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=detail or f"File too large (max {max_bytes // (1024 * 1024)}MB).",
+    )
+    size = getattr(file, "size", None)
+    if size is not None and size > max_bytes:
+        raise too_large
+
+    buf = bytearray()
+    hasher = hashlib.sha256()
+    while True:
+        chunk = await file.read(UPLOAD_CHUNK_BYTES)
+        if not chunk:
+            break
+        if len(buf) + len(chunk) > max_bytes:
+            raise too_large
+        buf += chunk
+        hasher.update(chunk)
+    return bytes(buf), hasher.hexdigest()
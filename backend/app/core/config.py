@@ -2,9 +2,10 @@
 HireStack AI - Configuration Module
 Central configuration management using pydantic-settings
 """
+from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import FrozenSet, List
 
 from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -108,6 +109,10 @@ class Settings(BaseSettings):
     max_upload_size_mb: int = 10
     allowed_file_types: List[str] = [".pdf", ".docx", ".doc", ".txt"]
     upload_dir: str = "./uploads"
+    # OCR for scanned PDFs whose text layer is (near-)empty. Off by default:
+    # needs the optional rapidocr_onnxruntime package and costs seconds/page.
+    enable_ocr_fallback: bool = False
+    ocr_max_pages: int = 4
 
     # Rate Limiting
     rate_limit_requests: int = 100
@@ -117,6 +122,14 @@ class Settings(BaseSettings):
     supabase_http_retries: int = 3
     supabase_http_retry_base_s: float = 0.25
     supabase_http_retry_max_s: float = 2.0
+    # PostgREST connection pool. httpx drops idle keep-alive connections
+    # after 5 s by default, so bursty traffic kept paying TCP+TLS setup.
+    supabase_http_keepalive_s: float = 30.0
+    supabase_http_max_connections: int = 100
+    # Worker threads for SupabaseDB._run. Each blocking supabase-py call
+    # holds a thread for its whole PostgREST round-trip; keep this at or
+    # below supabase_http_max_connections.
+    supabase_pool_size: int = 64
 
     # Job queue
     queue_require_active_consumer: bool = True
@@ -166,3 +179,19 @@ def get_settings() -> Settings:
 
 
 settings = get_settings()
+
+
+@dataclass(frozen=True, slots=True)
+class UploadLimits:
+    """Upload bounds derived once from ``settings`` for the upload hot paths."""
+
+    max_mb: int
+    max_bytes: int
+    allowed_exts: FrozenSet[str]
+
+
+upload_limits = UploadLimits(
+    max_mb=int(settings.max_upload_size_mb),
+    max_bytes=int(settings.max_upload_size_mb) * 1024 * 1024,
+    allowed_exts=frozenset(ext.lower() for ext in settings.allowed_file_types),
+)
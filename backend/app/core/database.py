@@ -2,12 +2,16 @@
 HireStack AI - Database Module
 Supabase integration for data storage (PostgreSQL via PostgREST)
 """
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, NamedTuple, Tuple, Union
 import asyncio
 import base64
+import binascii
+import functools
+import importlib.util
 import logging
 import os
 import random
+from concurrent.futures import ThreadPoolExecutor
 
 from supabase import create_client, Client
 import httpx
@@ -23,25 +27,97 @@ logger = logging.getLogger("hirestack.supabase")
 _supabase_client: Optional[Client] = None
 
 
+# Blocking supabase-py calls run on their own pool rather than the loop's
+# default executor, whose min(32, cpu+4) threads throttle concurrent
+# requests and are shared with every asyncio.to_thread caller.
+_db_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_db_executor() -> ThreadPoolExecutor:
+    global _db_executor
+    if _db_executor is None:
+        _db_executor = ThreadPoolExecutor(
+            max_workers=max(1, settings.supabase_pool_size),
+            thread_name_prefix="supabase",
+        )
+    return _db_executor
+
+
 def init_supabase() -> Client:
-    """Initialise the Supabase client (service-role, bypasses RLS)."""
-    global _supabase_client
-    if _supabase_client is not None:
-        return _supabase_client
-    _supabase_client = create_client(settings.supabase_url, settings.supabase_service_role_key)
+    """Initialise the Supabase client (service-role, bypasses RLS).
+
+    Also binds the SupabaseDB singleton to the new client, so get_db() on
+    the request path is a plain global read after startup.
+    """
+    global _supabase_client, _db_instance
+    if _supabase_client is None:
+        _supabase_client = create_client(settings.supabase_url, settings.supabase_service_role_key)
+        _tune_postgrest_pool(_supabase_client)
+    if _db_instance is None:
+        _db_instance = SupabaseDB(_supabase_client)
     return _supabase_client
 
 
+def _tune_postgrest_pool(client: Client) -> None:
+    """Give PostgREST a longer-lived keep-alive pool (HTTP/2 when ``h2`` is installed).
+
+    supabase-py builds the PostgREST httpx session with default pool limits,
+    whose 5 s keep-alive expiry drops idle connections between bursts. The
+    session is swapped for an equivalent one with tuned limits; any SDK
+    shape we don't recognise is left untouched.
+    """
+    try:
+        postgrest = client.postgrest
+        session = getattr(postgrest, "session", None)
+        if not isinstance(session, httpx.Client):
+            return
+        postgrest.session = httpx.Client(
+            base_url=session.base_url,
+            headers=session.headers,
+            timeout=session.timeout,
+            follow_redirects=session.follow_redirects,
+            http2=importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(
+                max_connections=settings.supabase_http_max_connections,
+                max_keepalive_connections=settings.supabase_http_max_connections,
+                keepalive_expiry=settings.supabase_http_keepalive_s,
+            ),
+        )
+        session.close()
+    except Exception as exc:  # noqa: BLE001 — tuning is best-effort
+        logger.debug("postgrest_pool_tuning_skipped: %s", str(exc)[:200])
+
+
+def _warm_supabase() -> None:
+    try:
+        _supabase_client.table(TABLES["users"]).select("id").limit(1).execute()
+    except Exception as exc:  # noqa: BLE001 — warm-up is best-effort
+        logger.debug("supabase_warmup_failed: %s", str(exc)[:200])
+
+
+def schedule_supabase_warmup() -> None:
+    """Open the first PostgREST connection on the DB pool at startup.
+
+    The client connects lazily, so without this the first request per
+    worker pays the TCP+TLS handshake. Fire-and-forget: startup is not
+    blocked, and a request that races the warm-up just opens its own.
+    """
+    if _supabase_client is not None:
+        _get_db_executor().submit(_warm_supabase)
+
+
 def get_supabase() -> Client:
     """Return the Supabase client, initialising if needed."""
-    if _supabase_client is None:
-        init_supabase()
-    return _supabase_client
+    client = _supabase_client
+    if client is None:
+        client = init_supabase()
+    return client
 
 
 def close_supabase() -> None:
     """Release the Supabase client singleton (call during shutdown)."""
-    global _supabase_client
+    global _supabase_client, _db_instance
+    _db_instance = None  # bound to the client being released
     if _supabase_client is None:
         return
     try:
@@ -63,7 +139,20 @@ def close_supabase() -> None:
 
 # ── JWT token verification ───────────────────────────────────────────────────
 
-def _decode_jwt_with_secret(id_token: str, secret) -> Optional[Dict[str, Any]]:
+class VerifiedUser(NamedTuple):
+    """Claims of a verified access token.
+
+    Immutable, so one instance is safely shared by every cache hit.
+    """
+    sub: str
+    email: Optional[str]
+    user_metadata: Dict[str, Any]
+    aud: Optional[str] = "authenticated"
+    role: Optional[str] = "authenticated"
+    exp: Optional[int] = None
+
+
+def _decode_jwt_with_secret(id_token: str, secret) -> Optional[VerifiedUser]:
     """Attempt to decode a JWT with the given secret (str or bytes). Returns claims or None."""
     try:
         decoded = jwt.decode(
@@ -73,29 +162,97 @@ def _decode_jwt_with_secret(id_token: str, secret) -> Optional[Dict[str, Any]]:
             audience="authenticated",
         )
         meta = decoded.get("user_metadata") or {}
-        return {
-            "sub": str(decoded.get("sub") or ""),
-            "email": decoded.get("email"),
-            "user_metadata": meta if isinstance(meta, dict) else {},
-            "aud": decoded.get("aud"),
-            "role": decoded.get("role"),
-        }
+        return VerifiedUser(
+            sub=str(decoded.get("sub") or ""),
+            email=decoded.get("email"),
+            user_metadata=meta if isinstance(meta, dict) else {},
+            aud=decoded.get("aud"),
+            role=decoded.get("role"),
+            exp=decoded.get("exp"),
+        )
     except jwt.ExpiredSignatureError:
         raise  # Re-raise so caller can handle expiration specifically
     except jwt.InvalidTokenError:
         return None  # Signature mismatch — try next secret format
 
 
-def verify_token(id_token: str) -> Optional[Dict[str, Any]]:
+@functools.lru_cache(maxsize=4)
+def _hs256_keys(secret: str) -> Tuple[Union[str, bytes], ...]:
+    """Candidate HMAC keys for SUPABASE_JWT_SECRET, decoded once per secret.
+
+    Most Supabase instances sign with the raw string; some hosted ones use
+    its base64-decoded bytes.
+    """
+    keys: List[Union[str, bytes]] = [secret]
+    try:
+        keys.append(base64.b64decode(secret))
+    except (binascii.Error, ValueError):
+        pass  # not base64 — only the raw form can be valid
+    return tuple(keys)
+
+
+# Index into _hs256_keys() of the form that last verified a token. Every
+# token from one project uses the same form, so trying it first spares a
+# failed HMAC check per cache miss.
+_hs256_key_hint = 0
+
+
+def _verify_hs256_locally(id_token: str, secret: str) -> Optional[VerifiedUser]:
+    """Verify an HS256 token without network I/O.
+
+    Returns None when no key form matches; ExpiredSignatureError propagates.
+    """
+    global _hs256_key_hint
+    keys = _hs256_keys(secret)
+    hint = _hs256_key_hint if _hs256_key_hint < len(keys) else 0
+    for idx in (hint, *(i for i in range(len(keys)) if i != hint)):
+        result = _decode_jwt_with_secret(id_token, keys[idx])
+        if result is not None:
+            _hs256_key_hint = idx
+            return result
+    return None
+
+
+def _unverified_exp(id_token: str) -> Optional[int]:
+    """Read ``exp`` from a token GoTrue has already vouched for.
+
+    Remote verification returns the user but not the token's lifetime;
+    the payload's exp bounds how long that verification may be cached.
+    """
+    try:
+        exp = jwt.decode(id_token, options={"verify_signature": False, "verify_exp": False}).get("exp")
+    except jwt.InvalidTokenError:
+        return None
+    return exp if isinstance(exp, int) else None
+
+
+def _verified_remote_user(user: Any, id_token: str) -> VerifiedUser:
+    """Claims for a token GoTrue's /auth/v1/user endpoint accepted."""
+    return VerifiedUser(
+        sub=str(user.id),
+        email=user.email,
+        user_metadata=user.user_metadata or {},
+        exp=_unverified_exp(id_token),
+    )
+
+
+def verify_token(id_token: str) -> Optional[VerifiedUser]:
     """
     Verify a Supabase access token.
 
-    Prefer local HS256 verification when SUPABASE_JWT_SECRET is configured.
-    Tries the raw secret string first, then the base64-decoded bytes (hosted
-    Supabase instances may use either format).
+    Prefer local HS256 verification when SUPABASE_JWT_SECRET is configured
+    (raw or base64-decoded secret — hosted Supabase instances may use either).
     Falls back to the Auth admin API for non-HS256 tokens (e.g. local CLI ES256)
     or when the secret is missing.
+
+    Shares the verification cache with verify_token_async().
     """
+    cached = _token_cache.get(id_token)
+    if cached is not None:
+        return cached
+    if _token_cache.is_known_bad(id_token):
+        return None
+
     jwt_secret = (settings.supabase_jwt_secret or "").strip()
     if jwt_secret:
         try:
@@ -105,51 +262,38 @@ def verify_token(id_token: str) -> Optional[Dict[str, Any]]:
             alg = ""
 
         if alg == "HS256":
-            # Try 1: raw secret string (how most Supabase instances work)
             try:
-                result = _decode_jwt_with_secret(id_token, jwt_secret)
-                if result is not None:
-                    return result
-            except jwt.ExpiredSignatureError:
-                return None
-
-            # Try 2: base64-decoded bytes (some hosted Supabase instances)
-            try:
-                secret_bytes = base64.b64decode(jwt_secret)
-                result = _decode_jwt_with_secret(id_token, secret_bytes)
-                if result is not None:
-                    return result
+                result = _verify_hs256_locally(id_token, jwt_secret)
             except jwt.ExpiredSignatureError:
+                _token_cache.mark_bad(id_token)
                 return None
-            except Exception as e:
-                logger.warning("token_verification_b64_failed", extra={"error": str(e)})
+            if result is not None:
+                _token_cache.put(id_token, result)
+                return result
 
-            logger.warning("token_verification_failed_local_all", extra={"note": "both raw and b64 secrets failed, falling back to remote"})
+            logger.warning("token_verification_failed_local_all: no secret form matched, falling back to remote")
 
     try:
         client = get_supabase()
         response = client.auth.get_user(id_token)
         if response and response.user:
-            user = response.user
-            meta = user.user_metadata or {}
-            return {
-                "sub": str(user.id),
-                "email": user.email,
-                "user_metadata": meta,
-                "aud": "authenticated",
-                "role": "authenticated",
-            }
+            claims = _verified_remote_user(response.user, id_token)
+            _token_cache.put(id_token, claims)
+            return claims
+        _token_cache.mark_bad(id_token)
         return None
     except Exception as e:
         # Do not treat transient network issues as "invalid token" — callers should
         # use verify_token_async() to get retries + proper 503s.
-        logger.warning("token_verification_failed", extra={"error": str(e)})
+        logger.warning("token_verification_failed: %s", str(e)[:200])
         return None
 
 
-def get_user_from_token(decoded_token: Dict[str, Any]) -> Dict[str, Any]:
+def get_user_from_token(decoded_token: Union[VerifiedUser, Dict[str, Any]]) -> Dict[str, Any]:
     """Extract user info from a decoded Supabase JWT."""
-    meta = decoded_token.get("user_metadata", {})
+    if isinstance(decoded_token, VerifiedUser):
+        decoded_token = decoded_token._asdict()
+    meta = decoded_token.get("user_metadata") or {}
     return {
         "uid": decoded_token.get("sub"),
         "email": decoded_token.get("email"),
@@ -257,6 +401,47 @@ TABLES = {
 
 # ── SupabaseDB helper class ─────────────────────────────────────────────────
 
+# Ids per ``in.(...)`` filter in get_many — keeps the PostgREST URL well
+# under proxy limits (100 UUIDs ≈ 3.7 KB).
+_GET_MANY_BATCH = 100
+# Rows per multi-row INSERT in create_many. Bigger batches stop paying off
+# and push request bodies toward PostgREST/proxy size limits.
+_CREATE_MANY_BATCH = 1000
+# ``Prefer: return=minimal`` for writes whose rows the caller never reads,
+# so PostgREST sends back an empty body instead of the mutated rows.
+# Passed as the plain string: postgrest-py formats it into the header.
+_RETURN_MINIMAL = "minimal"
+
+
+# Filter op → PostgREST builder method; unknown ops fall back to eq.
+_FILTER_METHODS: Dict[str, str] = {
+    "==": "eq",
+    "!=": "neq",
+    ">": "gt",
+    ">=": "gte",
+    "<": "lt",
+    "<=": "lte",
+    "in": "in_",
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_filter_shape(shape: Tuple[Tuple[str, str], ...]) -> Tuple[Tuple[str, str], ...]:
+    """Resolve a filter shape ``((field, op), ...)`` to ``((method, field), ...)``.
+
+    Call sites issue the same few shapes over and over, so op dispatch runs
+    once per shape instead of once per filter per call.
+    """
+    return tuple((_FILTER_METHODS.get(op, "eq"), field) for field, op in shape)
+
+
+def _apply_filters(q: Any, filters: List[tuple]) -> Any:
+    plan = _compile_filter_shape(tuple((field, op) for field, op, _ in filters))
+    for (method, field), (_, _, value) in zip(plan, filters):
+        q = getattr(q, method)(field, value)
+    return q
+
+
 class SupabaseDB:
     """
     Async-friendly helper for Supabase/PostgREST operations.
@@ -267,8 +452,8 @@ class SupabaseDB:
     without modification.
     """
 
-    def __init__(self):
-        self.client: Client = get_supabase()
+    def __init__(self, client: Optional[Client] = None):
+        self.client: Client = client if client is not None else get_supabase()
 
     @staticmethod
     def _is_transient_error(exc: BaseException) -> bool:
@@ -290,7 +475,7 @@ class SupabaseDB:
         ))
 
     async def _run(self, func, *args):
-        """Execute the (sync) supabase-py call on the default executor.
+        """Execute the (sync) supabase-py call on the dedicated DB executor.
 
         Historically wrapped in an asyncio.Lock to serialize all DB calls,
         but the underlying postgrest/httpx client is already thread-safe at
@@ -327,7 +512,7 @@ class SupabaseDB:
         last_exc: Optional[BaseException] = None
         for attempt in range(1, attempts + 1):
             try:
-                result = await loop.run_in_executor(None, func, *args)
+                result = await loop.run_in_executor(_get_db_executor(), func, *args)
             except asyncio.CancelledError:
                 raise
             except Exception as exc:
@@ -364,15 +549,14 @@ class SupabaseDB:
             or "schema cache" in lower
         )
 
-    async def create(self, table: str, data: Dict[str, Any], doc_id: Optional[str] = None) -> str:
-        """Insert a row. Returns the generated (or supplied) id."""
+    async def _insert(self, table: str, data: Dict[str, Any], doc_id: Optional[str]) -> Optional[Dict[str, Any]]:
         safe = {k: v for k, v in data.items() if k not in ("created_at", "updated_at")}
         if doc_id:
             safe["id"] = doc_id
 
         def _ins():
             result = self.client.table(table).insert(safe).execute()
-            return str(result.data[0]["id"]) if result.data else None
+            return result.data[0] if result.data else None
 
         try:
             return await self._run(_ins)
@@ -382,10 +566,56 @@ class SupabaseDB:
                 raise RuntimeError(f"Database table '{table}' does not exist. Run migrations first.") from e
             raise
 
+    async def create(self, table: str, data: Dict[str, Any], doc_id: Optional[str] = None) -> str:
+        """Insert a row. Returns the generated (or supplied) id."""
+        row = await self._insert(table, data, doc_id)
+        return str(row["id"]) if row else None
+
+    async def create_returning(
+        self, table: str, data: Dict[str, Any], doc_id: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Insert a row and return it as stored (defaults, triggers applied).
+
+        PostgREST already sends the inserted representation back, so this
+        replaces the ``create()`` + ``get()`` pair with one round-trip.
+        """
+        return await self._insert(table, data, doc_id)
+
+    async def create_many(self, table: str, rows: List[Dict[str, Any]]) -> List[str]:
+        """Insert several rows with one multi-row INSERT per 1000 rows.
+
+        Returns the new ids in input order. Each batch is its own ``_run``
+        call, so a transient-error retry replays only the failed batch and
+        never re-inserts batches that already landed.
+        """
+        safe_rows = [
+            {k: v for k, v in row.items() if k not in ("created_at", "updated_at")}
+            for row in rows
+        ]
+        if not safe_rows:
+            return []
+
+        def _ins_batch(batch: List[Dict[str, Any]]) -> List[str]:
+            result = self.client.table(table).insert(batch).execute()
+            return [str(r["id"]) for r in result.data or []]
+
+        try:
+            ids: List[str] = []
+            for start in range(0, len(safe_rows), _CREATE_MANY_BATCH):
+                ids.extend(await self._run(_ins_batch, safe_rows[start:start + _CREATE_MANY_BATCH]))
+            return ids
+        except Exception as e:
+            if self._is_table_missing_error(e):
+                logger.error("table_missing_on_create_many: table=%s error=%s", table, str(e)[:200])
+                raise RuntimeError(f"Database table '{table}' does not exist. Run migrations first.") from e
+            raise
+
     async def get(self, table: str, doc_id: str) -> Optional[Dict[str, Any]]:
         """Fetch a single row by id."""
+        row_id = str(doc_id)
+
         def _get():
-            result = self.client.table(table).select("*").eq("id", str(doc_id)).limit(1).execute()
+            result = self.client.table(table).select("*").eq("id", row_id).limit(1).execute()
             data = result.data or []
             if isinstance(data, list):
                 return data[0] if data else None
@@ -399,46 +629,70 @@ class SupabaseDB:
                 raise RuntimeError(f"Database table '{table}' does not exist. Run migrations first.") from e
             raise
 
+    async def get_many(
+        self,
+        table: str,
+        ids: List[str],
+        columns: str = "*",
+    ) -> Dict[str, Dict[str, Any]]:
+        """Fetch several rows by id in one round-trip per 100 ids.
+
+        Returns ``{id: row}``; ids with no row are simply absent, so callers
+        can keep their own ordering and skip misses the same way they did
+        with per-id ``get`` calls.
+        """
+        unique = list(dict.fromkeys(str(i) for i in ids if i))
+        if not unique:
+            return {}
+        projection = columns if columns == "*" or "id" in columns.split(",") else f"id,{columns}"
+
+        def _get_many():
+            rows: List[Dict[str, Any]] = []
+            for start in range(0, len(unique), _GET_MANY_BATCH):
+                batch = unique[start:start + _GET_MANY_BATCH]
+                result = self.client.table(table).select(projection).in_("id", batch).execute()
+                rows.extend(result.data or [])
+            return {str(row["id"]): row for row in rows}
+
+        try:
+            return await self._run(_get_many)
+        except Exception as e:
+            if self._is_table_missing_error(e):
+                logger.error("table_missing_on_get_many: table=%s error=%s", table, str(e)[:200])
+                raise RuntimeError(f"Database table '{table}' does not exist. Run migrations first.") from e
+            raise
+
     async def update(self, table: str, doc_id: str, data: Dict[str, Any]) -> bool:
         """Update a row by id. updated_at is handled by DB trigger."""
         safe = {k: v for k, v in data.items() if k not in ("created_at", "updated_at")}
+        row_id = str(doc_id)
 
         def _upd():
-            self.client.table(table).update(safe).eq("id", str(doc_id)).execute()
+            self.client.table(table).update(safe, returning=_RETURN_MINIMAL).eq("id", row_id).execute()
 
         await self._run(_upd)
+        if table == TABLES["users"]:
+            invalidate_user(row_id)
         return True
 
     async def delete(self, table: str, doc_id: str) -> bool:
         """Delete a row by id."""
+        row_id = str(doc_id)
+
         def _del():
-            self.client.table(table).delete().eq("id", str(doc_id)).execute()
+            self.client.table(table).delete(returning=_RETURN_MINIMAL).eq("id", row_id).execute()
 
         await self._run(_del)
+        if table == TABLES["users"]:
+            invalidate_user(row_id)
         return True
 
     async def delete_where(self, table: str, filters: Optional[List[tuple]] = None) -> bool:
         """Delete rows matching the provided filters."""
         def _del_where():
-            q = self.client.table(table).delete()
+            q = self.client.table(table).delete(returning=_RETURN_MINIMAL)
             if filters:
-                for field, op, value in filters:
-                    if op == "==":
-                        q = q.eq(field, value)
-                    elif op == "!=":
-                        q = q.neq(field, value)
-                    elif op == ">":
-                        q = q.gt(field, value)
-                    elif op == ">=":
-                        q = q.gte(field, value)
-                    elif op == "<":
-                        q = q.lt(field, value)
-                    elif op == "<=":
-                        q = q.lte(field, value)
-                    elif op == "in":
-                        q = q.in_(field, value)
-                    else:
-                        q = q.eq(field, value)
+                q = _apply_filters(q, filters)
             q.execute()
 
         try:
@@ -458,31 +712,37 @@ class SupabaseDB:
         order_direction: str = "DESCENDING",
         limit: Optional[int] = None,
         offset: Optional[int] = None,
+        columns: str = "*",
+        after: Optional[Tuple[Any, Any]] = None,
     ) -> List[Dict[str, Any]]:
-        """Query rows with optional filters, ordering, limit, and offset."""
+        """Query rows with optional filters, ordering, limit, and offset.
+
+        ``columns`` is a PostgREST select list; pass a narrow projection for
+        list views so large JSONB/TEXT columns stay on the server.
+
+        ``order_by`` may name several comma-separated columns, all sorted in
+        ``order_direction``. With a two-column order such as
+        ``"created_at,id"``, ``after=(created_at, id)`` keeps only rows that
+        sort strictly after that position — a keyset page that cannot skip
+        rows tied on the first column.
+        """
+        order_cols = [c.strip() for c in order_by.split(",")] if order_by else []
+        if after is not None and len(order_cols) != 2:
+            raise ValueError("after= requires a two-column order_by such as 'created_at,id'")
+
         def _q():
-            q = self.client.table(table).select("*")
+            q = self.client.table(table).select(columns)
             if filters:
-                for field, op, value in filters:
-                    if op == "==":
-                        q = q.eq(field, value)
-                    elif op == "!=":
-                        q = q.neq(field, value)
-                    elif op == ">":
-                        q = q.gt(field, value)
-                    elif op == ">=":
-                        q = q.gte(field, value)
-                    elif op == "<":
-                        q = q.lt(field, value)
-                    elif op == "<=":
-                        q = q.lte(field, value)
-                    elif op == "in":
-                        q = q.in_(field, value)
-                    else:
-                        q = q.eq(field, value)
-            if order_by:
+                q = _apply_filters(q, filters)
+            if order_cols:
                 desc = order_direction == "DESCENDING"
-                q = q.order(order_by, desc=desc)
+                if after is not None:
+                    first, second = order_cols
+                    op = "lt" if desc else "gt"
+                    a, b = after
+                    q = q.or_(f'{first}.{op}."{a}",and({first}.eq."{a}",{second}.{op}."{b}")')
+                for col in order_cols:
+                    q = q.order(col, desc=desc)
             if limit:
                 q = q.limit(limit)
             if offset:
@@ -498,11 +758,44 @@ class SupabaseDB:
                 raise RuntimeError(f"Database table '{table}' does not exist. Run migrations first.") from e
             raise
 
+    async def count(self, table: str, filters: Optional[List[tuple]] = None) -> int:
+        """Count matching rows server-side (``count=exact``) without fetching them."""
+        def _count():
+            q = self.client.table(table).select("id", count="exact")
+            if filters:
+                q = _apply_filters(q, filters)
+            return q.limit(1).execute().count or 0
+
+        try:
+            return await self._run(_count)
+        except Exception as e:
+            if self._is_table_missing_error(e):
+                logger.error("table_missing_on_count: table=%s error=%s", table, str(e)[:200])
+                raise RuntimeError(f"Database table '{table}' does not exist. Run migrations first.") from e
+            raise
+
+    async def rpc(self, fn: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """Call a Postgres function through PostgREST and return its result."""
+        def _rpc():
+            return self.client.rpc(fn, params or {}).execute().data
+
+        return await self._run(_rpc)
+
     # ── User helpers ─────────────────────────────────────────────────────
 
     async def get_user_by_auth_uid(self, uid: str) -> Optional[Dict[str, Any]]:
-        """Get user by Supabase Auth UID (same as users.id)."""
-        return await self.get(TABLES["users"], uid)
+        """Get user by Supabase Auth UID (same as users.id).
+
+        Served from a short-lived per-process cache: every authenticated
+        request resolves the user row, which rarely changes.
+        """
+        cached = _user_cache.get(uid)
+        if cached is not None:
+            return cached
+        user = await self.get(TABLES["users"], uid)
+        if user:
+            _user_cache.put(uid, user)
+        return user
 
     async def get_or_create_user(
         self,
@@ -511,19 +804,40 @@ class SupabaseDB:
         full_name: Optional[str] = None,
         avatar_url: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """Get existing user or create one (usually auto-created by DB trigger)."""
+        """Get existing user or create one (usually auto-created by DB trigger).
+
+        The row almost always exists already, so the fast path is a single
+        read. On a miss the row is inserted with one ``upsert`` that returns
+        the stored representation; ``ignore_duplicates`` keeps a concurrent
+        first request (or the signup trigger) from clobbering ``is_premium``
+        and friends, and only that race costs an extra read.
+        """
         user = await self.get_user_by_auth_uid(uid)
+        if user:
+            return user
+
+        user_data = {
+            "id": uid,
+            "email": email,
+            "full_name": full_name,
+            "avatar_url": avatar_url,
+            "is_active": True,
+            "is_premium": False,
+        }
+
+        def _upsert():
+            result = (
+                self.client.table(TABLES["users"])
+                .upsert(user_data, on_conflict="id", ignore_duplicates=True)
+                .execute()
+            )
+            return result.data[0] if result.data else None
+
+        user = await self._run(_upsert)
         if not user:
-            user_data = {
-                "id": uid,
-                "email": email,
-                "full_name": full_name,
-                "avatar_url": avatar_url,
-                "is_active": True,
-                "is_premium": False,
-            }
-            await self.create(TABLES["users"], user_data, doc_id=uid)
             user = await self.get(TABLES["users"], uid)
+        if user:
+            _user_cache.put(uid, user)
         return user
 
 
@@ -537,10 +851,14 @@ class AuthServiceUnavailable(RuntimeError):
 # Expires entries when the JWT's `exp` claim has passed.
 
 import hashlib  # noqa: E402
+import threading  # noqa: E402
 import time as _time  # noqa: E402
 from collections import OrderedDict  # noqa: E402
 
 _TOKEN_CACHE_MAX_SIZE = 256
+# Upper bound on how long a verification is trusted, even for long-lived
+# tokens — bounds how long a revoked session keeps working.
+_TOKEN_CACHE_TTL_S = 300.0
 _NEGATIVE_CACHE_MAX_SIZE = 512
 _NEGATIVE_CACHE_TTL_S = 60.0  # short — gives revoked/refreshed tokens a chance
 
@@ -551,88 +869,155 @@ class _TokenCache:
     Carries a separate, smaller-TTL *negative* cache so a flood of garbage
     bearer tokens cannot pin the event loop on /auth/v1/user calls or
     repeated PyJWT decode work (S1-F5: closes S-3 DoS amplifier).
+
+    Thread-safe: the sync ``verify_token`` may run in worker threads while
+    ``verify_token_async`` uses the same instance on the event loop.
     """
 
     def __init__(
         self,
         max_size: int = _TOKEN_CACHE_MAX_SIZE,
         *,
+        ttl_s: float = _TOKEN_CACHE_TTL_S,
         negative_max_size: int = _NEGATIVE_CACHE_MAX_SIZE,
         negative_ttl_s: float = _NEGATIVE_CACHE_TTL_S,
     ):
-        self._cache: OrderedDict[str, tuple[dict, float]] = OrderedDict()
+        self._cache: OrderedDict[str, tuple[VerifiedUser, float]] = OrderedDict()
         self._max_size = max_size
+        self._ttl_s = ttl_s
         self._negative: OrderedDict[str, float] = OrderedDict()
         self._negative_max_size = negative_max_size
         self._negative_ttl_s = negative_ttl_s
+        self._lock = threading.Lock()
 
     @staticmethod
     def _key(token: str) -> str:
         return hashlib.sha256(token.encode("utf-8")).hexdigest()[:32]
 
-    def get(self, token: str) -> Optional[Dict[str, Any]]:
+    def get(self, token: str) -> Optional[VerifiedUser]:
         key = self._key(token)
-        entry = self._cache.get(key)
-        if entry is None:
-            return None
-        claims, expires_at = entry
-        if _time.time() >= expires_at:
-            self._cache.pop(key, None)
-            return None
-        # Move to end (most recently used)
-        self._cache.move_to_end(key)
-        return claims
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            claims, expires_at = entry
+            if _time.time() >= expires_at:
+                self._cache.pop(key, None)
+                return None
+            # Move to end (most recently used)
+            self._cache.move_to_end(key)
+            return claims
 
-    def put(self, token: str, claims: Dict[str, Any]) -> None:
+    def put(self, token: str, claims: VerifiedUser) -> None:
         key = self._key(token)
-        # Use JWT exp claim; fall back to 5 minutes
-        exp = claims.get("exp") or (_time.time() + 300)
-        if isinstance(exp, (int, float)):
-            expires_at = float(exp)
-        else:
-            expires_at = _time.time() + 300
-        self._cache[key] = (claims, expires_at)
-        self._cache.move_to_end(key)
-        # Evict oldest if over limit
-        while len(self._cache) > self._max_size:
-            self._cache.popitem(last=False)
-        # A token cannot be both valid and known-bad simultaneously.
-        self._negative.pop(key, None)
+        # Trust the verification for at most ttl_s, and never past the
+        # token's own exp claim.
+        expires_at = _time.time() + self._ttl_s
+        exp = claims.exp
+        if isinstance(exp, (int, float)) and not isinstance(exp, bool):
+            expires_at = min(expires_at, float(exp))
+        with self._lock:
+            self._cache[key] = (claims, expires_at)
+            self._cache.move_to_end(key)
+            # Evict oldest if over limit
+            while len(self._cache) > self._max_size:
+                self._cache.popitem(last=False)
+            # A token cannot be both valid and known-bad simultaneously.
+            self._negative.pop(key, None)
 
     def is_known_bad(self, token: str) -> bool:
         """Return True if *token* failed verification recently (< TTL)."""
         key = self._key(token)
-        expires_at = self._negative.get(key)
-        if expires_at is None:
-            return False
-        if _time.time() >= expires_at:
-            self._negative.pop(key, None)
-            return False
-        self._negative.move_to_end(key)
-        return True
+        with self._lock:
+            expires_at = self._negative.get(key)
+            if expires_at is None:
+                return False
+            if _time.time() >= expires_at:
+                self._negative.pop(key, None)
+                return False
+            self._negative.move_to_end(key)
+            return True
 
     def mark_bad(self, token: str) -> None:
         """Remember that *token* failed verification — short TTL."""
         key = self._key(token)
-        self._negative[key] = _time.time() + self._negative_ttl_s
-        self._negative.move_to_end(key)
-        while len(self._negative) > self._negative_max_size:
-            self._negative.popitem(last=False)
+        with self._lock:
+            self._negative[key] = _time.time() + self._negative_ttl_s
+            self._negative.move_to_end(key)
+            while len(self._negative) > self._negative_max_size:
+                self._negative.popitem(last=False)
 
     def invalidate(self, token: str) -> None:
         key = self._key(token)
-        self._cache.pop(key, None)
-        self._negative.pop(key, None)
+        with self._lock:
+            self._cache.pop(key, None)
+            self._negative.pop(key, None)
 
     def clear(self) -> None:
-        self._cache.clear()
-        self._negative.clear()
+        with self._lock:
+            self._cache.clear()
+            self._negative.clear()
 
 
 _token_cache = _TokenCache()
 
 
-async def verify_token_async(id_token: str, db: Optional[SupabaseDB] = None) -> Optional[Dict[str, Any]]:
+# ── User row cache ───────────────────────────────────────────────────────────
+# get_or_create_user runs on every authenticated request; the users row is
+# nearly immutable within a session. Writes through SupabaseDB.update/delete
+# invalidate locally; other workers see a change within the TTL.
+
+_USER_CACHE_MAX_SIZE = 5000
+_USER_CACHE_TTL_S = 60.0
+
+
+class _UserRowCache:
+    """LRU + TTL cache of ``users`` rows keyed by user id."""
+
+    def __init__(self, max_size: int = _USER_CACHE_MAX_SIZE, *, ttl_s: float = _USER_CACHE_TTL_S):
+        self._cache: OrderedDict[str, tuple[Dict[str, Any], float]] = OrderedDict()
+        self._max_size = max_size
+        self._ttl_s = ttl_s
+        self._lock = threading.Lock()
+
+    def get(self, uid: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._cache.get(uid)
+            if entry is None:
+                return None
+            row, expires_at = entry
+            if _time.time() >= expires_at:
+                self._cache.pop(uid, None)
+                return None
+            self._cache.move_to_end(uid)
+        # Callers get their own dict so a mutation can't leak into the cache.
+        return dict(row)
+
+    def put(self, uid: str, row: Dict[str, Any]) -> None:
+        with self._lock:
+            self._cache[uid] = (dict(row), _time.time() + self._ttl_s)
+            self._cache.move_to_end(uid)
+            while len(self._cache) > self._max_size:
+                self._cache.popitem(last=False)
+
+    def invalidate(self, uid: str) -> None:
+        with self._lock:
+            self._cache.pop(uid, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+_user_cache = _UserRowCache()
+
+
+def invalidate_user(uid: str) -> None:
+    """Drop the cached ``users`` row for *uid* (after writes that bypass SupabaseDB)."""
+    _user_cache.invalidate(str(uid))
+
+
+async def verify_token_async(id_token: str, db: Optional[SupabaseDB] = None) -> Optional[VerifiedUser]:
     """
     Verify a Supabase access token.
     0. Check LRU cache for previously verified token.
@@ -663,28 +1048,14 @@ async def verify_token_async(id_token: str, db: Optional[SupabaseDB] = None) ->
             alg = ""
 
         if alg == "HS256":
-            # Try 1: raw secret string
-            try:
-                result = _decode_jwt_with_secret(id_token, jwt_secret)
-                if result is not None:
-                    _token_cache.put(id_token, result)
-                    return result
-            except jwt.ExpiredSignatureError:
-                _token_cache.mark_bad(id_token)
-                return None
-
-            # Try 2: base64-decoded bytes
             try:
-                secret_bytes = base64.b64decode(jwt_secret)
-                result = _decode_jwt_with_secret(id_token, secret_bytes)
-                if result is not None:
-                    _token_cache.put(id_token, result)
-                    return result
+                result = _verify_hs256_locally(id_token, jwt_secret)
             except jwt.ExpiredSignatureError:
                 _token_cache.mark_bad(id_token)
                 return None
-            except Exception as e:
-                logger.warning("token_verification_b64_failed", extra={"error": str(e)})
+            if result is not None:
+                _token_cache.put(id_token, result)
+                return result
 
     # ── 2. Async remote verification (runs in thread, never blocks loop) ──
     _db = db or get_db()
@@ -700,20 +1071,12 @@ async def verify_token_async(id_token: str, db: Optional[SupabaseDB] = None) ->
         # negative cache — the token may be valid; the dependency was sick.
         if SupabaseDB._is_transient_error(exc):
             raise AuthServiceUnavailable("Supabase auth verification timed out") from exc
-        logger.warning("token_verification_failed_async", extra={"error": str(exc)})
+        logger.warning("token_verification_failed_async: %s", str(exc)[:200])
         _token_cache.mark_bad(id_token)
         return None
 
     if response and getattr(response, "user", None):
-        user = response.user
-        meta = user.user_metadata or {}
-        claims = {
-            "sub": str(user.id),
-            "email": user.email,
-            "user_metadata": meta,
-            "aud": "authenticated",
-            "role": "authenticated",
-        }
+        claims = _verified_remote_user(response.user, id_token)
         _token_cache.put(id_token, claims)
         return claims
     # Remote returned no user → token is bad. Cache the rejection.
@@ -734,27 +1097,40 @@ _db_instance: Optional[SupabaseDB] = None
 
 
 def get_db() -> SupabaseDB:
-    """Get SupabaseDB singleton."""
-    global _db_instance
-    if _db_instance is None:
-        _db_instance = SupabaseDB()
-    return _db_instance
+    """Get SupabaseDB singleton.
+
+    Bound by init_supabase() at startup; the lazy path only serves scripts,
+    tests and freshly forked children.
+    """
+    db = _db_instance
+    if db is None:
+        init_supabase()
+        db = _db_instance
+    return db
 
 
-def get_firestore_db() -> SupabaseDB:
-    """Backward-compat alias for get_db()."""
-    return get_db()
+def _reset_clients_after_fork() -> None:
+    """Drop inherited client singletons in a forked child.
 
+    A child forked after the parent touched Supabase (gunicorn --preload,
+    multiprocessing "fork" pools) would otherwise share the parent's httpx
+    connection-pool sockets, interleaving bytes on the same TCP streams.
+    The next get_supabase()/get_db() in the child builds fresh clients.
+    The DB executor goes too: its worker threads did not survive the fork.
+    """
+    global _supabase_client, _db_instance, _db_executor
+    _supabase_client = None
+    _db_instance = None
+    _db_executor = None
 
-def get_firebase_user(uid: str) -> Optional[Dict[str, Any]]:
-    """Backward-compat stub — not used with Supabase."""
-    return None
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_clients_after_fork)
 
 
-# Keep init_firebase as alias so main.py lifespan doesn't break during migration
-def init_firebase():
-    """Alias — initialises Supabase instead."""
-    init_supabase()
+def get_firestore_db() -> SupabaseDB:
+    """Backward-compat alias for get_db()."""
+    return get_db()
 
 
 # ── Redis response cache ─────────────────────────────────────────────────────
@@ -10,10 +10,17 @@ Two pure functions are exported so they can be unit-tested in isolation:
 Both target the same key list (`SENSITIVE_KEYS`) and use the same
 matching rule (case-insensitive substring match against dict keys),
 so a developer who adds a new key type only has to extend one constant.
+
+`install_queue_logging()` moves stdlib log I/O off the request path.
 """
 from __future__ import annotations
 
-from typing import Any, Mapping, MutableMapping
+import atexit
+import logging
+import logging.handlers
+import queue
+import sys
+from typing import Any, Mapping, MutableMapping, Optional
 
 REDACTED = "[REDACTED]"
 
@@ -122,3 +129,31 @@ def sentry_before_send(
         # Never let a bug in the scrubber prevent error reporting.
         return event
     return event
+
+
+def install_queue_logging() -> Optional[logging.handlers.QueueListener]:
+    """Route root-logger output through a queue drained by a background thread.
+
+    structlog renders through stdlib logging, so every warning on the
+    request path (failed token checks under credential probing, Supabase
+    retries) otherwise does a blocking stderr write on the event loop.
+    With this installed the caller only enqueues the record.
+
+    Only applies when the root logger has no handlers (the production
+    default, where records would fall through to ``logging.lastResort``);
+    an explicitly configured root logger (test harness, custom log config)
+    is left alone. Levels are untouched, so output is the same as before.
+    The listener is flushed at interpreter exit. Returns the started
+    listener, or None when nothing was installed.
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return None
+    stderr_handler = logging.StreamHandler(sys.stderr)
+    stderr_handler.setFormatter(logging.Formatter("%(message)s"))
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(log_queue, stderr_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
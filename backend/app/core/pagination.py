@@ -0,0 +1,36 @@
+"""
+Keyset cursors for newest-first list endpoints.
+
+A page boundary is the last row's ``(created_at, id)`` pair. ``created_at``
+alone is not unique — ``now()`` is the transaction timestamp, so every row a
+single statement inserts shares it — and a timestamp-only cursor silently
+skips the rest of a tie on the next page. ``id`` breaks the tie.
+
+The cursor travels as ``"<created_at>|<id>"``. A bare timestamp (cursors
+issued before the id was added) is still accepted and pages by timestamp
+alone.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, Optional, Tuple
+
+CURSOR_SEPARATOR = "|"
+
+# Timestamp, optionally followed by "|<uuid>". Cursor values are spliced into
+# a PostgREST filter expression, so quotes, commas and parentheses are refused.
+CURSOR_PATTERN = r"^[0-9T:.+\- ]+(\|[0-9a-fA-F-]+)?$"
+
+
+def encode_cursor(row: Dict[str, Any], field: str = "created_at") -> Optional[str]:
+    """Cursor pointing just past *row*, or None if it has no *field* value."""
+    value = row.get(field)
+    if not value:
+        return None
+    row_id = row.get("id")
+    return f"{value}{CURSOR_SEPARATOR}{row_id}" if row_id is not None else str(value)
+
+
+def decode_cursor(cursor: str) -> Tuple[str, Optional[str]]:
+    """Split a cursor into ``(created_at, id)``; ``id`` is None for legacy cursors."""
+    value, sep, row_id = cursor.partition(CURSOR_SEPARATOR)
+    return value, (row_id or None) if sep else None
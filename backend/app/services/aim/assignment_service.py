@@ -3,7 +3,6 @@ AIM \u2014 AssignmentService: CRUD + analyze (Parser+Recon) orchestration.
 """
 from __future__ import annotations
 
-from datetime import datetime, timezone
 from typing import Any, Optional
 
 from app.core.database import SupabaseDB, TABLES, get_db
@@ -50,7 +49,7 @@ class AIMAssignmentService:
         await self.db.update(
             TABLES["aim_assignments"],
             assignment_id,
-            {"status": status_value, "updated_at": datetime.now(timezone.utc).isoformat()},
+            {"status": status_value},
         )
 
     async def delete(self, user_id: str, assignment_id: str) -> bool:
@@ -145,7 +144,6 @@ class AIMAssignmentService:
             },
             "recon_report": recon,
             "recon_version": (existing[0].get("recon_version", 0) + 1) if existing else 1,
-            "updated_at": datetime.now(timezone.utc).isoformat(),
         }
         if existing:
             await self.db.update(
@@ -164,8 +162,8 @@ class AIMAssignmentService:
         )
         if existing:
             return
-        for sec in recon.get("structure") or []:
-            row = {
+        rows = [
+            {
                 "assignment_id": assignment_id,
                 "user_id": user_id,
                 "title": sec.get("title", "Section"),
@@ -175,7 +173,10 @@ class AIMAssignmentService:
                 "key_argument": sec.get("key_argument"),
                 "rubric_links": sec.get("rubric_links") or [],
             }
-            await self.db.create(TABLES["aim_sections"], row)
+            for sec in recon.get("structure") or []
+        ]
+        if rows:
+            await self.db.create_many(TABLES["aim_sections"], rows)
 
     async def get_analysis(self, assignment_id: str) -> Optional[dict[str, Any]]:
         rows = await self.db.query(
@@ -119,9 +119,10 @@ class AIMDeadlineService:
         if not assignment or assignment.get("user_id") != user_id:
             raise PermissionError("assignment not found")
 
-        existing = await self.list_tasks(user_id, assignment_id)
-        for row in existing:
-            await self.db.delete("aim_tasks", row["id"])
+        await self.db.delete_where(
+            "aim_tasks",
+            filters=[("user_id", "==", user_id), ("assignment_id", "==", assignment_id)],
+        )
 
         sections = await self.db.query(
             "aim_sections",
@@ -130,12 +131,12 @@ class AIMDeadlineService:
             order_direction="ASCENDING",
         )
         plan = _build_plan(deadline, sections or [])
-        created: list[dict[str, Any]] = []
-        for task in plan:
-            row = {**task, "user_id": user_id, "assignment_id": assignment_id, "status": "pending"}
-            new_id = await self.db.create("aim_tasks", row)
-            created.append({**row, "id": new_id})
-        return created
+        rows = [
+            {**task, "user_id": user_id, "assignment_id": assignment_id, "status": "pending"}
+            for task in plan
+        ]
+        new_ids = await self.db.create_many("aim_tasks", rows)
+        return [{**row, "id": new_id} for row, new_id in zip(rows, new_ids)]
 
     async def update_status(
         self, user_id: str, task_id: str, status: str
@@ -77,7 +77,7 @@ class AIMQuotaService:
         await self.db.update(
             TABLES["aim_usage"],
             usage["id"],
-            {field: new_val, "updated_at": datetime.now(timezone.utc).isoformat()},
+            {field: new_val},
         )
 
     async def record_assignment_created(self, user_id: str) -> None:
@@ -2,13 +2,29 @@
 Analytics Service
 Handles analytics and tracking with Supabase
 """
+import asyncio
 from typing import List, Dict, Any, Optional
 import structlog
 
+from app.core.cache import cache_get, cache_set
 from app.core.database import get_db, TABLES, SupabaseDB
+from app.services.analytics_buffer import get_analytics_buffer
 
 logger = structlog.get_logger()
 
+# Dashboard and progress are polled on every page load. They aggregate rows
+# that dozens of services write, so instead of invalidating from each writer
+# the cached result simply expires quickly.
+SUMMARY_CACHE_TTL_S = 10
+
+
+def _dashboard_cache_key(user_id: str) -> str:
+    return f"analytics:dashboard:{user_id}"
+
+
+def _progress_cache_key(user_id: str) -> str:
+    return f"analytics:progress:{user_id}"
+
 
 class AnalyticsService:
     """Service for analytics operations using Supabase."""
@@ -24,7 +40,11 @@ class AnalyticsService:
         entity_type: Optional[str] = None,
         entity_id: Optional[str] = None,
     ) -> None:
-        """Track an analytics event."""
+        """Track an analytics event.
+
+        Queued for a batched background write when the app's analytics
+        buffer is running; written directly otherwise (scripts, tests).
+        """
         record = {
             "user_id": user_id,
             "event_type": event_type,
@@ -32,74 +52,68 @@ class AnalyticsService:
             "entity_type": entity_type,
             "entity_id": entity_id,
         }
+        buffer = get_analytics_buffer()
+        if buffer is not None and buffer.running:
+            buffer.enqueue(record)
+            return
         await self.db.create(TABLES["analytics"], record)
 
     async def get_dashboard(self, user_id: str) -> Dict[str, Any]:
-        """Get dashboard analytics — counts across collections."""
-        applications = await self.db.query(TABLES["applications"], filters=[("user_id", "==", user_id)], limit=100)
-        profiles = await self.db.query(TABLES["profiles"], filters=[("user_id", "==", user_id)], limit=100)
-        jobs = await self.db.query(TABLES["jobs"], filters=[("user_id", "==", user_id)], limit=100)
-        evidence = await self.db.query(TABLES["evidence"], filters=[("user_id", "==", user_id)], limit=100)
-        tasks = await self.db.query(TABLES["tasks"], filters=[("user_id", "==", user_id)], limit=200)
-
-        completed_tasks = [t for t in tasks if t.get("status") in ("done", "skipped")]
-        active_apps = [a for a in applications if a.get("status") != "archived"]
-
-        # Latest overall score from applications
-        latest_score = None
-        for app in sorted(applications, key=lambda a: a.get("updated_at", ""), reverse=True):
-            scores = app.get("scores") or {}
-            if scores.get("overall"):
-                latest_score = scores["overall"]
-                break
-
-        # Additional feature stats (non-blocking)
-        ats_count = 0
-        salary_count = 0
-        interview_count = 0
+        """Get dashboard analytics — counts across collections.
+
+        Every count and the latest score come from the ``dashboard_counts``
+        Postgres function in one statement; the streak is fetched alongside
+        it, so the endpoint costs one round-trip of latency. Results are
+        cached per user for SUMMARY_CACHE_TTL_S.
+        """
+        cache_key = _dashboard_cache_key(user_id)
+        cached = await cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        counts, streaks = await asyncio.gather(
+            self.db.rpc("dashboard_counts", {"p_user_id": user_id}),
+            self.db.query(TABLES["learning_streaks"], filters=[("user_id", "==", user_id)], limit=1),
+            return_exceptions=True,
+        )
+        # Counts and scores are the dashboard; surface their failure as before.
+        if isinstance(counts, BaseException):
+            raise counts
+        counts = counts or {}
+
         learning_streak = 0
-        try:
-            ats_scans = await self.db.query(TABLES["ats_scans"], filters=[("user_id", "==", user_id)], limit=100)
-            ats_count = len(ats_scans)
-        except Exception:
-            logger.warning("analytics_ats_query_failed", user_id=user_id)
-        try:
-            salary_items = await self.db.query(TABLES["salary_analyses"], filters=[("user_id", "==", user_id)], limit=100)
-            salary_count = len(salary_items)
-        except Exception:
-            logger.warning("analytics_salary_query_failed", user_id=user_id)
-        try:
-            sessions = await self.db.query(TABLES["interview_sessions"], filters=[("user_id", "==", user_id)], limit=100)
-            interview_count = len(sessions)
-        except Exception:
-            logger.warning("analytics_interview_query_failed", user_id=user_id)
-        try:
-            streaks = await self.db.query(TABLES["learning_streaks"], filters=[("user_id", "==", user_id)], limit=1)
-            if streaks:
-                learning_streak = streaks[0].get("current_streak", 0)
-        except Exception:
+        if isinstance(streaks, BaseException):
             logger.warning("analytics_learning_query_failed", user_id=user_id)
-
-        return {
-            "applications": len(applications),
-            "active_applications": len(active_apps),
-            "profiles": len(profiles),
-            "jobs_analyzed": len(jobs),
-            "evidence_items": len(evidence),
-            "total_tasks": len(tasks),
-            "completed_tasks": len(completed_tasks),
-            "latest_score": latest_score,
-            "ats_scans": ats_count,
-            "salary_analyses": salary_count,
-            "interview_sessions": interview_count,
+        elif streaks:
+            learning_streak = streaks[0].get("current_streak", 0)
+
+        n_apps = counts.get("applications", 0)
+        n_profiles = counts.get("profiles", 0)
+        n_evidence = counts.get("evidence", 0)
+        n_tasks = counts.get("tasks", 0)
+        n_completed = counts.get("completed_tasks", 0)
+        dashboard = {
+            "applications": n_apps,
+            "active_applications": counts.get("active_applications", 0),
+            "profiles": n_profiles,
+            "jobs_analyzed": counts.get("jobs", 0),
+            "evidence_items": n_evidence,
+            "total_tasks": n_tasks,
+            "completed_tasks": n_completed,
+            "latest_score": counts.get("latest_score"),
+            "ats_scans": counts.get("ats_scans", 0),
+            "salary_analyses": counts.get("salary_analyses", 0),
+            "interview_sessions": counts.get("interview_sessions", 0),
             "learning_streak": learning_streak,
             "summary": {
-                "has_profile": len(profiles) > 0,
-                "has_application": len(applications) > 0,
-                "has_evidence": len(evidence) > 0,
-                "task_completion_rate": round(len(completed_tasks) / max(len(tasks), 1) * 100, 1),
+                "has_profile": n_profiles > 0,
+                "has_application": n_apps > 0,
+                "has_evidence": n_evidence > 0,
+                "task_completion_rate": round(n_completed / max(n_tasks, 1) * 100, 1),
             },
         }
+        await cache_set(cache_key, dashboard, ttl=SUMMARY_CACHE_TTL_S)
+        return dashboard
 
     async def get_recent_activity(self, user_id: str, limit: int = 50) -> List[Dict[str, Any]]:
         """Get recent analytics events."""
@@ -113,34 +127,38 @@ class AnalyticsService:
         return events
 
     async def get_progress(self, user_id: str) -> Dict[str, Any]:
-        """Get user progress across applications."""
-        applications = await self.db.query(
-            TABLES["applications"],
-            filters=[("user_id", "==", user_id)],
-            order_by="created_at",
-            order_direction="ASCENDING",
-        )
-        if not applications:
+        """Get user progress across applications.
+
+        Aggregated in Postgres by ``application_score_progress``; only the
+        summary row is transferred, not the applications. Results are cached
+        per user for SUMMARY_CACHE_TTL_S.
+        """
+        cache_key = _progress_cache_key(user_id)
+        cached = await cache_get(cache_key)
+        if cached is not None:
+            return cached
+        progress = await self._compute_progress(user_id)
+        await cache_set(cache_key, progress, ttl=SUMMARY_CACHE_TTL_S)
+        return progress
+
+    async def _compute_progress(self, user_id: str) -> Dict[str, Any]:
+        stats = await self.db.rpc("application_score_progress", {"p_user_id": user_id}) or {}
+        if not stats.get("total"):
             return {"has_data": False, "message": "No applications yet."}
 
-        scores = []
-        for app in applications:
-            app_scores = app.get("scores") or {}
-            overall = app_scores.get("overall")
-            if overall is not None:
-                scores.append(overall)
-
-        if not scores:
+        scored = stats.get("scored") or 0
+        if not scored:
             return {"has_data": False, "message": "No scored applications yet."}
 
+        first, latest = stats["first"], stats["latest"]
         return {
             "has_data": True,
-            "total_applications": len(applications),
-            "scored_applications": len(scores),
-            "average_score": round(sum(scores) / len(scores), 1),
-            "best_score": max(scores),
-            "latest_score": scores[-1],
-            "improvement": round(scores[-1] - scores[0], 1) if len(scores) > 1 else 0,
+            "total_applications": stats["total"],
+            "scored_applications": scored,
+            "average_score": round(float(stats["average"]), 1),
+            "best_score": stats["best"],
+            "latest_score": latest,
+            "improvement": round(latest - first, 1) if scored > 1 else 0,
         }
 
     async def get_application_stats(self, user_id: str) -> Dict[str, Any]:
@@ -0,0 +1,139 @@
+"""
+AnalyticsEventBuffer — batches analytics inserts off the request path.
+
+Why this exists:
+  /analytics/track awaited one PostgREST INSERT per event, so chatty
+  clients paid a full round-trip per click and the analytics table saw a
+  write per event. Events are now queued in memory and a background task
+  writes them with ``SupabaseDB.create_many`` — every FLUSH_INTERVAL_S, or
+  sooner once MAX_BATCH events are waiting.
+
+Analytics are best-effort: when the queue is full the event is dropped
+(and logged) instead of stalling the request. Whatever is queued at
+shutdown is flushed before the DB client is released.
+"""
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, List, Optional
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+# Tunables — exported for the buffer tests.
+MAX_BATCH = 500
+FLUSH_INTERVAL_S = 1.0
+MAX_QUEUE = 10_000
+STOP_TIMEOUT_S = 10.0
+
+
+class AnalyticsEventBuffer:
+    """Background task that flushes queued analytics rows in batches."""
+
+    def __init__(
+        self,
+        db: Any,
+        table: str,
+        *,
+        max_batch: int = MAX_BATCH,
+        flush_interval_s: float = FLUSH_INTERVAL_S,
+        max_queue: int = MAX_QUEUE,
+    ) -> None:
+        self._db = db
+        self._table = table
+        self._max_batch = max(1, int(max_batch))
+        self._interval = max(0.01, float(flush_interval_s))
+        self._queue: asyncio.Queue[Dict[str, Any]] = asyncio.Queue(maxsize=max_queue)
+        self._wake = asyncio.Event()
+        self._stopping = False
+        self._task: Optional[asyncio.Task[None]] = None
+
+    # ── lifecycle ────────────────────────────────────────────────────
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done() and not self._stopping
+
+    def start(self) -> asyncio.Task[None]:
+        if self._task and not self._task.done():
+            return self._task
+        self._stopping = False
+        self._task = asyncio.create_task(self._run(), name="analytics-flusher")
+        logger.info("analytics_buffer.started",
+                    max_batch=self._max_batch, interval_s=self._interval)
+        return self._task
+
+    async def stop(self) -> None:
+        """Stop the flusher after writing everything still queued."""
+        self._stopping = True
+        self._wake.set()
+        if self._task and not self._task.done():
+            try:
+                await asyncio.wait_for(self._task, timeout=STOP_TIMEOUT_S)
+            except (asyncio.TimeoutError, asyncio.CancelledError, Exception):
+                pass
+
+    # ── producer side ────────────────────────────────────────────────
+
+    def enqueue(self, record: Dict[str, Any]) -> bool:
+        """Queue *record* for the next flush. Returns False if it was dropped."""
+        try:
+            self._queue.put_nowait(record)
+        except asyncio.QueueFull:
+            logger.warning("analytics_buffer.dropped",
+                           event_type=record.get("event_type"),
+                           queued=self._queue.qsize())
+            return False
+        if self._queue.qsize() >= self._max_batch:
+            self._wake.set()
+        return True
+
+    # ── flush loop ───────────────────────────────────────────────────
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self._interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            try:
+                await self.flush()
+            except asyncio.CancelledError:
+                break
+            except Exception as ex:
+                logger.warning("analytics_buffer.tick_failed", error=str(ex)[:200])
+        await self.flush()
+
+    async def flush(self) -> int:
+        """Write every queued event, MAX_BATCH rows per INSERT. Returns rows written."""
+        written = 0
+        while not self._queue.empty():
+            batch: List[Dict[str, Any]] = []
+            while len(batch) < self._max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            try:
+                await self._db.create_many(self._table, batch)
+                written += len(batch)
+            except Exception as ex:
+                logger.warning("analytics_buffer.flush_failed",
+                               dropped=len(batch), error=str(ex)[:200])
+        return written
+
+
+_buffer: Optional[AnalyticsEventBuffer] = None
+
+
+def start_analytics_buffer(db: Any, table: str) -> AnalyticsEventBuffer:
+    """Create (once) and start the process-wide buffer."""
+    global _buffer
+    if _buffer is None:
+        _buffer = AnalyticsEventBuffer(db, table)
+    _buffer.start()
+    return _buffer
+
+
+def get_analytics_buffer() -> Optional[AnalyticsEventBuffer]:
+    return _buffer
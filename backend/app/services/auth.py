@@ -6,7 +6,7 @@ This service manages user data in PostgreSQL via PostgREST.
 """
 from typing import Optional, Dict, Any
 
-from app.core.database import verify_token, get_db, TABLES, SupabaseDB
+from app.core.database import verify_token, get_db, TABLES, SupabaseDB, VerifiedUser
 
 
 class AuthService:
@@ -67,6 +67,6 @@ class AuthService:
         """Deactivate a user account."""
         await self.db.update(TABLES['users'], user_id, {'is_active': False})
 
-    def verify_token(self, token: str) -> Optional[Dict[str, Any]]:
+    def verify_token(self, token: str) -> Optional[VerifiedUser]:
         """Verify Supabase access token."""
         return verify_token(token)
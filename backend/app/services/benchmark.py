@@ -70,9 +70,9 @@ class BenchmarkService:
             "status": "generated",
         }
 
-        doc_id = await self.db.create(COLLECTIONS["benchmarks"], record)
-        logger.info("benchmark_generated", benchmark_id=doc_id, job_id=job_id)
-        return await self.db.get(COLLECTIONS["benchmarks"], doc_id)
+        created = await self.db.create_returning(COLLECTIONS["benchmarks"], record)
+        logger.info("benchmark_generated", benchmark_id=created["id"], job_id=job_id)
+        return created
 
     async def get_benchmark(self, benchmark_id: str, user_id: str) -> Optional[Dict[str, Any]]:
         """Get a specific benchmark, verifying ownership via linked job."""
@@ -13,6 +13,7 @@ Outcome Tracking Engine:
 """
 from typing import Optional, Dict, Any, List
 from datetime import date, datetime, timezone
+import asyncio
 import structlog
 
 from app.core.database import get_db, TABLES, SupabaseDB
@@ -39,31 +40,30 @@ class CareerAnalyticsService:
         if existing:
             return existing[0]
 
-        # Gather current scores
-        gap_reports = await self.db.query(
-            TABLES["gap_reports"],
-            filters=[("user_id", "==", user_id)],
-            order_by="created_at",
-            order_direction="DESCENDING",
-            limit=5,
-        )
-
-        applications = await self.db.query(
-            TABLES["applications"],
-            filters=[("user_id", "==", user_id)],
-        )
-
-        interviews = await self.db.query(
-            TABLES["interview_sessions"],
-            filters=[("user_id", "==", user_id), ("status", "==", "completed")],
-        )
-
-        ats_scans = await self.db.query(
-            TABLES["ats_scans"],
-            filters=[("user_id", "==", user_id)],
-            order_by="created_at",
-            order_direction="DESCENDING",
-            limit=10,
+        # Gather current scores — independent reads, so fan them out
+        gap_reports, applications, interviews, ats_scans = await asyncio.gather(
+            self.db.query(
+                TABLES["gap_reports"],
+                filters=[("user_id", "==", user_id)],
+                order_by="created_at",
+                order_direction="DESCENDING",
+                limit=5,
+            ),
+            self.db.query(
+                TABLES["applications"],
+                filters=[("user_id", "==", user_id)],
+            ),
+            self.db.query(
+                TABLES["interview_sessions"],
+                filters=[("user_id", "==", user_id), ("status", "==", "completed")],
+            ),
+            self.db.query(
+                TABLES["ats_scans"],
+                filters=[("user_id", "==", user_id)],
+                order_by="created_at",
+                order_direction="DESCENDING",
+                limit=10,
+            ),
         )
 
         # Compute averages
@@ -105,26 +105,27 @@ class CareerAnalyticsService:
 
     async def get_portfolio_summary(self, user_id: str) -> Dict[str, Any]:
         """Generate a comprehensive career portfolio summary."""
-        applications = await self.db.query(
-            TABLES["applications"],
-            filters=[("user_id", "==", user_id)],
-        )
-        interviews = await self.db.query(
-            TABLES["interview_sessions"],
-            filters=[("user_id", "==", user_id), ("status", "==", "completed")],
-        )
-        evidence = await self.db.query(
-            TABLES["evidence"],
-            filters=[("user_id", "==", user_id)],
-        )
-        streaks = await self.db.query(
-            TABLES["learning_streaks"],
-            filters=[("user_id", "==", user_id)],
-            limit=1,
+        applications, interviews, evidence, streaks, timeline = await asyncio.gather(
+            self.db.query(
+                TABLES["applications"],
+                filters=[("user_id", "==", user_id)],
+            ),
+            self.db.query(
+                TABLES["interview_sessions"],
+                filters=[("user_id", "==", user_id), ("status", "==", "completed")],
+            ),
+            self.db.query(
+                TABLES["evidence"],
+                filters=[("user_id", "==", user_id)],
+            ),
+            self.db.query(
+                TABLES["learning_streaks"],
+                filters=[("user_id", "==", user_id)],
+                limit=1,
+            ),
+            self.get_timeline(user_id, days=90),
         )
 
-        timeline = await self.get_timeline(user_id, days=90)
-
         # Compute score trends
         if len(timeline) >= 2:
             first = timeline[0].get("overall_score") or 0
@@ -459,15 +460,16 @@ class SelfTuningEngine:
 
         Returns a recommendation dict with confidence level.
         """
-        # Gather outcome signals
-        signals = await self.db.query(
-            TABLES["outcome_signals"],
-            filters=[("user_id", "==", user_id)],
-        )
-        # Gather telemetry
-        telemetry = await self.db.query(
-            TABLES["pipeline_telemetry"],
-            filters=[("user_id", "==", user_id)],
+        # Gather outcome signals and telemetry
+        signals, telemetry = await asyncio.gather(
+            self.db.query(
+                TABLES["outcome_signals"],
+                filters=[("user_id", "==", user_id)],
+            ),
+            self.db.query(
+                TABLES["pipeline_telemetry"],
+                filters=[("user_id", "==", user_id)],
+            ),
         )
 
         if len(signals) < 3 or len(telemetry) < 3:
@@ -685,17 +687,19 @@ class PipelineHealthMonitor:
         recent_cutoff = (date.today() - timedelta(days=7)).isoformat()
         baseline_cutoff = (date.today() - timedelta(days=30)).isoformat()
 
-        recent = await self.db.query(
-            TABLES["pipeline_telemetry"],
-            filters=[("user_id", "==", user_id), ("created_at", ">=", recent_cutoff)],
-        )
-        baseline = await self.db.query(
-            TABLES["pipeline_telemetry"],
-            filters=[
-                ("user_id", "==", user_id),
-                ("created_at", ">=", baseline_cutoff),
-                ("created_at", "<", recent_cutoff),
-            ],
+        recent, baseline = await asyncio.gather(
+            self.db.query(
+                TABLES["pipeline_telemetry"],
+                filters=[("user_id", "==", user_id), ("created_at", ">=", recent_cutoff)],
+            ),
+            self.db.query(
+                TABLES["pipeline_telemetry"],
+                filters=[
+                    ("user_id", "==", user_id),
+                    ("created_at", ">=", baseline_cutoff),
+                    ("created_at", "<", recent_cutoff),
+                ],
+            ),
         )
 
         alerts: List[Dict[str, Any]] = []
@@ -890,32 +894,23 @@ class PredictiveCareerForecaster:
         recent_cutoff = (now - timedelta(days=14)).isoformat()
         older_cutoff = (now - timedelta(days=30)).isoformat()
 
-        # Recent vs older applications
-        recent_apps = await self.db.query(
-            TABLES["applications"],
-            filters=[("user_id", "==", user_id), ("created_at", ">=", recent_cutoff)],
-        )
-        older_apps = await self.db.query(
-            TABLES["applications"],
-            filters=[
-                ("user_id", "==", user_id),
-                ("created_at", ">=", older_cutoff),
-                ("created_at", "<", recent_cutoff),
-            ],
-        )
-
-        # Recent vs older outcomes
-        recent_signals = await self.db.query(
-            TABLES["outcome_signals"],
-            filters=[("user_id", "==", user_id), ("created_at", ">=", recent_cutoff)],
-        )
-        older_signals = await self.db.query(
-            TABLES["outcome_signals"],
-            filters=[
-                ("user_id", "==", user_id),
-                ("created_at", ">=", older_cutoff),
-                ("created_at", "<", recent_cutoff),
-            ],
+        # Recent vs older applications and outcomes
+        older_window = [
+            ("user_id", "==", user_id),
+            ("created_at", ">=", older_cutoff),
+            ("created_at", "<", recent_cutoff),
+        ]
+        recent_apps, older_apps, recent_signals, older_signals = await asyncio.gather(
+            self.db.query(
+                TABLES["applications"],
+                filters=[("user_id", "==", user_id), ("created_at", ">=", recent_cutoff)],
+            ),
+            self.db.query(TABLES["applications"], filters=older_window),
+            self.db.query(
+                TABLES["outcome_signals"],
+                filters=[("user_id", "==", user_id), ("created_at", ">=", recent_cutoff)],
+            ),
+            self.db.query(TABLES["outcome_signals"], filters=older_window),
         )
 
         # Score components (each 0-20, total 0-100)
@@ -930,15 +925,33 @@ class PredictiveCareerForecaster:
         older_positive = sum(1 for s in older_signals if s.get("signal_type") in ("interview", "offer", "accepted"))
         components["outcome_momentum"] = max(0, min(20, 10 + (recent_positive - older_positive) * 5))
 
-        # Quality trend (0-20) — from telemetry
-        try:
-            telemetry = await self.db.query(
+        # Telemetry, evidence and the profile are independent reads: fetch
+        # them together, narrowed to the columns scored below (evidence is
+        # only counted, server-side). A failed read
+        # falls back to that component's neutral score.
+        telemetry, evidence, profiles = await asyncio.gather(
+            self.db.query(
                 TABLES["pipeline_telemetry"],
                 filters=[("user_id", "==", user_id)],
                 order_by="created_at",
                 order_direction="DESCENDING",
                 limit=10,
-            )
+                columns="quality_scores",
+            ),
+            self.db.count(TABLES["user_evidence_nodes"], filters=[("user_id", "==", user_id)]),
+            self.db.query(
+                TABLES["profiles"],
+                filters=[("user_id", "==", user_id)],
+                limit=1,
+                columns="updated_at,created_at",
+            ),
+            return_exceptions=True,
+        )
+
+        # Quality trend (0-20) — from telemetry
+        try:
+            if isinstance(telemetry, Exception):
+                raise telemetry
             if len(telemetry) >= 4:
                 recent_q = [
                     sum((t.get("quality_scores") or {}).values()) / max(len((t.get("quality_scores") or {})), 1)
@@ -958,40 +971,29 @@ class PredictiveCareerForecaster:
             components["quality_trend"] = 10
 
         # Evidence growth (0-20) — count evidence nodes
-        try:
-            evidence = await self.db.query(
-                TABLES["user_evidence_nodes"],
-                filters=[("user_id", "==", user_id)],
-            )
-            evidence_count = len(evidence)
-            # 20+ evidence nodes = full score
-            components["evidence_strength"] = max(0, min(20, evidence_count))
-        except Exception:
+        if isinstance(evidence, Exception):
             components["evidence_strength"] = 10
+        else:
+            # 20+ evidence nodes = full score
+            components["evidence_strength"] = max(0, min(20, evidence))
 
         # Profile freshness (0-20)
-        try:
-            profiles = await self.db.query(
-                TABLES["profiles"],
-                filters=[("user_id", "==", user_id)],
-                limit=1,
-            )
-            if profiles:
-                updated = profiles[0].get("updated_at") or profiles[0].get("created_at", "")
-                if updated:
-                    try:
-                        updated_dt = datetime.fromisoformat(str(updated).replace("Z", "+00:00"))
-                        days_since = (now - updated_dt).days
-                        # Updated within 7 days = 20, 14 days = 15, 30+ days = 5
-                        components["profile_freshness"] = max(5, min(20, 20 - days_since))
-                    except (ValueError, TypeError):
-                        components["profile_freshness"] = 10
-                else:
+        if isinstance(profiles, Exception):
+            components["profile_freshness"] = 10
+        elif profiles:
+            updated = profiles[0].get("updated_at") or profiles[0].get("created_at", "")
+            if updated:
+                try:
+                    updated_dt = datetime.fromisoformat(str(updated).replace("Z", "+00:00"))
+                    days_since = (now - updated_dt).days
+                    # Updated within 7 days = 20, 14 days = 15, 30+ days = 5
+                    components["profile_freshness"] = max(5, min(20, 20 - days_since))
+                except (ValueError, TypeError):
                     components["profile_freshness"] = 10
             else:
-                components["profile_freshness"] = 0
-        except Exception:
-            components["profile_freshness"] = 10
+                components["profile_freshness"] = 10
+        else:
+            components["profile_freshness"] = 0
 
         total = sum(components.values())
 
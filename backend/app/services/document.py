@@ -109,9 +109,9 @@ class DocumentService:
             "status": "draft",
         }
 
-        doc_id = await self.db.create(COLLECTIONS["documents"], record)
-        logger.info("document_generated", doc_id=doc_id, type=document_type)
-        return await self.db.get(COLLECTIONS["documents"], doc_id)
+        created = await self.db.create_returning(COLLECTIONS["documents"], record)
+        logger.info("document_generated", doc_id=created["id"], type=document_type)
+        return created
 
     async def _generate_with_pipeline_or_chain(
         self,
@@ -12,10 +12,14 @@ Usage:
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import json
 from typing import Any, Dict, List, Optional, Set, Tuple, TYPE_CHECKING
 
 import structlog
 
+from app.core.cache import cache_get, cache_set
+
 if TYPE_CHECKING:
     from ai_engine.chains.document_pack_planner import DocumentPackPlan
 
@@ -99,13 +103,33 @@ CORE_DOC_KEYS: frozenset[str] = frozenset(
     entry["key"] for entry in SEED_CATALOG if entry["category"] == "core"
 )
 
+_SEED_FINGERPRINT = hashlib.sha256(
+    json.dumps(SEED_CATALOG, sort_keys=True).encode("utf-8")
+).hexdigest()[:16]
+_SEED_MARKER_KEY = f"document_catalog:seeded:{_SEED_FINGERPRINT}"
+_SEED_MARKER_TTL_S = 7 * 24 * 3600
+_catalog_seeded = False
+
 
 # ═══════════════════════════════════════════════════════════════════════
 #  Catalog operations
 # ═══════════════════════════════════════════════════════════════════════
 
 async def ensure_catalog_seeded(db: Any, tables: Dict[str, str]) -> None:
-    """Idempotent: insert seed catalog entries if they don't exist."""
+    """Idempotent: insert seed catalog entries if they don't exist.
+
+    Runs on every worker boot and every pipeline run, so a successful seed
+    is remembered per process and, via the shared cache, across workers.
+    The marker is keyed by a fingerprint of SEED_CATALOG, so editing the
+    seed list re-seeds on the next call.
+    """
+    global _catalog_seeded
+    if _catalog_seeded:
+        return
+    if await cache_get(_SEED_MARKER_KEY):
+        _catalog_seeded = True
+        return
+
     table = tables.get("document_type_catalog", "document_type_catalog")
     try:
         rows = [
@@ -126,6 +150,9 @@ async def ensure_catalog_seeded(db: Any, tables: Dict[str, str]) -> None:
         logger.info("document_catalog.seeded", count=len(rows))
     except Exception as e:
         logger.warning("document_catalog.seed_failed", error=str(e)[:200])
+        return
+    _catalog_seeded = True
+    await cache_set(_SEED_MARKER_KEY, True, ttl=_SEED_MARKER_TTL_S)
 
 
 async def get_full_catalog(db: Any, tables: Dict[str, str]) -> List[Dict[str, Any]]:
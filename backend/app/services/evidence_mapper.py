@@ -65,18 +65,14 @@ class EvidenceMapperService:
         chain = EvidenceMapperChain(self.ai_client)
         result = await chain.map_evidence(skill_gaps, evidence_for_ai)
 
-        # Delete old mappings for this gap report
-        old_mappings = await self.db.query(
+        # Replace old mappings for this gap report: one DELETE, one INSERT.
+        await self.db.delete_where(
             TABLES["evidence_mappings"],
             filters=[("gap_report_id", "==", gap_report_id), ("user_id", "==", user_id)],
         )
-        for old in old_mappings:
-            await self.db.delete(TABLES["evidence_mappings"], old["id"])
 
-        # Save new mappings
-        saved = []
-        for m in result.get("mappings", []):
-            record = {
+        records = [
+            {
                 "user_id": user_id,
                 "evidence_id": m["evidence_id"],
                 "gap_report_id": gap_report_id,
@@ -87,8 +83,10 @@ class EvidenceMapperService:
                 "ai_explanation": m.get("explanation", ""),
                 "is_confirmed": False,
             }
-            doc_id = await self.db.create(TABLES["evidence_mappings"], record)
-            saved.append({**record, "id": doc_id})
+            for m in result.get("mappings", [])
+        ]
+        ids = await self.db.create_many(TABLES["evidence_mappings"], records)
+        saved = [{**record, "id": doc_id} for record, doc_id in zip(records, ids)]
 
         logger.info("evidence_mapped", count=len(saved), gap_report_id=gap_report_id)
         return {
@@ -4,6 +4,7 @@ Handles document export to PDF/DOCX formats with Supabase
 """
 from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, timezone
+from enum import Enum
 import io
 import base64
 import structlog
@@ -19,6 +20,27 @@ from app.core.database import get_db, TABLES, SupabaseDB
 logger = structlog.get_logger()
 
 
+class ExportFormat(str, Enum):
+    PDF = "pdf"
+    DOCX = "docx"
+    MARKDOWN = "markdown"
+
+
+_CONTENT_TYPES: Dict[str, str] = {
+    ExportFormat.PDF: "application/pdf",
+    ExportFormat.DOCX: "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    ExportFormat.MARKDOWN: "text/markdown",
+}
+
+# Application document type -> (export title, applications column)
+_APPLICATION_DOC_FIELDS: Dict[str, Tuple[str, str]] = {
+    "cv": ("Tailored CV", "cv_html"),
+    "cover_letter": ("Cover Letter", "cover_letter_html"),
+    "personal_statement": ("Personal Statement", "personal_statement_html"),
+    "portfolio": ("Portfolio", "portfolio_html"),
+}
+
+
 def generate_docx_from_html(html_content: str, document_type: str = "cv") -> bytes:
     """Convert HTML content to proper DOCX using python-docx."""
     import re
@@ -63,6 +85,10 @@ class ExportService:
         options: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """Create an export bundle from application documents or standalone documents."""
+        try:
+            export_format = ExportFormat(fmt)
+        except ValueError:
+            raise ValueError(f"Unsupported format: {fmt}") from None
         documents: List[Dict[str, Any]] = []
 
         # If options contains application_id, export from the applications table
@@ -73,22 +99,17 @@ class ExportService:
                 raise ValueError("Application not found or not accessible")
 
             doc_types = (options or {}).get("document_types", ["cv", "cover_letter"])
-            type_map = {
-                "cv": ("Tailored CV", "cv_html"),
-                "cover_letter": ("Cover Letter", "cover_letter_html"),
-                "personal_statement": ("Personal Statement", "personal_statement_html"),
-                "portfolio": ("Portfolio", "portfolio_html"),
-            }
             for dt in doc_types:
-                if dt in type_map:
-                    title, field = type_map[dt]
+                if dt in _APPLICATION_DOC_FIELDS:
+                    title, field = _APPLICATION_DOC_FIELDS[dt]
                     content = app.get(field, "")
                     if content:
                         documents.append({"title": title, "content": content, "format": "html"})
         elif document_ids:
             # Fallback: fetch from documents table
+            docs_by_id = await self.db.get_many(TABLES["documents"], document_ids)
             for did in document_ids:
-                doc = await self.db.get(TABLES["documents"], did)
+                doc = docs_by_id.get(str(did))
                 if not doc or doc.get("user_id") != user_id:
                     raise ValueError(f"Document {did} not found or not accessible")
                 documents.append(doc)
@@ -98,24 +119,22 @@ class ExportService:
 
         if not filename:
             timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
-            filename = f"hirestack_export_{timestamp}.{fmt}"
+            filename = f"hirestack_export_{timestamp}.{export_format.value}"
 
         # Generate file content
-        if fmt == "pdf":
+        if export_format is ExportFormat.PDF:
             file_bytes = self._generate_pdf(documents, options)
-        elif fmt == "docx":
+        elif export_format is ExportFormat.DOCX:
             file_bytes = self._generate_docx(documents, options)
-        elif fmt == "markdown":
-            file_bytes = self._generate_markdown(documents)
         else:
-            raise ValueError(f"Unsupported format: {fmt}")
+            file_bytes = self._generate_markdown(documents)
 
         # Store as base64 in Supabase (for small exports; production should use Supabase Storage)
         b64 = base64.b64encode(file_bytes).decode()
         record = {
             "user_id": user_id,
             "document_ids": document_ids or [],
-            "format": fmt,
+            "format": export_format.value,
             "filename": filename,
             "file_size": len(file_bytes),
             "file_url": f"data:application/octet-stream;base64,{b64}",
@@ -123,7 +142,7 @@ class ExportService:
             "status": "completed",
         }
         doc_id = await self.db.create(TABLES["exports"], record)
-        logger.info("export_created", export_id=doc_id, format=fmt, doc_count=len(documents))
+        logger.info("export_created", export_id=doc_id, format=export_format.value, doc_count=len(documents))
         return await self.db.get(TABLES["exports"], doc_id)
 
     def _strip_html(self, html: str) -> str:
@@ -325,12 +344,7 @@ class ExportService:
             raise ValueError("Export file not available")
 
         file_content = base64.b64decode(file_url.split(",")[1])
-        content_types = {
-            "pdf": "application/pdf",
-            "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-            "markdown": "text/markdown",
-        }
-        return file_content, export.get("filename", "export"), content_types.get(export.get("format", ""), "application/octet-stream")
+        return file_content, export.get("filename", "export"), _CONTENT_TYPES.get(export.get("format", ""), "application/octet-stream")
 
     async def delete_export(self, export_id: str, user_id: str) -> bool:
         export = await self.get_export(export_id, user_id)
@@ -5,11 +5,102 @@ Handles edge cases: multi-column layouts, tables, headers/footers, encoding issu
 """
 import asyncio
 import io
+import os
 import re
-from typing import List
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List
 
-import pdfplumber
-from docx import Document as DocxDocument
+import structlog
+
+try:
+    import pypdfium2 as _pdfium
+except ImportError:  # pragma: no cover - optional fast path
+    _pdfium = None
+
+from app.core.config import settings
+
+logger = structlog.get_logger()
+
+# Below this many characters of text-layer output a PDF is treated as
+# scanned and, when enabled, retried through OCR.
+_OCR_MIN_CHARS = 100
+# Stop reading further pages once this much text is in hand. Downstream
+# consumers cap resume text at ~50 KB anyway (profile.MAX_RESUME_SIZE).
+_PDF_TEXT_BUDGET = 50_000
+_ocr_engine: Any = None
+_ocr_engine_lock = threading.Lock()
+# pdfplumber (pdfminer) and python-docx (lxml) are slow to import; resolve
+# them once on first use instead of on every worker/CLI import of this module.
+_pdfplumber_mod: Any = None
+_docx_document: Any = None
+
+
+def _get_pdfplumber() -> Any:
+    global _pdfplumber_mod
+    if _pdfplumber_mod is None:
+        import pdfplumber
+
+        _pdfplumber_mod = pdfplumber
+    return _pdfplumber_mod
+
+
+def _get_docx_document() -> Any:
+    global _docx_document
+    if _docx_document is None:
+        from docx import Document
+
+        _docx_document = Document
+    return _docx_document
+
+
+def _get_ocr_engine() -> Any:
+    """Lazily build the process-wide RapidOCR engine (model load is slow)."""
+    global _ocr_engine
+    if _ocr_engine is None:
+        with _ocr_engine_lock:
+            if _ocr_engine is None:
+                from rapidocr_onnxruntime import RapidOCR
+
+                _ocr_engine = RapidOCR()
+    return _ocr_engine
+
+# Dedicated pool for CPU-bound document parsing. Sharing the loop's default
+# executor would let a burst of large uploads starve the Supabase calls that
+# SupabaseDB._run also schedules there; a fixed pool also gives parsing a
+# predictable concurrency ceiling.
+_PARSE_EXECUTOR = ThreadPoolExecutor(
+    max_workers=min(32, (os.cpu_count() or 1) * 2),
+    thread_name_prefix="file-parse",
+)
+
+
+async def _run_in_parse_pool(fn: Callable[..., Any], *args: Any) -> Any:
+    return await asyncio.get_running_loop().run_in_executor(_PARSE_EXECUTOR, fn, *args)
+
+
+def _warm_parsers() -> None:
+    _get_pdfplumber()
+    _get_docx_document()
+
+
+def schedule_parser_warmup() -> None:
+    """Import the parsing libraries on the parse pool so the first upload doesn't pay for it.
+
+    Fire-and-forget: startup is not blocked, and a request that races the
+    warm-up simply waits on the import lock.
+    """
+    _PARSE_EXECUTOR.submit(_warm_parsers)
+
+
+# Extension (no dot) → FileParser coroutine method name. Resolved by name so
+# subclasses and test patches of the methods are honoured.
+_EXTRACTORS = {
+    "pdf": "_extract_pdf",
+    "docx": "_extract_docx",
+    "doc": "_extract_docx",
+    "txt": "_extract_txt",
+}
 
 
 class FileParser:
@@ -25,61 +116,63 @@ class FileParser:
             raise ValueError("File is empty. Please upload a file with content.")
 
         file_type = file_type.lower().strip(".")
-
-        if file_type == "pdf":
-            if len(file_contents) < 100:
-                raise ValueError("PDF file appears to be corrupt or incomplete.")
-            return await self._extract_pdf(file_contents)
-        elif file_type in ("docx", "doc"):
-            return await self._extract_docx(file_contents)
-        elif file_type == "txt":
-            return await self._extract_txt(file_contents)
-        else:
+        extractor = _EXTRACTORS.get(file_type)
+        if extractor is None:
             raise ValueError(f"Unsupported file type: {file_type}")
+        if file_type == "pdf" and len(file_contents) < 100:
+            raise ValueError("PDF file appears to be corrupt or incomplete.")
+        return await getattr(self, extractor)(file_contents)
 
     async def _extract_pdf(self, file_contents: bytes) -> str:
         """Extract text from PDF file with layout-aware extraction."""
-        return await asyncio.to_thread(self._extract_pdf_sync, file_contents)
+        return await _run_in_parse_pool(self._extract_pdf_sync, file_contents)
 
     def _extract_pdf_sync(self, file_contents: bytes) -> str:
-        """Synchronous PDF extraction (runs in thread pool)."""
-        text_parts: List[str] = []
+        """Synchronous PDF extraction (runs in the parse pool).
 
-        try:
-            with pdfplumber.open(io.BytesIO(file_contents)) as pdf:
-                for page in pdf.pages:
-                    # Try regular text extraction first
-                    page_text = page.extract_text(
-                        x_tolerance=2,
-                        y_tolerance=3,
-                    )
-
-                    # If regular extraction yields little text, try table extraction
-                    if not page_text or len(page_text.strip()) < 20:
-                        tables = page.extract_tables()
-                        if tables:
-                            table_texts = []
-                            for table in tables:
-                                for row in table:
-                                    cells = [c.strip() for c in row if c and c.strip()]
-                                    if cells:
-                                        table_texts.append(" | ".join(cells))
-                            if table_texts:
-                                page_text = "\n".join(table_texts)
-
-                    if page_text and page_text.strip():
-                        # Clean up common PDF extraction artifacts
-                        page_text = self._clean_pdf_text(page_text)
-                        text_parts.append(page_text)
+        PDFium (C++) reads the text layer several times faster than
+        pdfplumber's pure-Python interpreter, so it is tried first.
+        pdfplumber (with its table pass) remains the fallback when
+        pypdfium2 is missing, rejects the file, or finds no text.
+        """
+        page_texts: List[str] = []
+        if _pdfium is not None:
+            try:
+                page_texts = self._pdfium_page_texts(file_contents)
+            except Exception as e:
+                logger.debug("pdfium_extract_failed", error=str(e)[:200])
+                page_texts = []
 
-        except Exception as e:
-            raise ValueError(
-                f"Could not read PDF file: {str(e)}. "
-                "The file may be corrupted, password-protected, or image-based (scanned)."
-            )
+        if not page_texts:
+            try:
+                page_texts = self._pdfplumber_page_texts(file_contents)
+            except Exception as e:
+                raise ValueError(
+                    f"Could not read PDF file: {str(e)}. "
+                    "The file may be corrupted, password-protected, or image-based (scanned)."
+                )
+
+        # Clean up common PDF extraction artifacts
+        text_parts = [self._clean_pdf_text(t) for t in page_texts]
 
         full_text = "\n\n".join(text_parts)
 
+        # Two-tier: the text layer above is the fast path; OCR only runs
+        # when it came back (near-)empty, i.e. the PDF is a scan.
+        strategy = "fast"
+        if len(full_text.strip()) < _OCR_MIN_CHARS and settings.enable_ocr_fallback and _pdfium is not None:
+            try:
+                ocr_text = "\n\n".join(
+                    self._clean_pdf_text(t) for t in self._ocr_page_texts(file_contents)
+                )
+            except Exception as e:
+                logger.warning("pdf_ocr_failed", error=str(e)[:200])
+                ocr_text = ""
+            if len(ocr_text.strip()) > len(full_text.strip()):
+                full_text = ocr_text
+                strategy = "ocr_fallback"
+        logger.info("pdf_extracted", strategy=strategy, chars=len(full_text))
+
         if not full_text.strip():
             raise ValueError(
                 "Could not extract text from PDF. "
@@ -89,6 +182,86 @@ class FileParser:
 
         return full_text
 
+    @staticmethod
+    def _pdfium_page_texts(file_contents: bytes) -> List[str]:
+        """Non-empty text-layer strings per page via PDFium, up to _PDF_TEXT_BUDGET."""
+        page_texts: List[str] = []
+        append = page_texts.append
+        total = 0
+        pdf = _pdfium.PdfDocument(file_contents)
+        try:
+            for i in range(len(pdf)):
+                page = pdf[i]
+                textpage = page.get_textpage()
+                try:
+                    page_text = textpage.get_text_range()
+                finally:
+                    textpage.close()
+                    page.close()
+                if page_text and not page_text.isspace():
+                    append(page_text.replace("\r\n", "\n"))
+                    total += len(page_text)
+                    if total >= _PDF_TEXT_BUDGET:
+                        break
+        finally:
+            pdf.close()
+        return page_texts
+
+    @staticmethod
+    def _ocr_page_texts(file_contents: bytes) -> List[str]:
+        """OCR the first ``settings.ocr_max_pages`` pages rendered by PDFium."""
+        engine = _get_ocr_engine()
+        page_texts: List[str] = []
+        pdf = _pdfium.PdfDocument(file_contents)
+        try:
+            for i in range(min(len(pdf), max(1, settings.ocr_max_pages))):
+                page = pdf[i]
+                try:
+                    image = page.render(scale=2).to_pil()
+                finally:
+                    page.close()
+                result, _ = engine(image)
+                lines = [item[1] for item in (result or []) if item and item[1]]
+                if lines:
+                    page_texts.append("\n".join(lines))
+        finally:
+            pdf.close()
+        return page_texts
+
+    @staticmethod
+    def _pdfplumber_page_texts(file_contents: bytes) -> List[str]:
+        """Non-empty page strings via pdfplumber (table pass for sparse pages), up to _PDF_TEXT_BUDGET."""
+        page_texts: List[str] = []
+        total = 0
+        with _get_pdfplumber().open(io.BytesIO(file_contents)) as pdf:
+            pages = pdf.pages
+            for page in pages:
+                # Try regular text extraction first
+                page_text = page.extract_text(
+                    x_tolerance=2,
+                    y_tolerance=3,
+                )
+
+                # If regular extraction yields little text, try table extraction
+                if not page_text or len(page_text.strip()) < 20:
+                    tables = page.extract_tables()
+                    if tables:
+                        table_texts = []
+                        for table in tables:
+                            for row in table:
+                                cells = [c.strip() for c in row if c and c.strip()]
+                                if cells:
+                                    table_texts.append(" | ".join(cells))
+                        if table_texts:
+                            page_text = "\n".join(table_texts)
+
+                if page_text and not page_text.isspace():
+                    page_texts.append(page_text)
+                    total += len(page_text)
+                    if total >= _PDF_TEXT_BUDGET:
+                        break
+        return page_texts
+
     def _clean_pdf_text(self, text: str) -> str:
         """Clean common PDF extraction artifacts."""
         # Fix broken words from column extraction (e.g., "Soft- ware" → "Software")
@@ -108,43 +281,47 @@ class FileParser:
 
     async def _extract_docx(self, file_contents: bytes) -> str:
         """Extract text from DOCX file including paragraphs, tables, headers."""
-        return await asyncio.to_thread(self._extract_docx_sync, file_contents)
+        return await _run_in_parse_pool(self._extract_docx_sync, file_contents)
 
     def _extract_docx_sync(self, file_contents: bytes) -> str:
-        """Synchronous DOCX extraction (runs in thread pool)."""
+        """Synchronous DOCX extraction (runs in the parse pool)."""
         try:
-            doc = DocxDocument(io.BytesIO(file_contents))
+            doc = _get_docx_document()(io.BytesIO(file_contents))
         except Exception as e:
             raise ValueError(f"Could not open document file: {str(e)}")
 
         text_parts: List[str] = []
+        add = text_parts.append
+
+        # python-docx rebuilds ``.text`` by walking every run on each access,
+        # so each paragraph/cell is read exactly once below.
 
         # Extract header content (often contains name/contact)
         for section in doc.sections:
             header = section.header
             if header:
                 for para in header.paragraphs:
-                    if para.text.strip():
-                        text_parts.append(para.text.strip())
+                    text = para.text.strip()
+                    if text:
+                        add(text)
 
         # Extract main body paragraphs
         for paragraph in doc.paragraphs:
-            if paragraph.text.strip():
-                text_parts.append(paragraph.text)
+            text = paragraph.text
+            if text and not text.isspace():
+                add(text)
 
         # Extract from tables (common in resume formatting)
         for table in doc.tables:
             for row in table.rows:
-                cells = [cell.text.strip() for cell in row.cells if cell.text.strip()]
-                # Deduplicate cells (merged cells can repeat text)
-                seen = set()
-                unique_cells = []
-                for c in cells:
-                    if c not in seen:
-                        seen.add(c)
-                        unique_cells.append(c)
+                # Deduplicate cells (merged cells can repeat text), keeping order
+                unique_cells: Dict[str, None] = {}
+                for cell in row.cells:
+                    text = cell.text.strip()
+                    if text:
+                        unique_cells[text] = None
                 if unique_cells:
-                    text_parts.append(" | ".join(unique_cells))
+                    add(" | ".join(unique_cells))
 
         full_text = "\n".join(text_parts)
 
@@ -6,11 +6,34 @@ from typing import List, Optional, Dict, Any
 import structlog
 
 from app.core.database import get_firestore_db, COLLECTIONS, FirestoreDB
+from app.core.pagination import decode_cursor
 from ai_engine.client import AIClient
 from ai_engine.chains.gap_analyzer import GapAnalyzerChain
 
 logger = structlog.get_logger()
 
+_SCORE_COLUMNS = (
+    "compatibility_score,skill_score,experience_score,education_score,"
+    "certification_score,project_score,top_gaps,top_strengths,readiness_level"
+)
+
+# Projection for the list view: scores, materialized summary fields and
+# status.  The gap/strength/recommendation JSONB blobs (and the full analyzer
+# output in ``summary``) are fetched by get_report().
+LIST_COLUMNS = f"id,user_id,profile_id,benchmark_id,{_SCORE_COLUMNS},status,created_at,updated_at"
+
+# Projection for get_summary(): everything it returns is a plain column.
+SUMMARY_COLUMNS = _SCORE_COLUMNS
+
+
+def _summary_fields(analysis: Dict[str, Any]) -> Dict[str, Any]:
+    """Derive the materialized summary columns from a gap analysis."""
+    return {
+        "top_gaps": [g.get("skill", g.get("area", "")) for g in (analysis.get("skill_gaps") or [])[:3]],
+        "top_strengths": [s.get("area", "") for s in (analysis.get("strengths") or [])[:3]],
+        "readiness_level": analysis.get("readiness_level") or "needs-work",
+    }
+
 
 class GapService:
     """Service for gap analysis operations using Firestore."""
@@ -89,20 +112,34 @@ class GapService:
             "recommendations": analysis.get("recommendations", []),
             "priority_actions": analysis.get("quick_wins", []),
             "summary": analysis,
+            **_summary_fields(analysis),
             "status": "completed",
         }
 
-        doc_id = await self.db.create(COLLECTIONS["gap_reports"], record)
-        logger.info("gap_analysis_completed", report_id=doc_id, score=record["compatibility_score"])
-        return await self.db.get(COLLECTIONS["gap_reports"], doc_id)
-
-    async def get_user_reports(self, user_id: str, limit: int = 50) -> List[Dict[str, Any]]:
+        created = await self.db.create_returning(COLLECTIONS["gap_reports"], record)
+        logger.info("gap_analysis_completed", report_id=created["id"], score=record["compatibility_score"])
+        return created
+
+    async def get_user_reports(
+        self, user_id: str, limit: int = 50, cursor: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Newest-first summary rows; ``cursor`` comes from ``encode_cursor`` on the last row."""
+        filters = [("user_id", "==", user_id)]
+        after = None
+        if cursor:
+            created_at, last_id = decode_cursor(cursor)
+            if last_id is None:
+                filters.append(("created_at", "<", created_at))
+            else:
+                after = (created_at, last_id)
         return await self.db.query(
             COLLECTIONS["gap_reports"],
-            filters=[("user_id", "==", user_id)],
-            order_by="created_at",
+            filters=filters,
+            order_by="created_at,id",
             order_direction="DESCENDING",
             limit=limit,
+            columns=LIST_COLUMNS,
+            after=after,
         )
 
     async def get_report(self, report_id: str, user_id: str) -> Optional[Dict[str, Any]]:
@@ -112,20 +149,25 @@ class GapService:
         return None
 
     async def get_summary(self, report_id: str, user_id: str) -> Optional[Dict[str, Any]]:
-        report = await self.get_report(report_id, user_id)
-        if not report:
+        rows = await self.db.query(
+            COLLECTIONS["gap_reports"],
+            filters=[("id", "==", report_id), ("user_id", "==", user_id)],
+            limit=1,
+            columns=SUMMARY_COLUMNS,
+        )
+        if not rows:
             return None
-        summary_data = report.get("summary", {})
+        report = rows[0]
         return {
-            "compatibility_score": report.get("compatibility_score", 0),
-            "skill_score": report.get("skill_score", 0),
-            "experience_score": report.get("experience_score", 0),
-            "education_score": report.get("education_score", 0),
-            "certification_score": report.get("certification_score", 0),
-            "project_score": report.get("project_score", 0),
-            "top_gaps": [g.get("skill", g.get("area", "")) for g in (report.get("skill_gaps") or [])[:3]],
-            "top_strengths": [s.get("area", "") for s in (report.get("strengths") or [])[:3]],
-            "readiness_level": summary_data.get("readiness_level", "needs-work"),
+            "compatibility_score": report.get("compatibility_score") or 0,
+            "skill_score": report.get("skill_score") or 0,
+            "experience_score": report.get("experience_score") or 0,
+            "education_score": report.get("education_score") or 0,
+            "certification_score": report.get("certification_score") or 0,
+            "project_score": report.get("project_score") or 0,
+            "top_gaps": report.get("top_gaps") or [],
+            "top_strengths": report.get("top_strengths") or [],
+            "readiness_level": report.get("readiness_level") or "needs-work",
         }
 
     async def refresh_analysis(self, report_id: str, user_id: str) -> Optional[Dict[str, Any]]:
@@ -141,3 +183,15 @@ class GapService:
             return False
         await self.db.delete(COLLECTIONS["gap_reports"], report_id)
         return True
+
+
+# ── Singleton ─────────────────────────────────────────────────────
+_instance: Optional[GapService] = None
+
+
+def get_gap_service() -> GapService:
+    """Return a shared GapService singleton (avoids per-request AIClient)."""
+    global _instance
+    if _instance is None:
+        _instance = GapService()
+    return _instance
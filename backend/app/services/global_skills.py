@@ -1,7 +1,6 @@
 """
 Global Skills Service — manages user's profile-wide skills, gaps, and learning goals.
 """
-import uuid as _uuid
 from typing import Any, Dict, List, Optional
 
 import structlog
@@ -47,7 +46,6 @@ class GlobalSkillsService:
             "proficiency": data.get("proficiency", "beginner"),
             "years_experience": data.get("years_experience"),
             "source": data.get("source", "manual"),
-            "updated_at": "now()",
         }
 
         def _query():
@@ -170,7 +168,6 @@ class GlobalSkillsService:
                 "application_ids": entry["application_ids"],
                 "priority_score": priority,
                 "status": "open",
-                "updated_at": "now()",
             })
 
         if rows:
@@ -192,7 +189,7 @@ class GlobalSkillsService:
         def _query():
             return (
                 self.sb.table("user_skill_gaps")
-                .update({"status": status, "updated_at": "now()"})
+                .update({"status": status})
                 .eq("id", gap_id)
                 .eq("user_id", user_id)
                 .select()
@@ -226,7 +223,6 @@ class GlobalSkillsService:
         import asyncio
 
         row = {
-            "id": str(_uuid.uuid4()),
             "user_id": user_id,
             "title": data["title"],
             "description": data.get("description"),
@@ -247,7 +243,6 @@ class GlobalSkillsService:
 
         allowed = {"title", "description", "target_skills", "goal_type", "status", "target_date", "progress_pct"}
         update = {k: v for k, v in data.items() if k in allowed}
-        update["updated_at"] = "now()"
 
         def _query():
             return (
@@ -70,7 +70,6 @@ class InterviewService:
             "answers": [],
             "scores": [],
             "status": "active",
-            "created_at": now.isoformat(),
             "expires_at": (now + timedelta(hours=SESSION_TIMEOUT_HOURS)).isoformat(),
         }
 
@@ -6,10 +6,18 @@ from typing import List, Optional, Dict, Any
 import structlog
 
 from app.core.database import get_firestore_db, COLLECTIONS, FirestoreDB
+from app.core.pagination import decode_cursor
 from ai_engine.client import AIClient
 
 logger = structlog.get_logger()
 
+# Projection for the list view.  raw_text and the parsed JSONB columns are
+# only needed on the detail/parse paths, which go through get_job().
+LIST_COLUMNS = (
+    "id,user_id,title,company,location,job_type,experience_level,"
+    "salary_range,description,source_url,created_at,updated_at"
+)
+
 JOB_PARSER_PROMPT = """Parse this job description and extract structured requirements:
 
 JOB DESCRIPTION:
@@ -56,24 +64,37 @@ class JobService:
         safe["user_id"] = user_id
         safe["raw_text"] = safe.get("description", "")
 
-        doc_id = await self.db.create(COLLECTIONS["jobs"], safe)
-        created = await self.db.get(COLLECTIONS["jobs"], doc_id)
+        created = await self.db.create_returning(COLLECTIONS["jobs"], safe)
 
         # Best-effort AI parsing
         try:
             return await self._parse_and_update(created)
         except Exception as e:
-            logger.warning("job_parse_failed", job_id=doc_id, error=str(e))
+            logger.warning("job_parse_failed", job_id=created["id"], error=str(e))
             return created
 
-    async def get_user_jobs(self, user_id: str, limit: int = 50, offset: int = 0) -> List[Dict[str, Any]]:
+    async def get_user_jobs(
+        self, user_id: str, limit: int = 50, offset: int = 0, cursor: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Newest-first list rows; ``cursor`` (from ``encode_cursor``) supersedes ``offset``."""
+        filters = [("user_id", "==", user_id)]
+        after = None
+        if cursor:
+            created_at, last_id = decode_cursor(cursor)
+            if last_id is None:
+                filters.append(("created_at", "<", created_at))
+            else:
+                after = (created_at, last_id)
+            offset = 0
         return await self.db.query(
             COLLECTIONS["jobs"],
-            filters=[("user_id", "==", user_id)],
-            order_by="created_at",
+            filters=filters,
+            order_by="created_at,id",
             order_direction="DESCENDING",
             limit=limit,
             offset=offset,
+            columns=LIST_COLUMNS,
+            after=after,
         )
 
     async def get_job(self, job_id: str, user_id: str) -> Optional[Dict[str, Any]]:
@@ -130,3 +151,15 @@ class JobService:
 
         await self.db.update(COLLECTIONS["jobs"], job["id"], update)
         return await self.db.get(COLLECTIONS["jobs"], job["id"])
+
+
+# ── Singleton ─────────────────────────────────────────────────────
+_instance: Optional[JobService] = None
+
+
+def get_job_service() -> JobService:
+    """Return a shared JobService singleton (avoids per-request AIClient)."""
+    global _instance
+    if _instance is None:
+        _instance = JobService()
+    return _instance
@@ -1,7 +1,6 @@
 """
 Knowledge Library Service — manages curated resources, user progress, and recommendations.
 """
-import uuid as _uuid
 from typing import Any, Dict, List, Optional
 
 import structlog
@@ -95,16 +94,14 @@ class KnowledgeLibraryService:
         """Save or update user progress on a resource (upsert)."""
         import asyncio
 
-        now = "now()"
         data = {
             "user_id": user_id,
             "resource_id": resource_id,
             "status": status,
             "progress_pct": progress_pct,
-            "updated_at": now,
         }
         if status == "completed":
-            data["completed_at"] = now
+            data["completed_at"] = "now()"
             data["progress_pct"] = 100
 
         def _query():
@@ -125,7 +122,7 @@ class KnowledgeLibraryService:
             return (
                 self.sb.table("user_knowledge_progress")
                 .upsert(
-                    {"user_id": user_id, "resource_id": resource_id, "rating": rating, "updated_at": "now()"},
+                    {"user_id": user_id, "resource_id": resource_id, "rating": rating},
                     on_conflict="user_id,resource_id",
                 )
                 .execute()
@@ -222,7 +219,6 @@ class KnowledgeLibraryService:
                 if match:
                     relevance = min(severity_weight * frequency * 10, 100)
                     recommendations.append({
-                        "id": str(_uuid.uuid4()),
                         "user_id": user_id,
                         "resource_id": resource["id"],
                         "reason": f"Helps close your '{gap.get('skill_name', '')}' skill gap ({severity} priority, needed in {frequency} application{'s' if frequency > 1 else ''})",
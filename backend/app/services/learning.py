@@ -87,10 +87,10 @@ class LearningService:
             job_context=job_context,
         )
 
-        # Save challenges
-        saved = []
+        # Save challenges — one multi-row INSERT for the whole set
+        records = []
         for challenge in result.get("challenges", []):
-            record = {
+            records.append({
                 "user_id": user_id,
                 "skill": challenge.get("skill", ""),
                 "difficulty": challenge.get("difficulty", difficulty),
@@ -101,9 +101,9 @@ class LearningService:
                 "explanation": challenge.get("explanation", ""),
                 "points_earned": 0,
                 "streak_day": streak.get("current_streak", 0) + 1,
-            }
-            doc_id = await self.db.create(TABLES["learning_challenges"], record)
-            saved.append({**record, "id": doc_id})
+            })
+        ids = await self.db.create_many(TABLES["learning_challenges"], records)
+        saved = [{**record, "id": doc_id} for record, doc_id in zip(records, ids)]
 
         logger.info("daily_challenges_generated", count=len(saved), user_id=user_id)
         return {
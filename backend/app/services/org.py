@@ -55,9 +55,10 @@ class OrgService:
     async def get_user_orgs(self, user_id: str) -> List[Dict[str, Any]]:
         """Get all orgs a user belongs to."""
         memberships = await self.db.query(TABLES["org_members"], filters=[("user_id", "==", user_id)])
+        orgs_by_id = await self.db.get_many(TABLES["organizations"], [m["org_id"] for m in memberships])
         orgs = []
         for m in memberships:
-            org = await self.db.get(TABLES["organizations"], m["org_id"])
+            org = orgs_by_id.get(str(m["org_id"]))
             if org:
                 org["member_role"] = m["role"]
                 orgs.append(org)
@@ -69,24 +70,20 @@ class OrgService:
         return await self.db.get(TABLES["organizations"], org_id)
 
     async def delete_org(self, org_id: str) -> bool:
-        for table in (
-            TABLES["candidates"],
-            TABLES["usage_records"],
-            TABLES["audit_logs"],
-            TABLES["org_invitations"],
-            TABLES["webhooks"],
-            TABLES["subscriptions"],
-            TABLES["org_members"],
-        ):
-            await self.db.delete_where(table, filters=[("org_id", "==", org_id)])
+        # Every org-owned table references organizations(id) ON DELETE CASCADE,
+        # so Postgres removes members, candidates, webhooks, etc. in the same
+        # statement — no per-table round-trips from here.
         return await self.db.delete(TABLES["organizations"], org_id)
 
     # ── Members ───────────────────────────────────────────────────
 
     async def get_members(self, org_id: str) -> List[Dict[str, Any]]:
         members = await self.db.query(TABLES["org_members"], filters=[("org_id", "==", org_id)])
+        users_by_id = await self.db.get_many(
+            TABLES["users"], [m["user_id"] for m in members], columns="id,full_name,email,avatar_url",
+        )
         for m in members:
-            user = await self.db.get(TABLES["users"], m["user_id"])
+            user = users_by_id.get(str(m["user_id"]))
             if user:
                 m["user_name"] = user.get("full_name") or user.get("email", "")
                 m["user_email"] = user.get("email", "")
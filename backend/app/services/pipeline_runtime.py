@@ -42,6 +42,34 @@ logger = structlog.get_logger("hirestack.pipeline_runtime")
 _LEGACY_OPT_IN_ENV = "HIRESTACK_ALLOW_LEGACY_PIPELINE"
 
 
+# gap_severity (chain vocabulary) → frontend severity bucket.
+_GAP_SEVERITY_MAP: Dict[str, str] = {
+    "critical": "high",
+    "significant": "high",
+    "moderate": "medium",
+    "minor": "low",
+}
+
+
+# Response caps for _format_response; the UI shows at most the top 10-16.
+_MAX_GAP_ROWS = 20
+_MAX_GAP_LABELS = 12
+
+# Fixed scorecard shape for _format_response: (display name, scores key,
+# feedback template).  Only the numbers vary per request.
+_SCORECARD_DIMENSIONS: Tuple[Tuple[str, str, str], ...] = (
+    ("Match", "match", "{}% keyword alignment"),
+    ("ATS Readiness", "atsReadiness", "{}% ATS-optimized"),
+    ("Recruiter Scan", "recruiterScan", "{}% scan-friendly"),
+    ("Evidence Strength", "evidenceStrength", "Add evidence to boost this score"),
+)
+
+
+def _clamp_score(x: int) -> int:
+    """Clamp a 0-100 score with comparisons instead of nested min/max calls."""
+    return 100 if x > 100 else 0 if x < 0 else x
+
+
 def _legacy_pipeline_allowed() -> bool:
     """Return True when the operator has explicitly opted into the legacy path."""
     return os.environ.get(_LEGACY_OPT_IN_ENV, "").strip().lower() in {
@@ -4055,33 +4083,42 @@ class PipelineRuntime:
         strengths_raw = gap_analysis.get("strengths", [])
         recommendations_raw = gap_analysis.get("recommendations", [])
 
-        missing_kw = [g.get("skill", "") for g in skill_gaps if isinstance(g, dict) and g.get("skill")]
+        # Single pass over skill_gaps feeds both missingKeywords and the
+        # gap rows below.
+        # Rows stay plain dicts: the response is cached and persisted as JSON
+        # and consumers index rows by key.  Method lookups are bound once
+        # outside the loop since gap lists routinely run to 20+ entries.
+        missing_kw: list[str] = []
+        gap_rows: list[Dict[str, Any]] = []
+        add_kw, add_row, severity_of = missing_kw.append, gap_rows.append, _GAP_SEVERITY_MAP.get
+        for g in skill_gaps[:_MAX_GAP_ROWS]:
+            if not isinstance(g, dict):
+                continue
+            get = g.get
+            skill = get("skill", "")
+            if skill:
+                add_kw(skill)
+            add_row({
+                "dimension": skill,
+                "gap": f"{get('current_level', '?')} → {get('required_level', 'required')}",
+                "severity": severity_of(get("gap_severity", "moderate"), "medium"),
+                "suggestion": get("recommendation", ""),
+            })
         strength_labels = [
             s.get("area", s.get("description", ""))
-            for s in strengths_raw if isinstance(s, dict)
+            for s in strengths_raw[:_MAX_GAP_LABELS] if isinstance(s, dict)
         ]
         rec_labels = [
             r.get("title", r.get("description", ""))
-            for r in recommendations_raw if isinstance(r, dict)
+            for r in recommendations_raw[:_MAX_GAP_LABELS] if isinstance(r, dict)
         ]
 
-        def _map_severity(s: str) -> str:
-            return {"critical": "high", "significant": "high", "moderate": "medium",
-                    "minor": "low"}.get(s, "medium")
-
         gaps = {
             "missingKeywords": missing_kw,
             "strengths": strength_labels,
             "recommendations": rec_labels,
-            "gaps": [
-                {
-                    "dimension": g.get("skill", ""),
-                    "gap": f"{g.get('current_level', '?')} → {g.get('required_level', 'required')}",
-                    "severity": _map_severity(g.get("gap_severity", "moderate")),
-                    "suggestion": g.get("recommendation", ""),
-                }
-                for g in skill_gaps if isinstance(g, dict)
-            ],
+            "gaps": gap_rows,
+            "totalGaps": len(skill_gaps),
             "summary": gap_analysis.get("executive_summary", ""),
             "compatibility": compatibility,
             "categoryScores": gap_analysis.get("category_scores", {}),
@@ -4092,29 +4129,27 @@ class PipelineRuntime:
         # Scores
         score = compatibility if isinstance(compatibility, (int, float)) else 50
         cv_qual = validation.get("cv", {}).get("qualityScore", 0)
-        match_score = min(100, max(0, int(score)))
+        match_score = _clamp_score(int(score))
 
         scores = {
             "overall": match_score,
             "compatibility": match_score,
             "match": match_score,
-            "atsReadiness": min(100, match_score + 15),
-            "recruiterScan": min(100, match_score + 10),
+            "atsReadiness": _clamp_score(match_score + 15),
+            "recruiterScan": _clamp_score(match_score + 10),
             "evidenceStrength": 0,
-            "ats": min(100, max(0, int(cv_qual))) if cv_qual else 60,
-            "cv": min(100, match_score + 20),
-            "coverLetter": min(100, match_score + 15),
-            "gaps": max(0, 100 - len(missing_kw) * 8),
+            "ats": _clamp_score(int(cv_qual)) if cv_qual else 60,
+            "cv": _clamp_score(match_score + 20),
+            "coverLetter": _clamp_score(match_score + 15),
+            "gaps": _clamp_score(100 - len(missing_kw) * 8),
             "benchmark": match_score,
         }
 
         scorecard = {
             "overall": scores["overall"],
             "dimensions": [
-                {"name": "Match", "score": scores["match"], "feedback": f"{scores['match']}% keyword alignment"},
-                {"name": "ATS Readiness", "score": scores["atsReadiness"], "feedback": f"{scores['atsReadiness']}% ATS-optimized"},
-                {"name": "Recruiter Scan", "score": scores["recruiterScan"], "feedback": f"{scores['recruiterScan']}% scan-friendly"},
-                {"name": "Evidence Strength", "score": scores["evidenceStrength"], "feedback": "Add evidence to boost this score"},
+                {"name": name, "score": scores[key], "feedback": feedback.format(scores[key])}
+                for name, key, feedback in _SCORECARD_DIMENSIONS
             ],
             "match": scores["match"],
             "atsReadiness": scores["atsReadiness"],
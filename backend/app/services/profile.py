@@ -4,8 +4,11 @@ Handles resume upload, parsing, profile management, universal documents, and car
 """
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timezone
+import asyncio
+import hashlib
 import structlog
 
+from app.core.cache import cache_get, cache_invalidate, cache_set
 from app.core.database import get_db, TABLES, SupabaseDB
 from app.services.file_parser import FileParser
 from ai_engine.client import AIClient
@@ -15,6 +18,19 @@ logger = structlog.get_logger()
 
 MAX_RESUME_SIZE = 50 * 1024  # 50 KB of UTF-8 encoded text
 
+# The primary profile is read on most page loads and by several services,
+# but only changes when the user edits it; every profile write below drops
+# the cached copy (and the route-level list cache) for that user.
+PRIMARY_PROFILE_CACHE_TTL_S = 60
+
+
+def _primary_cache_key(user_id: str) -> str:
+    return f"profiles:primary:{user_id}"
+
+
+def _list_cache_key(user_id: str) -> str:
+    return f"profiles:list:{user_id}"
+
 # Completeness weights per section (must sum to 100)
 COMPLETENESS_WEIGHTS = {
     "personal_info": 15,
@@ -44,8 +60,26 @@ class ProfileService:
         file_name: str,
         file_type: str,
         is_primary: bool = False,
+        content_hash: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """Create a profile from uploaded resume file."""
+        """Create a profile from uploaded resume file.
+
+        Uploads are content-addressed per user: re-uploading byte-identical
+        file contents returns the existing profile instead of re-running
+        parsing and the LLM resume parse. ``content_hash`` (sha256 hex) may
+        be supplied by callers that already hashed the upload.
+        """
+        content_hash = content_hash or hashlib.sha256(file_contents).hexdigest()
+        existing = await self._find_by_content_hash(user_id, content_hash)
+        if existing is not None:
+            if is_primary and not existing.get("is_primary"):
+                await self._clear_primary(user_id)
+                await self.db.update(TABLES["profiles"], existing["id"], {"is_primary": True})
+                existing["is_primary"] = True
+                await self.invalidate_cached_profiles(user_id)
+            logger.info("profile_upload_dedup_hit", user_id=user_id, profile_id=existing.get("id"))
+            return existing
+
         raw_text = await self.file_parser.extract_text(file_contents, file_type)
 
         if not raw_text.strip():
@@ -53,16 +87,16 @@ class ProfileService:
         if len(raw_text.encode("utf-8")) > MAX_RESUME_SIZE:
             raise ValueError(f"Resume text exceeds maximum size of {MAX_RESUME_SIZE // 1024}KB")
 
+        # The "first profile?" probe doesn't depend on the LLM parse, so it
+        # rides along with it instead of adding a round-trip afterwards.
         profiler = RoleProfilerChain(self.ai_client)
-        parsed_data = await profiler.parse_resume(raw_text)
+        parsed_data, has_profiles = await asyncio.gather(
+            profiler.parse_resume(raw_text),
+            self._has_profiles(user_id),
+        )
 
         if is_primary:
-            existing_profiles = await self.get_user_profiles(user_id)
-            for profile in existing_profiles:
-                if profile.get("is_primary"):
-                    await self.db.update(TABLES["profiles"], profile["id"], {"is_primary": False})
-
-        has_profiles = await self._has_profiles(user_id)
+            await self._clear_primary(user_id)
 
         # Extract social links from contact info
         contact = parsed_data.get("contact_info") or {}
@@ -79,6 +113,7 @@ class ProfileService:
             "summary": parsed_data.get("summary"),
             "raw_resume_text": raw_text,
             "file_type": file_type,
+            "content_hash": content_hash,
             "parsed_data": parsed_data,
             "contact_info": contact,
             "skills": parsed_data.get("skills", []),
@@ -93,19 +128,36 @@ class ProfileService:
             "profile_version": 1,
             "universal_docs_version": 0,
         }
+        # Completeness only reads fields set above, so store it with the insert.
+        profile_data["completeness_score"] = self.compute_completeness(profile_data)["score"]
 
-        doc_id = await self.db.create(TABLES["profiles"], profile_data)
-        profile = await self.db.get(TABLES["profiles"], doc_id)
+        created = await self.db.create_returning(TABLES["profiles"], profile_data)
+        await self.invalidate_cached_profiles(user_id)
+        return created
 
-        # Compute and persist completeness score
-        completeness = self.compute_completeness(profile)
-        await self.db.update(TABLES["profiles"], doc_id, {"completeness_score": completeness["score"]})
-        profile["completeness_score"] = completeness["score"]
+    async def _find_by_content_hash(self, user_id: str, content_hash: str) -> Optional[Dict[str, Any]]:
+        rows = await self.db.query(
+            TABLES["profiles"],
+            filters=[("user_id", "==", user_id), ("content_hash", "==", content_hash)],
+            limit=1,
+        )
+        return rows[0] if rows else None
 
-        return profile
+    async def _clear_primary(self, user_id: str) -> None:
+        # Only the (usually single) primary row's id is needed, not every
+        # profile with its resume text and parsed payload.
+        primaries = await self.db.query(
+            TABLES["profiles"],
+            filters=[("user_id", "==", user_id), ("is_primary", "==", True)],
+            columns="id",
+        )
+        for profile in primaries:
+            await self.db.update(TABLES["profiles"], profile["id"], {"is_primary": False})
 
     async def _has_profiles(self, user_id: str) -> bool:
-        profiles = await self.db.query(TABLES["profiles"], filters=[("user_id", "==", user_id)], limit=1)
+        profiles = await self.db.query(
+            TABLES["profiles"], filters=[("user_id", "==", user_id)], limit=1, columns="id",
+        )
         return len(profiles) > 0
 
     async def get_user_profiles(self, user_id: str) -> List[Dict[str, Any]]:
@@ -117,12 +169,22 @@ class ProfileService:
         )
 
     async def get_primary_profile(self, user_id: str) -> Optional[Dict[str, Any]]:
+        cache_key = _primary_cache_key(user_id)
+        cached = await cache_get(cache_key)
+        if cached is not None:
+            return cached
         profiles = await self.db.query(
             TABLES["profiles"],
             filters=[("user_id", "==", user_id), ("is_primary", "==", True)],
             limit=1,
         )
-        return profiles[0] if profiles else None
+        if not profiles:
+            return None
+        await cache_set(cache_key, profiles[0], ttl=PRIMARY_PROFILE_CACHE_TTL_S)
+        return profiles[0]
+
+    async def invalidate_cached_profiles(self, user_id: str) -> None:
+        await cache_invalidate(_primary_cache_key(user_id), _list_cache_key(user_id))
 
     async def get_profile(self, profile_id: str, user_id: str) -> Optional[Dict[str, Any]]:
         profile = await self.db.get(TABLES["profiles"], profile_id)
@@ -142,6 +204,7 @@ class ProfileService:
         update_data["profile_version"] = current_version + 1
 
         await self.db.update(TABLES["profiles"], profile_id, update_data)
+        await self.invalidate_cached_profiles(user_id)
         updated = await self.db.get(TABLES["profiles"], profile_id)
 
         # Recompute and persist completeness score
@@ -156,19 +219,19 @@ class ProfileService:
         if not profile:
             return False
         await self.db.delete(TABLES["profiles"], profile_id)
+        await self.invalidate_cached_profiles(user_id)
         return True
 
     async def set_primary(self, profile_id: str, user_id: str) -> Optional[Dict[str, Any]]:
-        existing_profiles = await self.get_user_profiles(user_id)
-        for profile in existing_profiles:
-            if profile.get("is_primary"):
-                await self.db.update(TABLES["profiles"], profile["id"], {"is_primary": False})
+        await self._clear_primary(user_id)
 
         profile = await self.get_profile(profile_id, user_id)
         if not profile:
+            await self.invalidate_cached_profiles(user_id)
             return None
 
         await self.db.update(TABLES["profiles"], profile_id, {"is_primary": True})
+        await self.invalidate_cached_profiles(user_id)
         return await self.db.get(TABLES["profiles"], profile_id)
 
     async def reparse_profile(self, profile_id: str, user_id: str) -> Optional[Dict[str, Any]]:
@@ -313,8 +376,8 @@ class ProfileService:
         edu_score = min(100, len(education) * 40)
 
         # Evidence from vault
-        evidence = await self.db.query(TABLES["evidence"], filters=[("user_id", "==", user_id)])
-        evidence_score = min(100, len(evidence) * 15)
+        evidence_count = await self.db.count(TABLES["evidence"], filters=[("user_id", "==", user_id)])
+        evidence_score = min(100, evidence_count * 15)
 
         # Weighted total
         breakdown = {
@@ -348,6 +411,7 @@ class ProfileService:
         # Update cached score
         try:
             await self.db.update(TABLES["profiles"], profile["id"], {"resume_worth_score": score})
+            await self.invalidate_cached_profiles(user_id)
         except Exception:
             logger.warning("resume_worth_score_cache_failed", profile_id=profile["id"])
 
@@ -548,6 +612,7 @@ class ProfileService:
         contact["market_intelligence"] = result
         try:
             await self.db.update(TABLES["profiles"], profile["id"], {"contact_info": contact})
+            await self.invalidate_cached_profiles(user_id)
         except Exception:
             logger.warning("market_intel_cache_store_failed", profile_id=profile["id"])
 
@@ -585,6 +650,7 @@ class ProfileService:
                 "universal_documents": docs,
                 "universal_docs_version": profile_version,
             })
+            await self.invalidate_cached_profiles(user_id)
         except Exception:
             logger.warning("universal_docs_store_failed", profile_id=profile_id)
 
@@ -11,6 +11,13 @@ from ai_engine.chains.career_consultant import CareerConsultantChain
 
 logger = structlog.get_logger()
 
+# Projection for the list view.  The learning-path, milestone, timeline and
+# resource JSONB blobs are fetched by get_roadmap().
+LIST_COLUMNS = (
+    "id,user_id,gap_report_id,title,description,progress,status,"
+    "created_at,updated_at"
+)
+
 
 class RoadmapService:
     """Service for roadmap operations using Firestore."""
@@ -82,9 +89,9 @@ class RoadmapService:
             "status": "active",
         }
 
-        doc_id = await self.db.create(COLLECTIONS["roadmaps"], record)
-        logger.info("roadmap_generated", roadmap_id=doc_id)
-        return await self.db.get(COLLECTIONS["roadmaps"], doc_id)
+        created = await self.db.create_returning(COLLECTIONS["roadmaps"], record)
+        logger.info("roadmap_generated", roadmap_id=created["id"])
+        return created
 
     async def get_user_roadmaps(self, user_id: str, limit: int = 50) -> List[Dict[str, Any]]:
         return await self.db.query(
@@ -93,6 +100,7 @@ class RoadmapService:
             order_by="created_at",
             order_direction="DESCENDING",
             limit=limit,
+            columns=LIST_COLUMNS,
         )
 
     async def get_roadmap(self, roadmap_id: str, user_id: str) -> Optional[Dict[str, Any]]:
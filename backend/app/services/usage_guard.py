@@ -233,7 +233,6 @@ async def _upsert_user_row(
                     "generation_count": int(current.get("generation_count", 0)) + 1,
                     "token_total": int(current.get("token_total", 0)) + token_total,
                     "cost_cents": int(current.get("cost_cents", 0)) + cost_cents,
-                    "updated_at": "now()",
                 }
             ).eq("user_id", user_id).eq("usage_date", today).execute()
         else:
@@ -271,7 +270,6 @@ async def _upsert_platform_row(
                     "generation_count": int(current.get("generation_count", 0)) + 1,
                     "token_total": int(current.get("token_total", 0)) + token_total,
                     "cost_cents": int(current.get("cost_cents", 0)) + cost_cents,
-                    "updated_at": "now()",
                 }
             ).eq("spend_date", today).execute()
         else:
@@ -16,16 +16,16 @@ from typing import AsyncGenerator
 
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from urllib.parse import urlparse
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 
 from app.core.config import settings
-from app.core.database import init_supabase, get_supabase
+from app.core.database import init_supabase, get_supabase, schedule_supabase_warmup
 from app.core.tracing import RequestIDMiddleware, AccessLogMiddleware, MaxBodySizeMiddleware, TimeoutMiddleware, request_id_var
-from app.core.observability import redact_event_dict, sentry_before_send
+from app.core.observability import install_queue_logging, redact_event_dict, sentry_before_send
 from app.api.routes import router as api_router
 
 # ── Sentry Error Monitoring ────────────────────────────────────────────
@@ -70,6 +70,7 @@ structlog.configure(
 )
 
 logger = structlog.get_logger()
+install_queue_logging()
 
 # Import the shared per-user limiter from security module
 from app.core.security import limiter  # noqa: E402
@@ -83,6 +84,17 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     init_supabase()
     logger.info("Supabase client initialized")
 
+    # Open the first PostgREST connection off the request path.
+    schedule_supabase_warmup()
+
+    # Import PDF/DOCX parsers in the background so the first upload per
+    # worker doesn't pay for pdfminer/lxml initialisation.
+    try:
+        from app.services.file_parser import schedule_parser_warmup
+        schedule_parser_warmup()
+    except Exception as e:
+        logger.debug("Parser warm-up skipped", error=str(e)[:200])
+
     # Eagerly initialize Redis cache connection
     try:
         from app.core.database import get_redis
@@ -193,6 +205,15 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     except Exception as wd_err:
         logger.warning("Failed to start JobWatchdog", error=str(wd_err)[:200])
 
+    # Batch analytics inserts off the request path.
+    _analytics_buffer = None
+    try:
+        from app.services.analytics_buffer import start_analytics_buffer
+        from app.core.database import TABLES, get_db
+        _analytics_buffer = start_analytics_buffer(get_db(), TABLES["analytics"])
+    except Exception as ab_err:
+        logger.warning("Failed to start analytics buffer", error=str(ab_err)[:200])
+
     # Register SIGTERM handler for graceful shutdown (Railway sends SIGTERM)
     import signal
 
@@ -242,6 +263,18 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
             await _watchdog.stop()
         except Exception:
             pass
+    # Flush queued analytics events while the DB client is still open
+    if _analytics_buffer is not None:
+        try:
+            await _analytics_buffer.stop()
+        except Exception:
+            pass
+    # Release pooled Gemini HTTP connections
+    try:
+        from ai_engine.client import close_shared_clients
+        close_shared_clients()
+    except Exception:
+        pass
     # Release database client
     from app.core.database import close_supabase
     close_supabase()
@@ -276,6 +309,9 @@ app = FastAPI(
     docs_url="/docs" if settings.debug else None,
     redoc_url="/redoc" if settings.debug else None,
     lifespan=lifespan,
+    # orjson instead of the stdlib encoder for every route that returns
+    # plain data; explicit JSONResponse/Response returns are unaffected.
+    default_response_class=ORJSONResponse,
 )
 
 app.state.limiter = limiter
@@ -311,6 +347,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH"],
     allow_headers=["Authorization", "Content-Type", "X-Org-Id", "X-API-Key", "Accept", "Origin", "X-Request-ID"],
+    # Keyset cursor for paginated list endpoints (see app.api.response.set_next_cursor).
+    expose_headers=["X-Next-Cursor"],
 )
 
 # Request-ID tracing (runs BEFORE security headers so the ID is available everywhere)
@@ -21,6 +21,9 @@ class FakeDB:
         self._store.setdefault(table, []).append(row)
         return new_id
 
+    async def create_many(self, table, rows):
+        return [await self.create(table, row) for row in rows]
+
     async def get(self, table, doc_id):
         for r in self._store.get(table, []):
             if r.get("id") == doc_id:
@@ -39,6 +42,11 @@ class FakeDB:
         self._store[table] = [r for r in rows if r.get("id") != doc_id]
         return True
 
+    async def delete_where(self, table, filters=None):
+        doomed = {r["id"] for r in await self.query(table, filters=filters)}
+        self._store[table] = [r for r in self._store.get(table, []) if r.get("id") not in doomed]
+        return True
+
     async def query(self, table, filters=None, order_by=None, order_direction="DESCENDING", limit=None, offset=None):
         rows = list(self._store.get(table, []))
         if filters:
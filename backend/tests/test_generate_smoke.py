@@ -216,6 +216,21 @@ async def test_generate_pipeline_rejects_oversized_jd(aclient):
     assert resp.status_code == 413
 
 
+@pytest.mark.asyncio
+async def test_generate_pipeline_schema_errors_keep_422_shape(aclient):
+    """Bodies decoded by pipeline_request_body still fail with body-scoped 422s."""
+    resp = await aclient.post("/api/generate/pipeline", json={"jd_text": "Some JD text"})
+    assert resp.status_code == 422
+    assert {"field": "body.job_title", "message": "Field required", "type": "missing"} in resp.json()["errors"]
+
+    resp = await aclient.post(
+        "/api/generate/pipeline",
+        content=b"{not json",
+        headers={"Content-Type": "application/json"},
+    )
+    assert resp.status_code == 422
+
+
 @pytest.mark.asyncio
 async def test_stream_endpoint_returns_sse(aclient):
     """POST /api/generate/pipeline/stream returns text/event-stream."""
@@ -505,3 +520,52 @@ def test_pipeline_timeout_constant_exists():
     """PIPELINE_TIMEOUT constant is defined."""
     from app.api.routes.generate import PIPELINE_TIMEOUT
     assert PIPELINE_TIMEOUT == 300  # 5 minutes
+
+
+@pytest.mark.asyncio
+async def test_identical_pipeline_request_is_served_from_cache(aclient, monkeypatch):
+    """A repeat of a fully successful request replays the cached result."""
+    from app.core import cache as cache_mod
+    monkeypatch.setattr(cache_mod, "get_redis", lambda: None)
+    cache_mod._MEM_CACHE.clear()
+
+    payload = {
+        "job_title": "Cache Probe Engineer",
+        "company": "CacheCo",
+        "jd_text": "We need a Python engineer who likes caches...",
+        "resume_text": "I am a Python engineer...",
+    }
+    with (
+        patch("app.api.routes.generate.sync_pipeline._RUNTIME_AVAILABLE", False),
+        patch("ai_engine.client.AIClient"),
+        patch("ai_engine.chains.role_profiler.RoleProfilerChain") as MockProfiler,
+        patch("ai_engine.chains.benchmark_builder.BenchmarkBuilderChain") as MockBenchmark,
+        patch("ai_engine.chains.gap_analyzer.GapAnalyzerChain") as MockGap,
+        patch("ai_engine.chains.document_generator.DocumentGeneratorChain") as MockDocGen,
+        patch("ai_engine.chains.career_consultant.CareerConsultantChain") as MockConsultant,
+        patch("ai_engine.chains.validator.ValidatorChain") as MockValidator,
+        patch("ai_engine.chains.document_discovery.DocumentDiscoveryChain") as MockDiscovery,
+        patch("ai_engine.chains.adaptive_document.AdaptiveDocumentChain") as MockAdaptive,
+        patch("ai_engine.chains.company_intel.CompanyIntelChain") as MockIntel,
+        patch("app.services.document_catalog.discover_and_observe", new_callable=AsyncMock, return_value=None),
+    ):
+        _wire_happy_path_mocks(
+            MockProfiler, MockBenchmark, MockGap, MockDocGen,
+            MockConsultant, MockValidator, MockDiscovery, MockIntel, MockAdaptive,
+        )
+
+        first = await aclient.post("/api/generate/pipeline", json=payload)
+        second = await aclient.post("/api/generate/pipeline", json=payload)
+        assert first.status_code == second.status_code == 200
+        assert first.json() == second.json()
+        assert MockDocGen.return_value.generate_tailored_cv.await_count == 1
+
+        bypass = await aclient.post(
+            "/api/generate/pipeline", json=payload, headers={"X-No-Cache": "1"},
+        )
+        assert bypass.status_code == 200
+        assert MockDocGen.return_value.generate_tailored_cv.await_count == 2
+        # Benchmark and gap sub-results are re-used on the bypass run.
+        assert MockBenchmark.return_value.create_ideal_profile.await_count == 1
+        assert MockGap.return_value.analyze_gaps.await_count == 1
+    cache_mod._MEM_CACHE.clear()
@@ -192,3 +192,36 @@ def test_sensitive_keys_is_non_empty_tuple() -> None:
     silently disable redaction."""
     assert isinstance(SENSITIVE_KEYS, tuple)
     assert len(SENSITIVE_KEYS) >= 10
+
+
+def test_queue_logging_moves_writes_off_the_caller(monkeypatch, capsys) -> None:
+    """Records reach stderr via the listener thread; the caller only enqueues."""
+    import atexit
+    import logging
+    import logging.handlers
+
+    from app.core.observability import install_queue_logging
+
+    root = logging.getLogger()
+    monkeypatch.setattr(root, "handlers", [])
+    listener = install_queue_logging()
+    assert listener is not None
+    atexit.unregister(listener.stop)
+    try:
+        assert [type(h) for h in root.handlers] == [logging.handlers.QueueHandler]
+        assert install_queue_logging() is None  # idempotent
+        logging.getLogger("hirestack.test").warning("token_verification_failed")
+    finally:
+        listener.stop()
+    assert "token_verification_failed" in capsys.readouterr().err
+
+
+def test_queue_logging_leaves_configured_root_alone(monkeypatch) -> None:
+    import logging
+
+    from app.core.observability import install_queue_logging
+
+    existing = logging.NullHandler()
+    monkeypatch.setattr(logging.getLogger(), "handlers", [existing])
+    assert install_queue_logging() is None
+    assert logging.getLogger().handlers == [existing]
@@ -22,20 +22,12 @@ class FakeOrgDB:
 
 
 @pytest.mark.asyncio
-async def test_delete_org_removes_org_owned_rows_before_org():
+async def test_delete_org_relies_on_db_cascade_for_org_owned_rows():
     db = FakeOrgDB()
     service = OrgService(db=db)
 
     result = await service.delete_org("org-1")
 
     assert result is True
-    assert db.delete_where_calls == [
-        (TABLES["candidates"], [("org_id", "==", "org-1")]),
-        (TABLES["usage_records"], [("org_id", "==", "org-1")]),
-        (TABLES["audit_logs"], [("org_id", "==", "org-1")]),
-        (TABLES["org_invitations"], [("org_id", "==", "org-1")]),
-        (TABLES["webhooks"], [("org_id", "==", "org-1")]),
-        (TABLES["subscriptions"], [("org_id", "==", "org-1")]),
-        (TABLES["org_members"], [("org_id", "==", "org-1")]),
-    ]
+    assert db.delete_where_calls == []
     assert db.delete_calls == [(TABLES["organizations"], "org-1")]
@@ -19,6 +19,9 @@ class FakeDB:
         self._store[doc_id] = {**data, "id": doc_id}
         return doc_id
 
+    async def create_returning(self, table, data):
+        return self._store[await self.create(table, data)]
+
     async def get(self, table, doc_id):
         return self._store.get(doc_id)
 
@@ -32,13 +35,16 @@ class FakeDB:
         self._store.pop(doc_id, None)
         return True
 
-    async def query(self, table, filters=None, order_by=None, order_direction=None, limit=None):
+    async def query(self, table, filters=None, order_by=None, order_direction=None, limit=None, columns="*"):
         results = list(self._store.values())
         if filters:
             for field, op, value in filters:
                 results = [r for r in results if r.get(field) == value]
         return results[:limit] if limit else results
 
+    async def count(self, table, filters=None):
+        return len(await self.query(table, filters=filters))
+
 
 def _make_parsed_data():
     return {
@@ -310,3 +316,62 @@ async def test_connect_social_validates_platform(client):
         headers={"Authorization": "Bearer fake"},
     )
     assert resp.status_code in (400, 401, 503)
+
+
+@pytest.mark.asyncio
+async def test_identical_reupload_returns_existing_profile(profile_service, fake_db):
+    """Re-uploading byte-identical contents skips parsing and returns the stored profile."""
+    parsed = _make_parsed_data()
+    with patch.object(profile_service.file_parser, "extract_text", new_callable=AsyncMock, return_value="resume text") as extract:
+        with patch("app.services.profile.RoleProfilerChain") as MockChain:
+            MockChain.return_value.parse_resume = AsyncMock(return_value=parsed)
+
+            first = await profile_service.create_from_upload(
+                user_id="user-1", file_contents=b"same bytes", file_name="resume.pdf", file_type=".pdf",
+            )
+            second = await profile_service.create_from_upload(
+                user_id="user-1", file_contents=b"same bytes", file_name="resume-copy.pdf", file_type=".pdf",
+            )
+            other_user = await profile_service.create_from_upload(
+                user_id="user-2", file_contents=b"same bytes", file_name="resume.pdf", file_type=".pdf",
+            )
+
+    assert second["id"] == first["id"]
+    assert other_user["id"] != first["id"]
+    assert extract.await_count == 2
+    assert MockChain.return_value.parse_resume.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_upload_persists_completeness_with_insert(profile_service, fake_db):
+    """Completeness is part of the insert payload — no follow-up update round-trip."""
+    parsed = _make_parsed_data()
+    fake_db.update = AsyncMock(side_effect=AssertionError("unexpected update"))
+    with patch.object(profile_service.file_parser, "extract_text", new_callable=AsyncMock, return_value="resume text"):
+        with patch("app.services.profile.RoleProfilerChain") as MockChain:
+            MockChain.return_value.parse_resume = AsyncMock(return_value=parsed)
+
+            result = await profile_service.create_from_upload(
+                user_id="user-9", file_contents=b"fresh", file_name="resume.pdf", file_type=".pdf",
+            )
+
+    assert result["completeness_score"] == profile_service.compute_completeness(result)["score"]
+    assert result["is_primary"] is True  # first profile for the user
+
+
+@pytest.mark.asyncio
+async def test_primary_profile_is_cached_until_a_write(profile_service, fake_db):
+    """Repeat reads skip the DB; profile writes drop the cached copy."""
+    fake_db._store["pc1"] = {"id": "pc1", "user_id": "u-primary-cache", "is_primary": True, "profile_version": 1}
+    fake_db._store["pc2"] = {"id": "pc2", "user_id": "u-primary-cache", "is_primary": False, "profile_version": 1}
+    query = AsyncMock(side_effect=fake_db.query)
+    fake_db.query = query
+
+    first = await profile_service.get_primary_profile("u-primary-cache")
+    second = await profile_service.get_primary_profile("u-primary-cache")
+    assert first["id"] == second["id"] == "pc1"
+    assert query.await_count == 1
+
+    await profile_service.set_primary("pc2", "u-primary-cache")
+    after = await profile_service.get_primary_profile("u-primary-cache")
+    assert after["id"] == "pc2"
@@ -0,0 +1,77 @@
+"""AnalyticsEventBuffer — batched, best-effort analytics inserts."""
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, List
+
+import pytest
+
+from app.services.analytics_buffer import AnalyticsEventBuffer
+
+
+class _FakeDB:
+    def __init__(self, fail: bool = False):
+        self.batches: List[List[Dict[str, Any]]] = []
+        self.fail = fail
+
+    async def create_many(self, table: str, rows: List[Dict[str, Any]]) -> List[str]:
+        if self.fail:
+            raise RuntimeError("boom")
+        self.batches.append(list(rows))
+        return [str(i) for i in range(len(rows))]
+
+
+@pytest.mark.asyncio
+async def test_flush_writes_queued_events_in_max_batch_chunks():
+    db = _FakeDB()
+    buf = AnalyticsEventBuffer(db, "analytics", max_batch=2)
+    for i in range(5):
+        assert buf.enqueue({"event_type": f"e{i}"})
+
+    assert await buf.flush() == 5
+    assert [len(b) for b in db.batches] == [2, 2, 1]
+
+
+@pytest.mark.asyncio
+async def test_full_queue_drops_instead_of_blocking():
+    buf = AnalyticsEventBuffer(_FakeDB(), "analytics", max_queue=1)
+    assert buf.enqueue({"event_type": "a"}) is True
+    assert buf.enqueue({"event_type": "b"}) is False
+
+
+@pytest.mark.asyncio
+async def test_stop_drains_pending_events():
+    db = _FakeDB()
+    buf = AnalyticsEventBuffer(db, "analytics", flush_interval_s=60)
+    buf.start()
+    assert buf.running
+    buf.enqueue({"event_type": "a"})
+    buf.enqueue({"event_type": "b"})
+
+    await buf.stop()
+
+    assert not buf.running
+    assert db.batches == [[{"event_type": "a"}, {"event_type": "b"}]]
+
+
+@pytest.mark.asyncio
+async def test_reaching_max_batch_triggers_an_early_flush():
+    db = _FakeDB()
+    buf = AnalyticsEventBuffer(db, "analytics", max_batch=2, flush_interval_s=60)
+    buf.start()
+    buf.enqueue({"event_type": "a"})
+    buf.enqueue({"event_type": "b"})
+    for _ in range(50):
+        if db.batches:
+            break
+        await asyncio.sleep(0.01)
+
+    assert db.batches == [[{"event_type": "a"}, {"event_type": "b"}]]
+    await buf.stop()
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_is_logged_not_raised():
+    buf = AnalyticsEventBuffer(_FakeDB(fail=True), "analytics")
+    buf.enqueue({"event_type": "a"})
+    assert await buf.flush() == 0
@@ -0,0 +1,129 @@
+"""AnalyticsService dashboard and progress — aggregated in Postgres, read concurrently."""
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, List
+
+import pytest
+
+from app.core import cache
+from app.core.database import TABLES
+from app.services.analytics import AnalyticsService
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache(monkeypatch):
+    monkeypatch.setattr(cache, "get_redis", lambda: None)
+    cache._MEM_CACHE.clear()
+    yield
+    cache._MEM_CACHE.clear()
+
+
+class _FakeDB:
+    def __init__(self, rows: Dict[str, List[Dict[str, Any]]], fail: str = "") -> None:
+        self.rows = rows
+        self.fail = fail
+        self.rpcs: List[tuple] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _enter(self, name: str) -> None:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        if name == self.fail:
+            raise RuntimeError("boom")
+
+    async def rpc(self, fn: str, params: Dict[str, Any]) -> Dict[str, int]:
+        self.rpcs.append((fn, params))
+        await self._enter(fn)
+        return {"applications": 2, "active_applications": 1, "tasks": 2, "completed_tasks": 1,
+                "ats_scans": 3, "latest_score": 74}
+
+    async def query(self, table: str, **_kw) -> List[Dict[str, Any]]:
+        await self._enter(table)
+        return self.rows.get(table, [])
+
+
+_ROWS = {TABLES["learning_streaks"]: [{"current_streak": 4}]}
+
+
+@pytest.mark.asyncio
+async def test_counts_and_score_come_from_one_rpc_alongside_streak():
+    db = _FakeDB(_ROWS)
+    out = await AnalyticsService(db).get_dashboard("u1")
+
+    assert db.rpcs == [("dashboard_counts", {"p_user_id": "u1"})]
+    assert db.max_in_flight == 2
+    assert out["applications"] == 2
+    assert out["active_applications"] == 1
+    assert out["profiles"] == 0
+    assert out["latest_score"] == 74
+    assert out["ats_scans"] == 3
+    assert out["learning_streak"] == 4
+    assert out["summary"]["task_completion_rate"] == 50.0
+
+
+@pytest.mark.asyncio
+async def test_streak_failure_falls_back_to_zero():
+    out = await AnalyticsService(_FakeDB(_ROWS, fail=TABLES["learning_streaks"])).get_dashboard("u1")
+    assert out["learning_streak"] == 0
+    assert out["applications"] == 2
+
+
+@pytest.mark.asyncio
+async def test_counts_failure_propagates():
+    with pytest.raises(RuntimeError):
+        await AnalyticsService(_FakeDB(_ROWS, fail="dashboard_counts")).get_dashboard("u1")
+
+
+class _ProgressDB:
+    def __init__(self, stats: Dict[str, Any]) -> None:
+        self.stats = stats
+        self.rpcs: List[tuple] = []
+
+    async def rpc(self, fn: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        self.rpcs.append((fn, params))
+        return self.stats
+
+
+@pytest.mark.asyncio
+async def test_progress_reads_the_aggregate_row():
+    db = _ProgressDB({"total": 5, "scored": 3, "average": 67.3333, "best": 80, "first": 55, "latest": 72})
+    out = await AnalyticsService(db).get_progress("u1")
+
+    assert db.rpcs == [("application_score_progress", {"p_user_id": "u1"})]
+    assert out == {
+        "has_data": True,
+        "total_applications": 5,
+        "scored_applications": 3,
+        "average_score": 67.3,
+        "best_score": 80,
+        "latest_score": 72,
+        "improvement": 17,
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("stats, message", [
+    ({"total": 0, "scored": 0}, "No applications yet."),
+    ({"total": 2, "scored": 0}, "No scored applications yet."),
+])
+async def test_progress_without_scores(stats, message):
+    out = await AnalyticsService(_ProgressDB(stats)).get_progress("u1")
+    assert out == {"has_data": False, "message": message}
+
+
+@pytest.mark.asyncio
+async def test_repeat_reads_are_served_from_the_summary_cache():
+    db = _FakeDB(_ROWS)
+    service = AnalyticsService(db)
+    first = await service.get_dashboard("u1")
+    assert await service.get_dashboard("u1") == first
+    assert len(db.rpcs) == 1
+
+    progress_db = _ProgressDB({"total": 0})
+    await AnalyticsService(progress_db).get_progress("u1")
+    await AnalyticsService(progress_db).get_progress("u1")
+    assert len(progress_db.rpcs) == 1
@@ -104,6 +104,19 @@ def test_embedding_path_used_when_model_loads(monkeypatch):
     assert 0.8 <= score <= 0.9
 
 
+def test_embedding_path_uses_vector_dot_when_rows_support_it(monkeypatch):
+    class _Row(list):
+        def __matmul__(self, other):
+            return 0.5
+
+    class _ArrayModel:
+        def encode(self, texts, show_progress_bar=False, normalize_embeddings=True):
+            return [_Row([1.0, 0.0]), _Row([1.0, 0.0])]
+
+    monkeypatch.setattr(skill_graph, "_get_model", lambda: _ArrayModel())
+    assert skill_similarity("foobar", "bazquux") == (0.5, "embedding")
+
+
 def test_embedding_failure_falls_through_to_substring(monkeypatch):
     class _BrokenModel:
         def encode(self, *_, **__):
@@ -168,6 +181,15 @@ def test_skill_match_to_dict_shape():
     }
 
 
+def test_skill_match_is_frozen_and_slotted():
+    import dataclasses
+
+    m = SkillMatch(candidate_skill="A", target_skill="B", score=0.5)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        m.score = 0.9  # type: ignore[misc]
+    assert not hasattr(m, "__dict__")
+
+
 # ─── caching ─────────────────────────────────────────────────────
 
 
@@ -184,3 +206,46 @@ def test_lru_cache_reuses_results(monkeypatch):
     skill_similarity("xyz1", "xyz2")
     skill_similarity("xyz1", "xyz2")
     assert calls["n"] == 1
+
+
+def test_compute_skill_match_encodes_all_skills_in_one_batch(monkeypatch):
+    batches = []
+
+    class _BatchModel:
+        def encode(self, texts, show_progress_bar=False, normalize_embeddings=True):
+            batches.append(list(texts))
+            return [[1.0, 0.0] for _ in texts]
+
+    monkeypatch.setattr(skill_graph, "_get_model", lambda: _BatchModel())
+    matches = compute_skill_match(["xyz1", "xyz2"], ["abc1", "abc2"])
+
+    assert len(batches) == 1
+    assert sorted(batches[0]) == ["abc1", "abc2", "xyz1", "xyz2"]
+    assert {m.target_skill for m in matches} == {"abc1", "abc2"}
+
+
+def test_compute_skill_match_skips_model_when_pairs_resolve_statically(monkeypatch):
+    def _fail():
+        raise AssertionError("model must not load")
+
+    monkeypatch.setattr(skill_graph, "_get_model", _fail)
+    matches = compute_skill_match(["JavaScript"], ["TypeScript"])
+    assert matches[0].source == "static"
+
+
+def test_vector_cache_keeps_recently_probed_skills(monkeypatch):
+    encoded = []
+
+    class _Model:
+        def encode(self, texts, show_progress_bar=False, normalize_embeddings=True):
+            encoded.extend(texts)
+            return [[1.0, 0.0] for _ in texts]
+
+    monkeypatch.setattr(skill_graph, "_VECTOR_CACHE_MAX", 2)
+    model = _Model()
+    skill_graph._encode_many(model, ["a", "b"])
+    skill_graph._encode_many(model, ["a"])        # refresh "a"
+    skill_graph._encode_many(model, ["c"])        # evicts "b", not "a"
+    encoded.clear()
+    skill_graph._encode_many(model, ["a", "b"])
+    assert encoded == ["b"]
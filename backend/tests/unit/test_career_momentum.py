@@ -0,0 +1,60 @@
+"""PredictiveCareerForecaster.get_career_momentum — concurrent, column-narrowed reads."""
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, List
+
+import pytest
+
+from app.core.database import TABLES
+from app.services.career_analytics import PredictiveCareerForecaster
+
+
+class _FakeDB:
+    def __init__(self, fail: str = "") -> None:
+        self.fail = fail
+        self.columns: Dict[str, str] = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def query(self, table: str, columns: str = "*", **_kw) -> List[Dict[str, Any]]:
+        self.columns[table] = columns
+        if table != TABLES["applications"] and table != TABLES["outcome_signals"]:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(0)
+            self.in_flight -= 1
+        if table == self.fail:
+            raise RuntimeError("boom")
+        return []
+
+    async def count(self, table: str, filters=None) -> int:
+        self.columns[table] = "count"
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        if table == self.fail:
+            raise RuntimeError("boom")
+        return 7
+
+
+@pytest.mark.asyncio
+async def test_follow_up_reads_run_together_with_narrow_columns():
+    db = _FakeDB()
+    out = await PredictiveCareerForecaster(db).get_career_momentum("u1")
+
+    assert db.max_in_flight == 3
+    assert db.columns[TABLES["user_evidence_nodes"]] == "count"
+    assert db.columns[TABLES["pipeline_telemetry"]] == "quality_scores"
+    assert out["components"]["evidence_strength"] == 7
+    assert out["components"]["profile_freshness"] == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_read_falls_back_to_neutral_component():
+    db = _FakeDB(fail=TABLES["user_evidence_nodes"])
+    out = await PredictiveCareerForecaster(db).get_career_momentum("u1")
+
+    assert out["components"]["evidence_strength"] == 10.0
+    assert out["components"]["quality_trend"] == 10.0
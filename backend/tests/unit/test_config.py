@@ -122,6 +122,23 @@ class TestGetSettingsCache:
         assert a is b, "get_settings() must be lru_cache'd — importers rely on identity"
 
 
+class TestUploadLimits:
+    def test_snapshot_matches_settings(self) -> None:
+        from app.core.config import settings, upload_limits
+
+        assert upload_limits.max_mb == settings.max_upload_size_mb
+        assert upload_limits.max_bytes == settings.max_upload_size_mb * 1024 * 1024
+        assert upload_limits.allowed_exts == frozenset(settings.allowed_file_types)
+
+    def test_snapshot_is_frozen(self) -> None:
+        import dataclasses
+
+        from app.core.config import upload_limits
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            upload_limits.max_bytes = 1  # type: ignore[misc]
+
+
 # ---------------------------------------------------------------------------
 # Default values (#4)
 # ---------------------------------------------------------------------------
@@ -20,6 +20,7 @@ from app.services.document_catalog import (  # noqa: E402
     SEED_CATALOG,
     SEED_KEYS,
     _infer_category,
+    ensure_catalog_seeded,
     get_catalog_id_map,
     get_catalog_keyset,
     get_full_catalog,
@@ -305,3 +306,54 @@ class TestObserveDocumentTypes:
             entry = upsert_calls[0][0][0][0]
             assert "executive" in entry["source_context"]
             assert "VP Engineering" in entry["source_context"]
+
+
+# ── Seeding memo ───────────────────────────────────────────────────────
+
+class TestEnsureCatalogSeeded:
+    @pytest.fixture(autouse=True)
+    def _fresh_memo(self, monkeypatch):
+        import app.services.document_catalog as mod
+
+        store: dict = {}
+
+        async def _get(key):
+            return store.get(key)
+
+        async def _set(key, value, ttl=None):
+            store[key] = value
+
+        monkeypatch.setattr(mod, "_catalog_seeded", False)
+        monkeypatch.setattr(mod, "cache_get", _get)
+        monkeypatch.setattr(mod, "cache_set", _set)
+        self.store = store
+
+    @pytest.mark.asyncio
+    async def test_seeds_once_per_process(self):
+        db = _mock_db()
+        await ensure_catalog_seeded(db, TABLES)
+        await ensure_catalog_seeded(db, TABLES)
+        assert db.table.return_value.upsert.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_shared_marker_skips_seed_in_other_workers(self, monkeypatch):
+        import app.services.document_catalog as mod
+
+        await ensure_catalog_seeded(_mock_db(), TABLES)
+        monkeypatch.setattr(mod, "_catalog_seeded", False)  # simulate a new worker
+
+        db = _mock_db()
+        await ensure_catalog_seeded(db, TABLES)
+        db.table.return_value.upsert.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failed_seed_is_retried(self):
+        db = _mock_db()
+        db.table.return_value.execute.side_effect = Exception("DB down")
+        await ensure_catalog_seeded(db, TABLES)
+        assert not self.store
+
+        db.table.return_value.execute.side_effect = None
+        await ensure_catalog_seeded(db, TABLES)
+        assert db.table.return_value.upsert.call_count == 2
+        assert self.store
@@ -0,0 +1,52 @@
+"""EvidenceMapperService.auto_map replaces mappings with one DELETE + one INSERT."""
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+import pytest
+
+import app.services.evidence_mapper as evidence_mapper
+
+
+class _FakeDB:
+    def __init__(self) -> None:
+        self.calls: List[tuple] = []
+
+    async def get(self, table: str, doc_id: str) -> Dict[str, Any]:
+        return {"id": doc_id, "user_id": "u1", "skill_gaps": [{"skill": "sql"}]}
+
+    async def query(self, table: str, **_kw) -> List[Dict[str, Any]]:
+        return [{"id": "ev1", "title": "Warehouse"}]
+
+    async def delete_where(self, table: str, filters=None) -> bool:
+        self.calls.append(("delete_where", table, filters))
+        return True
+
+    async def create_many(self, table: str, rows: List[Dict[str, Any]]) -> List[str]:
+        self.calls.append(("create_many", table, len(rows)))
+        return [f"m{i}" for i in range(len(rows))]
+
+
+class _FakeChain:
+    def __init__(self, _client) -> None:
+        pass
+
+    async def map_evidence(self, gaps, evidence):
+        return {"mappings": [
+            {"evidence_id": "ev1", "skill_name": "sql", "relevance_score": 80},
+            {"evidence_id": "ev1", "skill_name": "dbt", "relevance_score": 60},
+        ]}
+
+
+@pytest.mark.asyncio
+async def test_auto_map_batches_mapping_writes(monkeypatch):
+    monkeypatch.setattr(evidence_mapper, "get_ai_client", lambda: None)
+    monkeypatch.setattr(evidence_mapper, "EvidenceMapperChain", _FakeChain)
+    db = _FakeDB()
+
+    out = await evidence_mapper.EvidenceMapperService(db).auto_map("u1", "g1")
+
+    assert [c[0] for c in db.calls] == ["delete_where", "create_many"]
+    assert db.calls[0][2] == [("gap_report_id", "==", "g1"), ("user_id", "==", "u1")]
+    assert [m["id"] for m in out["mappings"]] == ["m0", "m1"]
+    assert out["mappings"][1]["skill_name"] == "dbt"
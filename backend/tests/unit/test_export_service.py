@@ -343,3 +343,16 @@ class TestFormatDispatch:
         assert svc._generate_markdown([]) == b""
         assert svc._generate_pdf([])[:5] == b"%PDF-"
         assert svc._generate_docx([])[:2] == b"PK"
+
+    @pytest.mark.asyncio
+    async def test_unknown_format_rejected_before_any_db_read(self):
+        svc = _svc()
+        with pytest.raises(ValueError, match="Unsupported format: rtf"):
+            await svc.create_export("u1", document_ids=["d1"], fmt="rtf")
+        svc.db.get_many.assert_not_called()
+
+    def test_format_enum_matches_plain_strings(self):
+        from app.services.export import _CONTENT_TYPES, ExportFormat
+
+        assert ExportFormat("docx") is ExportFormat.DOCX
+        assert _CONTENT_TYPES["markdown"] == "text/markdown"
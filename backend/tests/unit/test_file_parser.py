@@ -0,0 +1,136 @@
+"""FileParser extraction paths."""
+from __future__ import annotations
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.file_parser import FileParser
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("file_type,method", [("pdf", "_extract_pdf_sync"), ("docx", "_extract_docx_sync")])
+async def test_binary_formats_parse_on_dedicated_pool(monkeypatch, file_type, method):
+    seen: list[str] = []
+
+    def _fake(self, contents):
+        seen.append(threading.current_thread().name)
+        return "text"
+
+    monkeypatch.setattr(FileParser, method, _fake)
+    assert await FileParser().extract_text(b"x" * 200, file_type) == "text"
+    assert seen and seen[0].startswith("file-parse")
+
+
+def test_pdf_falls_back_to_pdfplumber_when_pdfium_finds_nothing(monkeypatch):
+    monkeypatch.setattr(FileParser, "_pdfium_page_texts", staticmethod(lambda contents: []))
+    monkeypatch.setattr(FileParser, "_pdfplumber_page_texts", staticmethod(lambda contents: ["Jane  Doe\f"]))
+    assert FileParser()._extract_pdf_sync(b"%PDF") == "Jane Doe\n"
+
+
+def test_pdf_prefers_pdfium_text(monkeypatch):
+    import app.services.file_parser as fp
+
+    monkeypatch.setattr(fp, "_pdfium", object())
+    monkeypatch.setattr(FileParser, "_pdfium_page_texts", staticmethod(lambda contents: ["Page one", "Page two"]))
+
+    def _unexpected(contents):
+        raise AssertionError("pdfplumber should not run")
+
+    monkeypatch.setattr(FileParser, "_pdfplumber_page_texts", staticmethod(_unexpected))
+    assert FileParser()._extract_pdf_sync(b"%PDF") == "Page one\n\nPage two"
+
+
+def _scanned_pdf(monkeypatch, *, ocr_enabled: bool):
+    import app.services.file_parser as fp
+
+    monkeypatch.setattr(fp, "_pdfium", object())
+    monkeypatch.setattr(fp.settings, "enable_ocr_fallback", ocr_enabled)
+    monkeypatch.setattr(FileParser, "_pdfium_page_texts", staticmethod(lambda contents: []))
+    monkeypatch.setattr(FileParser, "_pdfplumber_page_texts", staticmethod(lambda contents: []))
+    calls: list[bytes] = []
+
+    def _ocr(contents):
+        calls.append(contents)
+        return ["Jane Doe — Senior Engineer with ten years of Python and AWS. " * 3]
+
+    monkeypatch.setattr(FileParser, "_ocr_page_texts", staticmethod(_ocr))
+    return calls
+
+
+def test_scanned_pdf_uses_ocr_when_enabled(monkeypatch):
+    calls = _scanned_pdf(monkeypatch, ocr_enabled=True)
+    assert FileParser()._extract_pdf_sync(b"%PDF").startswith("Jane Doe")
+    assert len(calls) == 1
+
+
+def test_scanned_pdf_skips_ocr_when_disabled(monkeypatch):
+    calls = _scanned_pdf(monkeypatch, ocr_enabled=False)
+    with pytest.raises(ValueError, match="image-based"):
+        FileParser()._extract_pdf_sync(b"%PDF")
+    assert calls == []
+
+
+def test_pdfplumber_stops_reading_once_text_budget_is_met(monkeypatch):
+    import app.services.file_parser as fp
+
+    reads: list[int] = []
+
+    class _Page:
+        def __init__(self, n):
+            self.n = n
+
+        def extract_text(self, **kwargs):
+            reads.append(self.n)
+            return "x" * 30_000
+
+    class _Pdf:
+        pages = [_Page(n) for n in range(5)]
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+    monkeypatch.setattr(fp, "_get_pdfplumber", lambda: SimpleNamespace(open=lambda fh: _Pdf()))
+    texts = FileParser._pdfplumber_page_texts(b"%PDF")
+    assert reads == [0, 1]
+    assert len(texts) == 2
+
+
+def test_docx_extracts_headers_body_and_deduped_table_cells():
+    import io
+
+    from docx import Document
+
+    doc = Document()
+    doc.sections[0].header.paragraphs[0].text = "  Jane Doe  "
+    doc.add_paragraph("Senior Engineer")
+    doc.add_paragraph("   ")
+    table = doc.add_table(rows=1, cols=3)
+    table.rows[0].cells[0].text = "Python"
+    table.rows[0].cells[1].text = "Python"
+    table.rows[0].cells[2].text = "Go"
+    buf = io.BytesIO()
+    doc.save(buf)
+
+    text = FileParser()._extract_docx_sync(buf.getvalue())
+    assert text.splitlines() == ["Jane Doe", "Senior Engineer", "Python | Go"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("file_type,method", [(".PDF", "_extract_pdf"), ("doc", "_extract_docx"), ("Docx", "_extract_docx"), ("txt", "_extract_txt")])
+async def test_extract_text_dispatches_by_normalised_extension(monkeypatch, file_type, method):
+    async def _fake(self, contents):
+        return method
+
+    monkeypatch.setattr(FileParser, method, _fake)
+    assert await FileParser().extract_text(b"x" * 200, file_type) == method
+
+
+@pytest.mark.asyncio
+async def test_extract_text_rejects_unknown_extension():
+    with pytest.raises(ValueError, match="Unsupported file type: rtf"):
+        await FileParser().extract_text(b"x" * 200, ".rtf")
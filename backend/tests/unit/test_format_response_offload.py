@@ -0,0 +1,35 @@
+"""_format_response only leaves the event loop for large HTML payloads."""
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from app.api.routes.generate import helpers
+
+
+@pytest.fixture
+def record_thread(monkeypatch):
+    seen: list[int] = []
+
+    def _fake(**kwargs):
+        seen.append(threading.get_ident())
+        return {"ok": True}
+
+    monkeypatch.setattr(helpers, "_format_response", _fake)
+    return seen
+
+
+@pytest.mark.asyncio
+async def test_small_payload_formats_inline(record_thread):
+    out = await helpers._format_response_offloaded(cv_html="<p>hi</p>", portfolio_html="")
+    assert out == {"ok": True}
+    assert record_thread == [threading.get_ident()]
+
+
+@pytest.mark.asyncio
+async def test_large_payload_formats_in_executor(record_thread):
+    big = "x" * (helpers.FORMAT_OFFLOAD_CHARS + 1)
+    out = await helpers._format_response_offloaded(cv_html=big, portfolio_html=None)
+    assert out == {"ok": True}
+    assert record_thread and record_thread[0] != threading.get_ident()
@@ -0,0 +1,28 @@
+"""Pin the shared GapService / JobService singletons used by the routes."""
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.services import gap as gap_module
+from app.services import job as job_module
+
+
+@pytest.mark.parametrize(
+    "module, getter_name",
+    [(gap_module, "get_gap_service"), (job_module, "get_job_service")],
+)
+class TestServiceSingletons:
+    def test_singleton_identity(self, module, getter_name):
+        module._instance = None
+        try:
+            with patch.object(module, "get_firestore_db", return_value=MagicMock()), \
+                 patch.object(module, "AIClient", return_value=MagicMock()) as ai:
+                getter = getattr(module, getter_name)
+                a = getter()
+                b = getter()
+                assert a is b
+                ai.assert_called_once()
+        finally:
+            module._instance = None
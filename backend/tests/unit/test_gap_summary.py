@@ -0,0 +1,59 @@
+"""GapService summary fields are materialized at write time and read as columns."""
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.services import gap as gap_module
+
+
+def _service(db):
+    with patch.object(gap_module, "AIClient", return_value=MagicMock()):
+        return gap_module.GapService(db=db)
+
+
+def test_summary_fields_take_first_three_names():
+    analysis = {
+        "skill_gaps": [{"skill": "Go"}, {"area": "Cloud"}, {"skill": "SQL"}, {"skill": "Rust"}],
+        "strengths": [{"area": "Python"}],
+        "readiness_level": "almost-ready",
+    }
+    assert gap_module._summary_fields(analysis) == {
+        "top_gaps": ["Go", "Cloud", "SQL"],
+        "top_strengths": ["Python"],
+        "readiness_level": "almost-ready",
+    }
+    assert gap_module._summary_fields({})["readiness_level"] == "needs-work"
+
+
+def test_list_projection_skips_jsonb_blobs():
+    cols = gap_module.LIST_COLUMNS.split(",")
+    assert "top_gaps" in cols and "readiness_level" in cols
+    assert not {"summary", "skill_gaps", "strengths", "recommendations"} & set(cols)
+
+
+@pytest.mark.asyncio
+async def test_get_summary_reads_only_summary_columns():
+    db = MagicMock()
+    db.query = AsyncMock(return_value=[{
+        "compatibility_score": 72, "skill_score": 60,
+        "top_gaps": ["Go"], "top_strengths": None, "readiness_level": "ready",
+    }])
+    out = await _service(db).get_summary("r1", "u1")
+
+    _, kwargs = db.query.call_args
+    assert kwargs["columns"] == gap_module.SUMMARY_COLUMNS
+    assert kwargs["filters"] == [("id", "==", "r1"), ("user_id", "==", "u1")]
+    assert out["compatibility_score"] == 72
+    assert out["experience_score"] == 0
+    assert out["top_gaps"] == ["Go"]
+    assert out["top_strengths"] == []
+    assert out["readiness_level"] == "ready"
+
+
+@pytest.mark.asyncio
+async def test_get_summary_missing_report_returns_none():
+    db = MagicMock()
+    db.query = AsyncMock(return_value=[])
+    assert await _service(db).get_summary("r1", "u1") is None
@@ -0,0 +1,34 @@
+"""The google.genai client is shared across AIClient instances."""
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ai_engine import client as client_mod
+
+
+@pytest.fixture(autouse=True)
+def _clean_pool():
+    client_mod._genai_clients.clear()
+    yield
+    client_mod._genai_clients.clear()
+
+
+def test_same_credentials_share_one_client():
+    with patch("google.genai.Client", side_effect=lambda **kw: MagicMock()) as ctor:
+        a = client_mod._shared_genai_client(api_key="k1", vertexai=False)
+        b = client_mod._shared_genai_client(api_key="k1", vertexai=False)
+        c = client_mod._shared_genai_client(api_key="k2", vertexai=False)
+    assert a is b
+    assert a is not c
+    assert ctor.call_count == 2
+
+
+def test_close_shared_clients_closes_and_empties_pool():
+    fake = MagicMock()
+    with patch("google.genai.Client", return_value=fake):
+        client_mod._shared_genai_client(api_key="k1", vertexai=False)
+    client_mod.close_shared_clients()
+    fake.close.assert_called_once()
+    assert client_mod._genai_clients == {}
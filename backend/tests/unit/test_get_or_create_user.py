@@ -0,0 +1,120 @@
+"""SupabaseDB.get_or_create_user — round-trip budget.
+
+Runs on every authenticated request, so the existing-user path must be a
+single read and the first-login path a single upsert (no create → get).
+"""
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any, List
+
+import pytest
+
+import app.core.database as database
+from app.core.database import SupabaseDB
+
+
+@pytest.fixture(autouse=True)
+def _empty_user_cache():
+    database._user_cache.clear()
+    yield
+    database._user_cache.clear()
+
+
+class _Query:
+    def __init__(self, client: "_FakeClient", table: str):
+        self._client = client
+        self._table = table
+        self._op = "select"
+        self._kwargs: dict = {}
+
+    def select(self, *_a, **_kw):
+        return self
+
+    def eq(self, *_a, **_kw):
+        return self
+
+    def limit(self, *_a, **_kw):
+        return self
+
+    def upsert(self, data, **kwargs):
+        self._op = "upsert"
+        self._kwargs = kwargs
+        self._data = data
+        return self
+
+    def execute(self):
+        self._client.calls.append((self._op, self._table, self._kwargs))
+        if self._op == "upsert":
+            return SimpleNamespace(data=self._client.upsert_rows)
+        return SimpleNamespace(data=self._client.select_rows.pop(0) if self._client.select_rows else [])
+
+
+class _FakeClient:
+    def __init__(self, *, select_rows: List[List[dict]], upsert_rows: List[dict]):
+        self.calls: List[tuple[str, str, dict]] = []
+        self.select_rows = select_rows
+        self.upsert_rows = upsert_rows
+
+    def table(self, name: str) -> _Query:
+        return _Query(self, name)
+
+
+def _db(client: Any) -> SupabaseDB:
+    db = SupabaseDB.__new__(SupabaseDB)  # bypass __init__ (avoids real client)
+    db.client = client
+    return db
+
+
+@pytest.mark.asyncio
+async def test_existing_user_is_a_single_read():
+    client = _FakeClient(select_rows=[[{"id": "u1", "is_premium": True}]], upsert_rows=[])
+    user = await _db(client).get_or_create_user("u1", "a@b.c")
+
+    assert user == {"id": "u1", "is_premium": True}
+    assert [c[0] for c in client.calls] == ["select"]
+
+
+@pytest.mark.asyncio
+async def test_new_user_is_read_plus_one_upsert():
+    row = {"id": "u2", "email": "n@b.c", "is_active": True, "is_premium": False}
+    client = _FakeClient(select_rows=[[]], upsert_rows=[row])
+    user = await _db(client).get_or_create_user("u2", "n@b.c")
+
+    assert user == row
+    assert [c[0] for c in client.calls] == ["select", "upsert"]
+    assert client.calls[1][2] == {"on_conflict": "id", "ignore_duplicates": True}
+
+
+@pytest.mark.asyncio
+async def test_lost_insert_race_falls_back_to_read():
+    """ignore_duplicates returns no row when someone else inserted first."""
+    client = _FakeClient(select_rows=[[], [{"id": "u3", "is_premium": True}]], upsert_rows=[])
+    user = await _db(client).get_or_create_user("u3", "r@b.c")
+
+    assert user == {"id": "u3", "is_premium": True}
+    assert [c[0] for c in client.calls] == ["select", "upsert", "select"]
+
+
+@pytest.mark.asyncio
+async def test_repeat_lookup_is_served_from_the_user_cache():
+    client = _FakeClient(select_rows=[[{"id": "u4", "is_premium": False}]], upsert_rows=[])
+    db = _db(client)
+    await db.get_or_create_user("u4", "c@b.c")
+    user = await db.get_or_create_user("u4", "c@b.c")
+
+    assert user == {"id": "u4", "is_premium": False}
+    assert [c[0] for c in client.calls] == ["select"]
+
+
+@pytest.mark.asyncio
+async def test_users_update_invalidates_the_cached_row():
+    client = _FakeClient(
+        select_rows=[[{"id": "u5", "is_active": True}], [{"id": "u5", "is_active": False}]],
+        upsert_rows=[],
+    )
+    db = _db(client)
+    await db.get_user_by_auth_uid("u5")
+    database.invalidate_user("u5")
+
+    assert (await db.get_user_by_auth_uid("u5"))["is_active"] is False
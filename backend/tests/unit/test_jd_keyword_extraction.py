@@ -0,0 +1,45 @@
+"""Tests for the memoised JD keyword fallback in generate/helpers."""
+from __future__ import annotations
+
+from app.api.routes.generate.helpers import (
+    _extract_keywords_cached,
+    _extract_keywords_from_jd,
+)
+
+
+def test_extracts_known_keywords_in_order_without_duplicates():
+    jd = "We need Python. (React), Docker/Kubernetes; python again! AWS,"
+    assert _extract_keywords_from_jd(jd) == ["python", "react", "docker", "kubernetes", "aws"]
+
+
+def test_matches_compound_terms_whole():
+    jd = "Machine learning platform, CI/CD pipelines, Node.js services, React Native app"
+    assert _extract_keywords_from_jd(jd) == ["machine learning", "ci/cd", "node.js", "react native"]
+
+
+def test_does_not_match_inside_larger_tokens():
+    assert _extract_keywords_from_jd("Google go-to-market gopher") == []
+
+
+def test_ignores_unknown_tokens_and_empty_input():
+    assert _extract_keywords_from_jd("") == []
+    assert _extract_keywords_from_jd("Synergy and leadership") == []
+
+
+def test_caps_at_25_keywords():
+    jd = " ".join([
+        "javascript typescript python java go rust ruby php swift kotlin",
+        "react angular vue svelte next nuxt node express django flask",
+        "fastapi spring sql postgres mysql mongodb redis",
+    ])
+    assert len(_extract_keywords_from_jd(jd)) == 25
+
+
+def test_results_are_memoised_and_caller_cannot_mutate_cache():
+    _extract_keywords_cached.cache_clear()
+    jd = "Senior engineer: python, docker"
+    first = _extract_keywords_from_jd(jd)
+    first.append("mutated")
+    second = _extract_keywords_from_jd(jd)
+    assert second == ["python", "docker"]
+    assert _extract_keywords_cached.cache_info().hits == 1
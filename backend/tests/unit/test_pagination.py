@@ -0,0 +1,28 @@
+"""Keyset cursor codec for newest-first lists."""
+from __future__ import annotations
+
+import re
+
+from app.core.pagination import CURSOR_PATTERN, decode_cursor, encode_cursor
+
+
+def test_cursor_round_trips_timestamp_and_id():
+    row = {"id": "0b9e-42", "created_at": "2026-05-01T12:00:00.123456+00:00"}
+    cursor = encode_cursor(row)
+    assert cursor == "2026-05-01T12:00:00.123456+00:00|0b9e-42"
+    assert decode_cursor(cursor) == (row["created_at"], "0b9e-42")
+    assert re.match(CURSOR_PATTERN, cursor)
+
+
+def test_legacy_timestamp_cursor_has_no_id():
+    assert decode_cursor("2026-05-01T12:00:00+00:00") == ("2026-05-01T12:00:00+00:00", None)
+
+
+def test_row_without_field_has_no_cursor():
+    assert encode_cursor({"id": "a"}) is None
+    assert encode_cursor({"created_at": "2026-01-01"}) == "2026-01-01"
+
+
+def test_pattern_refuses_filter_syntax():
+    assert not re.match(CURSOR_PATTERN, '2026-01-01",id.gt.0')
+    assert not re.match(CURSOR_PATTERN, "2026-01-01|a),or(x")
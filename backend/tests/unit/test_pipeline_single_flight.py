@@ -0,0 +1,66 @@
+"""Pin the /pipeline single-flight coalescing helper."""
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.api.routes.generate import sync_pipeline
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_run():
+    calls = 0
+    release = asyncio.Event()
+
+    async def _work():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return {"ok": True}
+
+    first = asyncio.create_task(sync_pipeline._single_flight("k1", _work))
+    second = asyncio.create_task(sync_pipeline._single_flight("k1", _work))
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await first == await second == {"ok": True}
+    assert calls == 1
+    assert "k1" not in sync_pipeline._INFLIGHT_PIPELINES
+
+
+@pytest.mark.asyncio
+async def test_errors_propagate_to_every_waiter_and_clear_the_slot():
+    release = asyncio.Event()
+
+    async def _boom():
+        await release.wait()
+        raise RuntimeError("chain failed")
+
+    waiters = [
+        asyncio.create_task(sync_pipeline._single_flight("k2", _boom))
+        for _ in range(2)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+
+    for w in waiters:
+        with pytest.raises(RuntimeError, match="chain failed"):
+            await w
+    assert "k2" not in sync_pipeline._INFLIGHT_PIPELINES
+
+
+@pytest.mark.asyncio
+async def test_distinct_keys_run_independently():
+    calls = []
+
+    async def _work(tag):
+        calls.append(tag)
+        return tag
+
+    a, b = await asyncio.gather(
+        sync_pipeline._single_flight("ka", lambda: _work("a")),
+        sync_pipeline._single_flight("kb", lambda: _work("b")),
+    )
+    assert (a, b) == ("a", "b")
+    assert sorted(calls) == ["a", "b"]
@@ -0,0 +1,36 @@
+"""init_supabase swaps PostgREST's httpx session for a longer keep-alive pool."""
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import httpx
+
+from app.core import database
+from app.core.config import settings
+
+
+def test_session_replaced_with_tuned_pool():
+    original = httpx.Client(
+        base_url="https://example.supabase.co/rest/v1",
+        headers={"apikey": "k", "Authorization": "Bearer k"},
+        timeout=httpx.Timeout(120),
+    )
+    client = SimpleNamespace(postgrest=SimpleNamespace(session=original))
+
+    database._tune_postgrest_pool(client)  # type: ignore[arg-type]
+
+    tuned = client.postgrest.session
+    assert tuned is not original
+    assert original.is_closed
+    assert str(tuned.base_url) == "https://example.supabase.co/rest/v1/"
+    assert tuned.headers["apikey"] == "k"
+    assert tuned.timeout == original.timeout
+    pool = tuned._transport._pool
+    assert pool._keepalive_expiry == settings.supabase_http_keepalive_s
+    tuned.close()
+
+
+def test_unknown_sdk_shape_is_left_alone():
+    client = SimpleNamespace(postgrest=SimpleNamespace(session="not-an-httpx-client"))
+    database._tune_postgrest_pool(client)  # type: ignore[arg-type]
+    assert client.postgrest.session == "not-an-httpx-client"
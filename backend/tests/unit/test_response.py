@@ -2,13 +2,17 @@
 import json
 
 import pytest
-from fastapi import HTTPException
+from fastapi import HTTPException, Response
 from fastapi.responses import JSONResponse
 
 from app.api.response import (
+    NEXT_CURSOR_HEADER,
+    detail_response,
     error_envelope,
     error_http_exception,
     error_response,
+    list_response,
+    set_next_cursor,
     success_response,
 )
 from app.core.tracing import request_id_var
@@ -135,3 +139,42 @@ def test_error_http_exception_includes_headers():
         headers={"WWW-Authenticate": "Bearer"},
     )
     assert exc.headers == {"WWW-Authenticate": "Bearer"}
+
+
+# ---------- detail_response --------------------------------------------------
+
+
+def test_detail_response_matches_http_exception_body():
+    resp = detail_response("Gap report not found")
+    assert resp.status_code == 404
+    assert resp.media_type == "application/json"
+    assert json.loads(resp.body) == {"detail": "Gap report not found"}
+
+
+def test_detail_response_custom_status():
+    assert detail_response("gone", status_code=410).status_code == 410
+
+
+# ---------- set_next_cursor --------------------------------------------------
+
+
+def test_set_next_cursor_on_full_page():
+    resp = Response()
+    rows = [{"created_at": "2026-01-02"}, {"created_at": "2026-01-01"}]
+    set_next_cursor(resp, rows, limit=2)
+    assert resp.headers[NEXT_CURSOR_HEADER] == "2026-01-01"
+
+
+def test_set_next_cursor_omitted_on_short_page():
+    resp = Response()
+    set_next_cursor(resp, [{"created_at": "2026-01-01"}], limit=2)
+    set_next_cursor(resp, [], limit=2)
+    assert NEXT_CURSOR_HEADER not in resp.headers
+
+
+def test_list_response_encodes_rows_and_sets_cursor():
+    rows = [{"id": "a", "created_at": "2026-01-02"}, {"id": "b", "created_at": "2026-01-01"}]
+    resp = list_response(rows, limit=2)
+    assert json.loads(resp.body) == rows
+    assert resp.headers[NEXT_CURSOR_HEADER] == "2026-01-01|b"
+    assert NEXT_CURSOR_HEADER not in list_response(rows, limit=5).headers
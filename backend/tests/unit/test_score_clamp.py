@@ -0,0 +1,49 @@
+"""Score clamping in the generate/_format_response hot path."""
+from __future__ import annotations
+
+import pytest
+
+from app.api.routes.generate.helpers import _clamp, _format_response
+from app.services.pipeline_runtime import _clamp_score
+
+
+@pytest.mark.parametrize("fn", [_clamp, _clamp_score])
+@pytest.mark.parametrize("value,expected", [(-5, 0), (0, 0), (42, 42), (100, 100), (130, 100)])
+def test_clamp_bounds(fn, value, expected):
+    assert fn(value) == expected
+
+
+def test_clamp_custom_bounds():
+    assert _clamp(0.7, 0.0, 0.5) == 0.5
+    assert _clamp(-1, lo=-1, hi=1) == -1
+
+
+def test_format_response_scores_stay_in_range():
+    gaps = {"compatibility_score": 97, "skill_gaps": [{"skill": f"s{i}"} for i in range(15)]}
+    out = _format_response({}, gaps, {}, "", "", "", "", {}, [], "Engineer")
+    scores = out["scores"]
+    assert scores["match"] == 97
+    assert scores["atsReadiness"] == 100
+    assert scores["cv"] == 100
+    assert scores["gaps"] == 0
+
+
+def test_scorecard_dimensions_follow_scores():
+    out = _format_response({}, {"compatibility_score": 70}, {}, "", "", "", "", {}, [], "Engineer")
+    dims = out["scorecard"]["dimensions"]
+    assert [d["name"] for d in dims] == ["Match", "ATS Readiness", "Recruiter Scan", "Evidence Strength"]
+    assert dims[0] == {"name": "Match", "score": 70, "feedback": "70% keyword alignment"}
+    assert dims[1]["feedback"] == "85% ATS-optimized"
+    assert dims[3]["feedback"] == "Add evidence to boost this score"
+
+
+def test_gap_lists_are_capped_with_total_reported():
+    gaps = {
+        "skill_gaps": [{"skill": f"s{i}"} for i in range(30)],
+        "strengths": [{"area": f"a{i}"} for i in range(30)],
+    }
+    out = _format_response({}, gaps, {}, "", "", "", "", {}, [], "Engineer")["gaps"]
+    assert len(out["gaps"]) == 20
+    assert len(out["missingKeywords"]) == 20
+    assert len(out["strengths"]) == 12
+    assert out["totalGaps"] == 30
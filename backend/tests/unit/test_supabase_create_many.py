@@ -0,0 +1,83 @@
+"""SupabaseDB.create_many — multi-row inserts instead of per-row create()."""
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import List
+
+import pytest
+
+import app.core.database as database
+from app.core.database import SupabaseDB
+
+
+class _FakeClient:
+    def __init__(self, fail_once_on_batch: int = -1):
+        self.batches: List[List[dict]] = []
+        self.attempts = 0
+        self.fail_once_on_batch = fail_once_on_batch
+
+    def table(self, _name):
+        client = self
+
+        class _Q:
+            def insert(self, rows):
+                self.rows = rows
+                return self
+
+            def execute(self):
+                client.attempts += 1
+                if len(client.batches) == client.fail_once_on_batch:
+                    client.fail_once_on_batch = -1
+                    raise RuntimeError("503 Service Unavailable")
+                client.batches.append(self.rows)
+                start = sum(len(b) for b in client.batches[:-1])
+                return SimpleNamespace(data=[{**r, "id": start + i} for i, r in enumerate(self.rows)])
+
+        return _Q()
+
+
+def _db(client) -> SupabaseDB:
+    db = SupabaseDB.__new__(SupabaseDB)  # bypass __init__ (avoids real client)
+    db.client = client
+    return db
+
+
+@pytest.mark.asyncio
+async def test_single_insert_returns_ids_in_order_and_strips_timestamps():
+    client = _FakeClient()
+    ids = await _db(client).create_many("t", [{"n": 1, "created_at": "x"}, {"n": 2, "updated_at": "y"}])
+
+    assert ids == ["0", "1"]
+    assert client.batches == [[{"n": 1}, {"n": 2}]]
+
+
+@pytest.mark.asyncio
+async def test_large_inputs_are_chunked(monkeypatch):
+    monkeypatch.setattr(database, "_CREATE_MANY_BATCH", 2)
+    client = _FakeClient()
+    ids = await _db(client).create_many("t", [{"n": i} for i in range(5)])
+
+    assert ids == ["0", "1", "2", "3", "4"]
+    assert [len(b) for b in client.batches] == [2, 2, 1]
+
+
+@pytest.mark.asyncio
+async def test_empty_input_skips_the_round_trip():
+    client = _FakeClient()
+    assert await _db(client).create_many("t", []) == []
+    assert client.batches == []
+
+
+@pytest.mark.asyncio
+async def test_retry_replays_only_the_failed_batch(monkeypatch):
+    monkeypatch.setattr(database, "_CREATE_MANY_BATCH", 2)
+    monkeypatch.setattr(database.settings, "supabase_http_retries", 3)
+    monkeypatch.setattr(database.settings, "supabase_http_retry_base_s", 0.05)
+    monkeypatch.setattr(database.settings, "supabase_http_retry_max_s", 0.05)
+    client = _FakeClient(fail_once_on_batch=1)  # second batch fails once
+    rows = [{"n": i} for i in range(5)]
+    ids = await _db(client).create_many("t", rows)
+
+    assert client.attempts == 4
+    assert [r["n"] for b in client.batches for r in b] == [0, 1, 2, 3, 4]
+    assert ids == ["0", "1", "2", "3", "4"]
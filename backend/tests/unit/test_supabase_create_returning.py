@@ -0,0 +1,58 @@
+"""SupabaseDB.create_returning — insert and read back in one round-trip."""
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import List
+
+import pytest
+
+from app.core.database import SupabaseDB
+
+
+class _FakeClient:
+    def __init__(self, returned: List[dict]):
+        self.returned = returned
+        self.inserted: List[dict] = []
+        self.selects = 0
+
+    def table(self, _name):
+        client = self
+
+        class _Q:
+            def insert(self, data):
+                client.inserted.append(data)
+                return self
+
+            def select(self, *_a):
+                client.selects += 1
+                return self
+
+            def execute(self):
+                return SimpleNamespace(data=client.returned)
+
+        return _Q()
+
+
+def _db(client) -> SupabaseDB:
+    db = SupabaseDB.__new__(SupabaseDB)  # bypass __init__ (avoids real client)
+    db.client = client
+    return db
+
+
+@pytest.mark.asyncio
+async def test_returns_inserted_row_without_a_follow_up_read():
+    row = {"id": "r1", "title": "x", "created_at": "2026-01-01T00:00:00Z"}
+    client = _FakeClient([row])
+
+    out = await _db(client).create_returning("t", {"title": "x", "created_at": "ignored"})
+
+    assert out == row
+    assert client.inserted == [{"title": "x"}]  # timestamps left to the DB
+    assert client.selects == 0
+
+
+@pytest.mark.asyncio
+async def test_create_still_returns_the_id():
+    client = _FakeClient([{"id": 42}])
+    assert await _db(client).create("t", {"a": 1}, doc_id="42") == "42"
+    assert client.inserted == [{"a": 1, "id": "42"}]
@@ -0,0 +1,48 @@
+"""SupabaseDB._run schedules supabase-py calls on its own sized pool."""
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+import app.core.database as database
+from app.core.database import SupabaseDB
+
+
+@pytest.mark.asyncio
+async def test_run_uses_dedicated_supabase_threads(monkeypatch):
+    monkeypatch.setattr(database, "_db_executor", None)
+    db = SupabaseDB.__new__(SupabaseDB)  # bypass __init__ (avoids real client)
+
+    name = await db._run(lambda: threading.current_thread().name)
+
+    assert name.startswith("supabase")
+    database._db_executor.shutdown(wait=False)
+
+
+def test_pool_size_comes_from_settings(monkeypatch):
+    monkeypatch.setattr(database, "_db_executor", None)
+    monkeypatch.setattr(database.settings, "supabase_pool_size", 7)
+
+    executor = database._get_db_executor()
+
+    assert executor._max_workers == 7
+    assert database._get_db_executor() is executor
+
+
+def test_warmup_selects_on_the_supabase_pool(monkeypatch):
+    from unittest.mock import MagicMock
+
+    client = MagicMock()
+    seen = []
+    client.table.return_value.select.return_value.limit.return_value.execute.side_effect = (
+        lambda: seen.append(threading.current_thread().name)
+    )
+    monkeypatch.setattr(database, "_supabase_client", client)
+    monkeypatch.setattr(database, "_db_executor", None)
+
+    database.schedule_supabase_warmup()
+    database._db_executor.shutdown(wait=True)
+
+    client.table.assert_called_once_with("users")
+    assert seen and seen[0].startswith("supabase")
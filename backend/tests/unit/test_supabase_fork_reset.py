@@ -0,0 +1,57 @@
+"""Forked children must not reuse the parent's Supabase client pools."""
+from __future__ import annotations
+
+import os
+import sys
+
+import pytest
+
+import app.core.database as database
+
+
+def test_reset_drops_client_singletons(monkeypatch):
+    monkeypatch.setattr(database, "_supabase_client", object())
+    monkeypatch.setattr(database, "_db_instance", object())
+    monkeypatch.setattr(database, "_db_executor", object())
+
+    database._reset_clients_after_fork()
+
+    assert database._supabase_client is None
+    assert database._db_instance is None
+    assert database._db_executor is None
+
+
+@pytest.mark.skipif(not hasattr(os, "fork") or sys.platform == "win32", reason="POSIX fork only")
+def test_forked_child_starts_without_inherited_client(monkeypatch):
+    monkeypatch.setattr(database, "_supabase_client", object())
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:  # child
+        os.close(read_fd)
+        os.write(write_fd, b"1" if database._supabase_client is None else b"0")
+        os.close(write_fd)
+        os._exit(0)
+    os.close(write_fd)
+    try:
+        assert os.read(read_fd, 1) == b"1"
+    finally:
+        os.close(read_fd)
+        os.waitpid(pid, 0)
+    assert database._supabase_client is not None  # parent untouched
+
+
+def test_init_binds_db_singleton_and_close_releases_it(monkeypatch):
+    fake_client = object()
+    monkeypatch.setattr(database, "_supabase_client", None)
+    monkeypatch.setattr(database, "_db_instance", None)
+    monkeypatch.setattr(database, "create_client", lambda *_a, **_kw: fake_client)
+    monkeypatch.setattr(database, "_tune_postgrest_pool", lambda _c: None)
+
+    database.init_supabase()
+    db = database.get_db()
+
+    assert db.client is fake_client
+    assert database.get_db() is db
+
+    database.close_supabase()
+    assert database._db_instance is None
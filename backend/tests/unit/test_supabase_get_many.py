@@ -0,0 +1,74 @@
+"""SupabaseDB.get_many — batched id lookups replacing per-id get() loops."""
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import List
+
+import pytest
+
+import app.core.database as database
+from app.core.database import SupabaseDB
+
+
+class _FakeClient:
+    def __init__(self, rows: List[dict]):
+        self.rows = rows
+        self.calls: List[tuple[str, list]] = []
+
+    def table(self, _name):
+        client = self
+
+        class _Q:
+            def select(self, columns):
+                self.columns = columns
+                return self
+
+            def in_(self, field, values):
+                self.values = list(values)
+                return self
+
+            def execute(self):
+                client.calls.append((self.columns, self.values))
+                return SimpleNamespace(data=[r for r in client.rows if r["id"] in self.values])
+
+        return _Q()
+
+
+def _db(client) -> SupabaseDB:
+    db = SupabaseDB.__new__(SupabaseDB)  # bypass __init__ (avoids real client)
+    db.client = client
+    return db
+
+
+@pytest.mark.asyncio
+async def test_returns_rows_keyed_by_id_and_skips_misses():
+    client = _FakeClient([{"id": "a", "n": 1}, {"id": "b", "n": 2}])
+    out = await _db(client).get_many("t", ["a", "missing", "b", "a"])
+
+    assert out == {"a": {"id": "a", "n": 1}, "b": {"id": "b", "n": 2}}
+    assert len(client.calls) == 1
+    assert client.calls[0][1] == ["a", "missing", "b"]  # deduped, order kept
+
+
+@pytest.mark.asyncio
+async def test_empty_ids_skip_the_round_trip():
+    client = _FakeClient([])
+    assert await _db(client).get_many("t", []) == {}
+    assert client.calls == []
+
+
+@pytest.mark.asyncio
+async def test_large_id_lists_are_chunked(monkeypatch):
+    monkeypatch.setattr(database, "_GET_MANY_BATCH", 2)
+    client = _FakeClient([{"id": str(i)} for i in range(5)])
+    out = await _db(client).get_many("t", [str(i) for i in range(5)])
+
+    assert set(out) == {"0", "1", "2", "3", "4"}
+    assert [len(c[1]) for c in client.calls] == [2, 2, 1]
+
+
+@pytest.mark.asyncio
+async def test_projection_always_includes_id():
+    client = _FakeClient([{"id": "a"}])
+    await _db(client).get_many("t", ["a"], columns="email,full_name")
+    assert client.calls[0][0] == "id,email,full_name"
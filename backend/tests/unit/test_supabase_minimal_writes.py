@@ -0,0 +1,57 @@
+"""SupabaseDB update/delete ask PostgREST not to echo the mutated rows."""
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+import pytest
+
+from app.core.database import SupabaseDB
+
+
+class _Builder:
+    def __init__(self, calls: List[tuple]):
+        self.calls = calls
+
+    def update(self, data, **kwargs: Any):
+        self.calls.append(("update", kwargs))
+        return self
+
+    def delete(self, **kwargs: Any):
+        self.calls.append(("delete", kwargs))
+        return self
+
+    def eq(self, *_a):
+        return self
+
+    def execute(self):
+        return SimpleNamespace(data=None)
+
+
+class _FakeClient:
+    def __init__(self):
+        self.calls: List[tuple[str, Dict[str, Any]]] = []
+
+    def table(self, _name):
+        return _Builder(self.calls)
+
+
+def _db(client) -> SupabaseDB:
+    db = SupabaseDB.__new__(SupabaseDB)  # bypass __init__ (avoids real client)
+    db.client = client
+    return db
+
+
+@pytest.mark.asyncio
+async def test_update_and_deletes_request_minimal_returns():
+    client = _FakeClient()
+    db = _db(client)
+    assert await db.update("t", "r1", {"a": 1}) is True
+    assert await db.delete("t", "r1") is True
+    await db.delete_where("t", filters=[("user_id", "==", "u1")])
+
+    assert client.calls == [
+        ("update", {"returning": "minimal"}),
+        ("delete", {"returning": "minimal"}),
+        ("delete", {"returning": "minimal"}),
+    ]
@@ -0,0 +1,104 @@
+"""SupabaseDB filter application — shape-compiled PostgREST filter chains."""
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import List
+
+import pytest
+
+import app.core.database as database
+from app.core.database import SupabaseDB
+
+
+class _Builder:
+    def __init__(self, calls: List[tuple]):
+        self.calls = calls
+
+    def __getattr__(self, name):
+        def _record(*args, **_kw):
+            self.calls.append((name, *args))
+            return self
+        return _record
+
+    def execute(self):
+        return SimpleNamespace(data=[{"id": "r1"}], count=42)
+
+
+class _FakeClient:
+    def __init__(self):
+        self.calls: List[tuple] = []
+
+    def table(self, _name):
+        return _Builder(self.calls)
+
+
+def _db(client) -> SupabaseDB:
+    db = SupabaseDB.__new__(SupabaseDB)  # bypass __init__ (avoids real client)
+    db.client = client
+    return db
+
+
+@pytest.mark.asyncio
+async def test_ops_map_to_postgrest_methods():
+    client = _FakeClient()
+    rows = await _db(client).query("t", filters=[
+        ("a", "==", 1), ("b", "!=", 2), ("c", ">", 3), ("d", ">=", 4),
+        ("e", "<", 5), ("f", "<=", 6), ("g", "in", [7]), ("h", "~", 8),
+    ])
+
+    assert rows == [{"id": "r1"}]
+    assert client.calls[1:] == [
+        ("eq", "a", 1), ("neq", "b", 2), ("gt", "c", 3), ("gte", "d", 4),
+        ("lt", "e", 5), ("lte", "f", 6), ("in_", "g", [7]), ("eq", "h", 8),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_repeated_shapes_reuse_the_compiled_plan():
+    database._compile_filter_shape.cache_clear()
+    db = _db(_FakeClient())
+    await db.query("t", filters=[("user_id", "==", "u1"), ("status", "in", ["a"])])
+    await db.query("t", filters=[("user_id", "==", "u2"), ("status", "in", ["b"])])
+
+    info = database._compile_filter_shape.cache_info()
+    assert (info.misses, info.hits) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_delete_where_uses_the_same_filters():
+    client = _FakeClient()
+    await _db(client).delete_where("t", filters=[("user_id", "==", "u1"), ("n", "<", 3)])
+    assert client.calls == [("delete",), ("eq", "user_id", "u1"), ("lt", "n", 3)]
+
+
+@pytest.mark.asyncio
+async def test_count_asks_postgrest_for_an_exact_count():
+    client = _FakeClient()
+    n = await _db(client).count("t", filters=[("user_id", "==", "u1")])
+    assert n == 42
+    assert client.calls == [("select", "id"), ("eq", "user_id", "u1"), ("limit", 1)]
+
+
+@pytest.mark.asyncio
+async def test_keyset_after_breaks_ties_on_the_second_order_column():
+    client = _FakeClient()
+    await _db(client).query(
+        "t", filters=[("user_id", "==", "u1")], order_by="created_at,id",
+        order_direction="DESCENDING", limit=2, after=("2026-01-01T00:00:00+00:00", "abc"),
+    )
+    assert client.calls[1:] == [
+        ("eq", "user_id", "u1"),
+        ("or_", 'created_at.lt."2026-01-01T00:00:00+00:00",'
+                'and(created_at.eq."2026-01-01T00:00:00+00:00",id.lt."abc")'),
+        ("order", "created_at"),
+        ("order", "id"),
+        ("limit", 2),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_keyset_after_rejects_a_single_column_order():
+    client = _FakeClient()
+    with pytest.raises(ValueError, match="two-column"):
+        await _db(client).query("t", order_by="created_at", after=("2026-01-01", "abc"))
+    assert client.calls == []
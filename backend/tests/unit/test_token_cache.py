@@ -18,7 +18,11 @@ from __future__ import annotations
 
 import time
 
-from app.core.database import _TokenCache
+from app.core.database import VerifiedUser, _TokenCache
+
+
+def _claims(sub: str, exp: float) -> VerifiedUser:
+    return VerifiedUser(sub=sub, email=None, user_metadata={}, exp=exp)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -29,14 +33,14 @@ class TestPositiveCache:
     def test_put_then_get_returns_claims(self) -> None:
         cache = _TokenCache(max_size=4)
         token = "tok-good"
-        claims = {"sub": "user-1", "exp": time.time() + 60}
+        claims = _claims("user-1", time.time() + 60)
         cache.put(token, claims)
         assert cache.get(token) == claims
 
     def test_expired_entry_dropped_on_get(self) -> None:
         cache = _TokenCache(max_size=4)
         token = "tok-expired"
-        claims = {"sub": "user-1", "exp": time.time() - 1}  # already past
+        claims = _claims("user-1", time.time() - 1)  # already past
         cache.put(token, claims)
         assert cache.get(token) is None
         # Confirm internal eviction happened too
@@ -45,12 +49,35 @@ class TestPositiveCache:
     def test_lru_evicts_oldest(self) -> None:
         cache = _TokenCache(max_size=2)
         for i in range(3):
-            cache.put(f"tok-{i}", {"sub": str(i), "exp": time.time() + 60})
+            cache.put(f"tok-{i}", _claims(str(i), time.time() + 60))
         # tok-0 is oldest → evicted
         assert cache.get("tok-0") is None
         assert cache.get("tok-1") is not None
         assert cache.get("tok-2") is not None
 
+    def test_entry_never_outlives_token_exp(self) -> None:
+        cache = _TokenCache(ttl_s=300)
+        cache.put("tok-short", _claims("user-1", time.time() + 0.05))
+        assert cache.get("tok-short") is not None
+        time.sleep(0.06)
+        assert cache.get("tok-short") is None
+
+    def test_long_lived_token_capped_by_ttl(self) -> None:
+        cache = _TokenCache(ttl_s=0.05)
+        cache.put("tok-long", _claims("user-1", time.time() + 3600))
+        assert cache.get("tok-long") is not None
+        time.sleep(0.06)
+        assert cache.get("tok-long") is None
+
+    def test_local_decode_claims_carry_exp(self) -> None:
+        import jwt
+
+        from app.core.database import _decode_jwt_with_secret
+
+        exp = int(time.time()) + 120
+        token = jwt.encode({"sub": "u1", "aud": "authenticated", "exp": exp}, "s3cret", algorithm="HS256")
+        assert _decode_jwt_with_secret(token, "s3cret").exp == exp
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Negative cache — the F5 deliverable
@@ -100,14 +127,14 @@ class TestCrossCache:
         cache.mark_bad(token)
         assert cache.is_known_bad(token) is True
 
-        cache.put(token, {"sub": "user-1", "exp": time.time() + 60})
+        cache.put(token, _claims("user-1", time.time() + 60))
         assert cache.is_known_bad(token) is False
         assert cache.get(token) is not None
 
     def test_invalidate_drops_both_caches(self) -> None:
         cache = _TokenCache()
         token = "tok-x"
-        cache.put(token, {"sub": "user-1", "exp": time.time() + 60})
+        cache.put(token, _claims("user-1", time.time() + 60))
         cache.mark_bad("tok-y")
 
         cache.invalidate(token)
@@ -117,8 +144,70 @@ class TestCrossCache:
 
     def test_clear_drops_all_entries(self) -> None:
         cache = _TokenCache()
-        cache.put("a", {"sub": "1", "exp": time.time() + 60})
+        cache.put("a", _claims("1", time.time() + 60))
         cache.mark_bad("b")
         cache.clear()
         assert cache.get("a") is None
         assert cache.is_known_bad("b") is False
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Sync verify_token shares the cache
+# ─────────────────────────────────────────────────────────────────────────────
+
+class TestSyncVerifyTokenCache:
+    def test_sync_verify_is_served_from_cache(self, monkeypatch) -> None:
+        import jwt
+
+        import app.core.database as database
+
+        monkeypatch.setattr(database, "_token_cache", _TokenCache())
+        monkeypatch.setattr(database.settings, "supabase_jwt_secret", "s3cret")
+        token = jwt.encode(
+            {"sub": "u1", "aud": "authenticated", "exp": int(time.time()) + 120},
+            "s3cret",
+            algorithm="HS256",
+        )
+        first = database.verify_token(token)
+        assert first is not None and first.sub == "u1"
+
+        # A second call must not decode again: a rotated secret would fail it.
+        monkeypatch.setattr(database.settings, "supabase_jwt_secret", "rotated")
+        assert database.verify_token(token) is first
+
+    def test_unverified_exp_reads_payload_without_secret(self) -> None:
+        import jwt
+
+        from app.core.database import _unverified_exp
+
+        exp = int(time.time()) + 90
+        token = jwt.encode({"sub": "u1", "exp": exp}, "anything", algorithm="HS256")
+        assert _unverified_exp(token) == exp
+        assert _unverified_exp("not-a-jwt") is None
+
+    def test_base64_secret_form_is_tried_first_once_it_matches(self, monkeypatch) -> None:
+        import base64
+
+        import jwt
+
+        import app.core.database as database
+
+        key = b"\x01\x02binary-secret\xff"
+        secret = base64.b64encode(key).decode()
+        token = jwt.encode(
+            {"sub": "u2", "aud": "authenticated", "exp": int(time.time()) + 120},
+            key,
+            algorithm="HS256",
+        )
+        monkeypatch.setattr(database, "_hs256_key_hint", 0)
+        assert database._verify_hs256_locally(token, secret).sub == "u2"
+        assert database._hs256_key_hint == 1
+
+        tried = []
+        real = database._decode_jwt_with_secret
+        monkeypatch.setattr(
+            database, "_decode_jwt_with_secret",
+            lambda tok, k: tried.append(k) or real(tok, k),
+        )
+        assert database._verify_hs256_locally(token, secret).sub == "u2"
+        assert tried == [key]
@@ -0,0 +1,59 @@
+"""read_upload_bounded — chunked, size-capped upload reads with a running hash."""
+from __future__ import annotations
+
+import hashlib
+from typing import Optional
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.uploads import UPLOAD_CHUNK_BYTES, read_upload_bounded
+
+
+class _FakeUpload:
+    def __init__(self, data: bytes, size: Optional[int] = None):
+        self._data = data
+        self._pos = 0
+        self.size = size
+        self.reads = 0
+
+    async def read(self, n: int = -1) -> bytes:
+        self.reads += 1
+        end = len(self._data) if n < 0 else self._pos + n
+        chunk = self._data[self._pos:end]
+        self._pos += len(chunk)
+        return chunk
+
+
+@pytest.mark.asyncio
+async def test_returns_contents_and_sha256():
+    data = b"x" * (UPLOAD_CHUNK_BYTES * 2 + 7)
+    contents, digest = await read_upload_bounded(_FakeUpload(data), 1024 * 1024)
+    assert contents == data
+    assert digest == hashlib.sha256(data).hexdigest()
+
+
+@pytest.mark.asyncio
+async def test_oversized_stream_stops_at_first_chunk_past_limit():
+    upload = _FakeUpload(b"x" * (UPLOAD_CHUNK_BYTES * 10))
+    with pytest.raises(HTTPException) as exc_info:
+        await read_upload_bounded(upload, UPLOAD_CHUNK_BYTES + 1, detail="too big")
+    assert exc_info.value.status_code == 413
+    assert exc_info.value.detail == "too big"
+    assert upload.reads == 2
+
+
+@pytest.mark.asyncio
+async def test_known_size_rejects_without_reading():
+    upload = _FakeUpload(b"x" * 100, size=100)
+    with pytest.raises(HTTPException) as exc_info:
+        await read_upload_bounded(upload, 50)
+    assert exc_info.value.status_code == 413
+    assert upload.reads == 0
+
+
+@pytest.mark.asyncio
+async def test_empty_upload_returns_empty_bytes():
+    contents, digest = await read_upload_bounded(_FakeUpload(b""), 10)
+    assert contents == b""
+    assert digest == hashlib.sha256(b"").hexdigest()
@@ -36,7 +36,7 @@ function buildDiagnostics(
   gaps?: GapsModule,
   benchmark?: BenchmarkModule,
 ): DiagnosticCard[] {
-  const missingCount = gaps?.missingKeywords?.length ?? 0;
+  const missingCount = gaps?.totalGaps ?? gaps?.missingKeywords?.length ?? 0;
   const strengthCount = gaps?.strengths?.length ?? 0;
   const recCount = gaps?.recommendations?.length ?? 0;
 
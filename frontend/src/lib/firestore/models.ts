@@ -160,8 +160,10 @@ export interface GapsModule {
   strengths: string[];
   /** Actionable recommendations */
   recommendations: string[];
-  /** Optional structured gaps */
+  /** Optional structured gaps (capped server-side; see totalGaps) */
   gaps?: GapItem[];
+  /** Number of skill gaps found before the response cap was applied */
+  totalGaps?: number;
   summary?: string;
   /** Role compatibility percentage */
   compatibility?: number;
@@ -0,0 +1,29 @@
+-- ════════════════════════════════════════════════════════════════
+-- 20260509000000_profiles_content_hash.sql
+-- Per-user content-addressed dedup for resume uploads.
+--
+-- ProfileService.create_from_upload stores the sha256 of the uploaded
+-- file bytes on each new profile and, before parsing, looks up
+-- (user_id, content_hash). A byte-identical re-upload returns the
+-- existing profile instead of re-running extraction and the LLM
+-- resume parse.
+--
+-- Pure-additive: nullable column, so rows created before this shipped
+-- simply never match. The index is partial on non-null hashes and is
+-- not UNIQUE — two concurrent first uploads of the same file may both
+-- insert, which is harmless.
+-- ════════════════════════════════════════════════════════════════
+
+BEGIN;
+
+ALTER TABLE public.profiles
+  ADD COLUMN IF NOT EXISTS content_hash text;
+
+CREATE INDEX IF NOT EXISTS idx_profiles_user_content_hash
+  ON public.profiles (user_id, content_hash)
+  WHERE content_hash IS NOT NULL;
+
+COMMENT ON COLUMN public.profiles.content_hash IS
+  'sha256 hex of the uploaded resume bytes; used to short-circuit identical re-uploads.';
+
+COMMIT;
@@ -0,0 +1,32 @@
+-- ════════════════════════════════════════════════════════════════
+-- 20260510000000_aim_updated_at_triggers.sql
+-- Server-side updated_at for the AIM tables.
+--
+-- SupabaseDB.update() strips created_at/updated_at from every payload
+-- and relies on the shared update_updated_at_column() trigger. The AIM
+-- module tables were created without that trigger, so the
+-- datetime.now() values the services computed per write were discarded
+-- and updated_at never moved past the insert time.
+--
+-- Attaching the trigger stamps updated_at in Postgres, which lets the
+-- services stop building client-side timestamps entirely.
+-- Idempotent: skips tables that already carry set_updated_at.
+-- ════════════════════════════════════════════════════════════════
+
+BEGIN;
+
+DO $$
+DECLARE t TEXT;
+BEGIN
+    FOR t IN SELECT unnest(ARRAY[
+        'aim_assignments', 'aim_assignment_analysis', 'aim_sections', 'aim_usage'
+    ]) LOOP
+        IF NOT EXISTS (
+            SELECT 1 FROM pg_trigger WHERE tgname = 'set_updated_at' AND tgrelid = ('public.' || t)::regclass
+        ) THEN
+            EXECUTE format('CREATE TRIGGER set_updated_at BEFORE UPDATE ON public.%I FOR EACH ROW EXECUTE FUNCTION public.update_updated_at_column()', t);
+        END IF;
+    END LOOP;
+END $$;
+
+COMMIT;
@@ -0,0 +1,53 @@
+-- ════════════════════════════════════════════════════════════════
+-- 20260511000000_user_created_listing_indexes.sql
+-- Composite (user_id, created_at DESC) indexes for per-user lists.
+--
+-- The list endpoints for profiles, jobs, gap reports, roadmaps,
+-- documents, exports and evidence all run
+--   WHERE user_id = $1 [AND created_at < $cursor]
+--   ORDER BY created_at DESC LIMIT n
+-- With only idx_<table>_user_id, Postgres fetches every row the
+-- user owns and sorts them before applying the LIMIT. A composite
+-- index returns rows already in order, so the sort disappears and
+-- cursor pages become a bounded range scan.
+--
+-- The composite index leads with user_id, so it also serves the
+-- plain user_id lookups and ON DELETE CASCADE scans the old
+-- single-column index handled. That index is dropped to avoid
+-- maintaining both on every insert.
+--
+-- Not CONCURRENTLY: Supabase runs each migration in a transaction.
+-- Idempotent: IF [NOT] EXISTS on every statement.
+-- ════════════════════════════════════════════════════════════════
+
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS idx_profiles_user_created
+    ON public.profiles (user_id, created_at DESC);
+DROP INDEX IF EXISTS public.idx_profiles_user_id;
+
+CREATE INDEX IF NOT EXISTS idx_job_descriptions_user_created
+    ON public.job_descriptions (user_id, created_at DESC);
+DROP INDEX IF EXISTS public.idx_job_descriptions_user_id;
+
+CREATE INDEX IF NOT EXISTS idx_gap_reports_user_created
+    ON public.gap_reports (user_id, created_at DESC);
+DROP INDEX IF EXISTS public.idx_gap_reports_user_id;
+
+CREATE INDEX IF NOT EXISTS idx_roadmaps_user_created
+    ON public.roadmaps (user_id, created_at DESC);
+DROP INDEX IF EXISTS public.idx_roadmaps_user_id;
+
+CREATE INDEX IF NOT EXISTS idx_documents_user_created
+    ON public.documents (user_id, created_at DESC);
+DROP INDEX IF EXISTS public.idx_documents_user_id;
+
+CREATE INDEX IF NOT EXISTS idx_exports_user_created
+    ON public.exports (user_id, created_at DESC);
+DROP INDEX IF EXISTS public.idx_exports_user_id;
+
+CREATE INDEX IF NOT EXISTS idx_evidence_user_created
+    ON public.evidence (user_id, created_at DESC);
+DROP INDEX IF EXISTS public.idx_evidence_user_id;
+
+COMMIT;
@@ -0,0 +1,33 @@
+-- ════════════════════════════════════════════════════════════════
+-- 20260512000000_skills_usage_updated_at_triggers.sql
+-- Server-side updated_at for the skills, knowledge and usage tables.
+--
+-- The knowledge-library, global-skills and usage-guard services write
+-- these tables through the raw supabase client and stamp every
+-- update/upsert with "updated_at": "now()". Those tables were created
+-- without the shared update_updated_at_column() trigger, so the
+-- timestamp had to ride along as an extra string bind on each write.
+--
+-- Attaching the trigger stamps updated_at in Postgres (including the
+-- DO UPDATE branch of an upsert), so the services drop the field.
+-- Idempotent: skips tables that already carry set_updated_at.
+-- ════════════════════════════════════════════════════════════════
+
+BEGIN;
+
+DO $$
+DECLARE t TEXT;
+BEGIN
+    FOR t IN SELECT unnest(ARRAY[
+        'user_knowledge_progress', 'user_skills', 'user_skill_gaps',
+        'user_learning_goals', 'ai_generation_usage_daily', 'ai_platform_spend_daily'
+    ]) LOOP
+        IF NOT EXISTS (
+            SELECT 1 FROM pg_trigger WHERE tgname = 'set_updated_at' AND tgrelid = ('public.' || t)::regclass
+        ) THEN
+            EXECUTE format('CREATE TRIGGER set_updated_at BEFORE UPDATE ON public.%I FOR EACH ROW EXECUTE FUNCTION public.update_updated_at_column()', t);
+        END IF;
+    END LOOP;
+END $$;
+
+COMMIT;
@@ -0,0 +1,43 @@
+-- ════════════════════════════════════════════════════════════════
+-- 20260513000000_gap_report_summary_columns.sql
+-- Materialized summary fields on gap_reports.
+--
+-- GET /gaps/{id}/summary and the gap-report list derived top_gaps,
+-- top_strengths and readiness_level from the skill_gaps, strengths
+-- and summary JSONB blobs on every read. summary holds the full
+-- analyzer output, so each list row pulled several KB of TOASTed
+-- JSON just to show three skill names.
+--
+-- GapService.analyze_gaps now writes these fields as plain columns.
+-- Reads project them instead of the blobs. Existing rows are
+-- backfilled from the JSONB with the same rules the service used.
+-- Idempotent: ADD COLUMN IF NOT EXISTS; backfill only touches rows
+-- that are still NULL.
+-- ════════════════════════════════════════════════════════════════
+
+BEGIN;
+
+ALTER TABLE public.gap_reports
+    ADD COLUMN IF NOT EXISTS top_gaps TEXT[],
+    ADD COLUMN IF NOT EXISTS top_strengths TEXT[],
+    ADD COLUMN IF NOT EXISTS readiness_level VARCHAR(50);
+
+UPDATE public.gap_reports SET
+    top_gaps = ARRAY(
+        SELECT COALESCE(g->>'skill', g->>'area', '')
+        FROM jsonb_array_elements(
+            CASE WHEN jsonb_typeof(skill_gaps) = 'array' THEN skill_gaps ELSE '[]'::jsonb END
+        ) WITH ORDINALITY AS t(g, n)
+        WHERE n <= 3 ORDER BY n
+    ),
+    top_strengths = ARRAY(
+        SELECT COALESCE(s->>'area', '')
+        FROM jsonb_array_elements(
+            CASE WHEN jsonb_typeof(strengths) = 'array' THEN strengths ELSE '[]'::jsonb END
+        ) WITH ORDINALITY AS t(s, n)
+        WHERE n <= 3 ORDER BY n
+    ),
+    readiness_level = COALESCE(summary->>'readiness_level', 'needs-work')
+WHERE top_gaps IS NULL;
+
+COMMIT;
@@ -0,0 +1,39 @@
+-- ════════════════════════════════════════════════════════════════
+-- 20260514000000_dashboard_counts_function.sql
+-- One-statement counts for the analytics dashboard.
+--
+-- AnalyticsService.get_dashboard fetched up to 100-200 full rows from
+-- eight tables just to len() them. That meant eight PostgREST round
+-- trips, and each one parsed and planned its own SELECT. The function
+-- below returns every count in one row from a single statement of
+-- scalar subqueries. Each subquery is an index-only count on the
+-- table's user_id index.
+--
+-- SECURITY INVOKER (the default): called with a user's JWT, RLS still
+-- limits every count to that user's own rows.
+-- ════════════════════════════════════════════════════════════════
+
+BEGIN;
+
+CREATE OR REPLACE FUNCTION public.dashboard_counts(p_user_id uuid)
+RETURNS jsonb
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT jsonb_build_object(
+        'applications',       (SELECT count(*) FROM public.applications WHERE user_id = p_user_id),
+        'active_applications',(SELECT count(*) FROM public.applications
+                               WHERE user_id = p_user_id AND status IS DISTINCT FROM 'archived'),
+        'profiles',           (SELECT count(*) FROM public.profiles WHERE user_id = p_user_id),
+        'jobs',               (SELECT count(*) FROM public.job_descriptions WHERE user_id = p_user_id),
+        'evidence',           (SELECT count(*) FROM public.evidence WHERE user_id = p_user_id),
+        'tasks',              (SELECT count(*) FROM public.tasks WHERE user_id = p_user_id),
+        'completed_tasks',    (SELECT count(*) FROM public.tasks
+                               WHERE user_id = p_user_id AND status IN ('done', 'skipped')),
+        'ats_scans',          (SELECT count(*) FROM public.ats_scans WHERE user_id = p_user_id),
+        'salary_analyses',    (SELECT count(*) FROM public.salary_analyses WHERE user_id = p_user_id),
+        'interview_sessions', (SELECT count(*) FROM public.interview_sessions WHERE user_id = p_user_id)
+    );
+$$;
+
+COMMIT;
@@ -0,0 +1,44 @@
+-- ════════════════════════════════════════════════════════════════
+-- 20260515000000_dashboard_latest_score.sql
+-- Latest application score in dashboard_counts.
+--
+-- get_dashboard still fetched up to 100 applications (scores +
+-- updated_at) and sorted them in Python to find the most recently
+-- updated one with a non-zero overall score. The function now returns
+-- that value too, using ORDER BY updated_at DESC LIMIT 1. The
+-- dashboard becomes a single round-trip that returns one row.
+--
+-- Falsy overall scores (null, 0, false, "") are skipped, matching the
+-- Python truthiness check this replaces.
+-- ════════════════════════════════════════════════════════════════
+
+BEGIN;
+
+CREATE OR REPLACE FUNCTION public.dashboard_counts(p_user_id uuid)
+RETURNS jsonb
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT jsonb_build_object(
+        'applications',       (SELECT count(*) FROM public.applications WHERE user_id = p_user_id),
+        'active_applications',(SELECT count(*) FROM public.applications
+                               WHERE user_id = p_user_id AND status IS DISTINCT FROM 'archived'),
+        'profiles',           (SELECT count(*) FROM public.profiles WHERE user_id = p_user_id),
+        'jobs',               (SELECT count(*) FROM public.job_descriptions WHERE user_id = p_user_id),
+        'evidence',           (SELECT count(*) FROM public.evidence WHERE user_id = p_user_id),
+        'tasks',              (SELECT count(*) FROM public.tasks WHERE user_id = p_user_id),
+        'completed_tasks',    (SELECT count(*) FROM public.tasks
+                               WHERE user_id = p_user_id AND status IN ('done', 'skipped')),
+        'ats_scans',          (SELECT count(*) FROM public.ats_scans WHERE user_id = p_user_id),
+        'salary_analyses',    (SELECT count(*) FROM public.salary_analyses WHERE user_id = p_user_id),
+        'interview_sessions', (SELECT count(*) FROM public.interview_sessions WHERE user_id = p_user_id),
+        'latest_score',       (SELECT scores->'overall' FROM public.applications
+                               WHERE user_id = p_user_id
+                                 AND COALESCE(scores->'overall', 'null'::jsonb)
+                                     NOT IN ('null'::jsonb, '0'::jsonb, 'false'::jsonb, '""'::jsonb)
+                               ORDER BY updated_at DESC NULLS LAST
+                               LIMIT 1)
+    );
+$$;
+
+COMMIT;
@@ -0,0 +1,40 @@
+-- ════════════════════════════════════════════════════════════════
+-- 20260516000000_application_score_progress.sql
+-- Server-side score aggregation for the progress endpoint.
+--
+-- AnalyticsService.get_progress loaded every application row the user
+-- owned (select *, including the modules/scores JSONB) just to compute
+-- count, average, max, and the first and last overall scores in Python.
+-- This function returns those six values in one row. Only the
+-- aggregates cross the wire, however many applications the user has.
+--
+-- first/latest follow created_at order, matching the old ascending
+-- scan. Rows without an overall score are counted in total but not
+-- in the score aggregates.
+-- ════════════════════════════════════════════════════════════════
+
+BEGIN;
+
+CREATE OR REPLACE FUNCTION public.application_score_progress(p_user_id uuid)
+RETURNS jsonb
+LANGUAGE sql
+STABLE
+AS $$
+    WITH s AS (
+        SELECT (scores->>'overall')::numeric AS overall, created_at
+        FROM public.applications
+        WHERE user_id = p_user_id
+    )
+    SELECT jsonb_build_object(
+        'total',   (SELECT count(*) FROM s),
+        'scored',  (SELECT count(overall) FROM s),
+        'average', (SELECT avg(overall) FROM s),
+        'best',    (SELECT max(overall) FROM s),
+        'first',   (SELECT overall FROM s WHERE overall IS NOT NULL
+                    ORDER BY created_at ASC NULLS LAST LIMIT 1),
+        'latest',  (SELECT overall FROM s WHERE overall IS NOT NULL
+                    ORDER BY created_at DESC NULLS FIRST LIMIT 1)
+    );
+$$;
+
+COMMIT;